@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Shared Script Loader
+
+Imports the scripts in this directory for the tests and benchmarks. The scripts
+have hyphenated file names (e.g. dl_nist-pdfs.py) and cannot be imported with a
+plain import statement, so they are loaded by path.
+
+Usage:
+    from _loader import load_script
+
+    nist = load_script('dl_nist-pdfs.py')
+
+Dependencies:
+    None (standard library only)
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
+
+def load_script(filename):
+    """Import a script from the scripts directory by file name and return the module."""
+    module_name = Path(filename).stem.replace('-', '_')
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+
+    spec = importlib.util.spec_from_file_location(module_name, SCRIPTS_DIR / filename)
+    module = importlib.util.module_from_spec(spec)
+    # Register the module so worker processes can unpickle its functions and classes
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
@@ -7,12 +7,26 @@ Dependencies:
     pip install PyYAML
 
 For each file in the '_mitigations' and '_risks' directories, the script:
-1. Reads the external risk titles from YAML files in docs/_data/
-2. Reads the risk titles from files in the '_risks' directory
-3. Reads the mitigation titles from files in the '_mitigations' directory
-4. Creates mappings of IDs to their titles
-5. Updates the YAML front matter by adding the corresponding titles as comments
-6. Preserves the rest of the file content and structure
+1. Parses the front matter of every file in the '_risks' and '_mitigations' directories once
+2. Creates mappings of IDs to their titles from the parsed front matter
+3. Reads the external reference titles from the catalogues in docs/_data/references/
+   that some front matter cites
+4. Updates the YAML front matter by adding the corresponding titles as comments
+5. Preserves the rest of the file content and structure
+6. Writes a file (atomically) only if its content changes
+
+With --check, nothing is written; the script lists the files whose annotations are
+out of date and exits non-zero if there are any.
+
+Runs are incremental. The title maps and the IDs each file cites are cached in
+scripts/.annotate_cache.json; files whose size and modification time match the cache
+are not parsed, and only files that changed or cite an ID whose title changed are
+re-annotated. --full ignores the cache. --watch keeps running, polling the files for
+changes and re-annotating as they are edited.
+
+Parsing and rewriting are spread over a process pool (one worker per CPU by default,
+see --workers) once there are enough files to share. Output is printed in file order
+whatever the number of workers.
 
 Mitigation files (mi-*.md):
 - Updates 'mitigates' section with risk titles
@@ -20,7 +34,12 @@ Mitigation files (mi-*.md):
 
 Risk files (ri-*.md):
 - Updates 'related_risks' section with risk titles
-- Updates reference sections (eu-ai-act_references, ffiec-itbooklets_references, ffiec-itbooklets_v2_references, iso-42001_references, nist-ai-600-1_references, nist-sp-800-53r5_references, owasp-llm_references, owasp-ml_references) with reference titles from docs/_data/*.yml
+- Updates reference sections ('<type>_references', e.g. eu-ai-act_references or owasp-llm_references)
+  with the titles of the entries in docs/_data/references/<type>.yml
+
+Reference catalogues are discovered from docs/_data/references/ and only parsed if their
+'<type>_references' section appears in some front matter (and, on incremental runs, if the
+catalogue changed since the cached run).
 
 Example:
     Original YAML:
@@ -40,80 +59,278 @@ Example:
           - mi-9  # Alerting DoW Spend Alert
 """
 
+import argparse
+import contextlib
+import hashlib
+import io
+import json
 import os
 import re
+import sys
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 import yaml
 
 # Base directory for all relative paths
 SCRIPT_DIR = Path(__file__).parent
+DOCS_DIR = SCRIPT_DIR / '..' / 'docs'
+
+# Title maps and per-file citations from the previous run
+CACHE_FILE = SCRIPT_DIR / '.annotate_cache.json'
+CACHE_VERSION = 2
+
+# Seconds between checks for changed files in --watch mode
+WATCH_INTERVAL = 1.0
+
+# Fewer files than this are processed in this process; a pool would cost more than it saves
+MIN_PARALLEL_FILES = 200
 
-# Reference types that correspond to YAML files in docs/_data/
-REFERENCE_TYPES = [
-    'eu-ai-act',
-    'ffiec-itbooklets',
-    'ffiec-itbooklets_v2',
-    'iso-42001',
-    'nist-ai-600-1',
-    'nist-sp-800-53r5',
-    'owasp-llm',
-    'owasp-ml'
+# Reference catalogues: docs/_data/references/<type>.yml, cited by '<type>_references' sections
+REFERENCES_DIR = DOCS_DIR / '_data' / 'references'
+
+# Sections annotated with risk or mitigation titles; '<type>_references' sections use that catalogue
+ANNOTATED_SECTIONS = {
+    'mitigates': 'risks',
+    'related_mitigations': 'mitigations',
+    'related_risks': 'risks'
+}
+
+# File kinds: (name, directory, file prefix, ID prefix)
+FILE_KINDS = [
+    ('risk', '_risks', 'ri', 'ri'),
+    ('mitigation', '_mitigations', 'mi', 'mi')
 ]
 
-def read_yaml_header(file_path):
-    """Read YAML front matter from a markdown file."""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Check if the file starts with YAML front matter
-    if content.startswith('---'):
-        # Find the second '---' that closes the YAML block
-        parts = content.split('---', 2)
-        if len(parts) >= 3:
-            try:
-                return yaml.safe_load(parts[1])
-            except Exception as e:
-                print(f"Error parsing YAML in {file_path}: {e}")
-                return None
+# Outcomes of updating a file
+CHANGED = 'changed'
+UNCHANGED = 'unchanged'
+FAILED = 'failed'
+
+@dataclass
+class FrontMatter:
+    """A markdown file's parsed YAML front matter and the content it was parsed from."""
+    path: Path
+    data: dict
+    content: str
+    body_offset: int  # Offset of the text following the closing '---'
+    sha256: str  # Hash of the file's bytes on disk
+
+    @property
+    def sequence(self):
+        return self.data.get('sequence')
+
+    @property
+    def title(self):
+        return self.data.get('title')
+
+    @property
+    def sections(self):
+        return list(self.data)
+
+    @property
+    def body(self):
+        return self.content[self.body_offset:]
+
+    @property
+    def citations(self):
+        """IDs listed in each annotatable section."""
+        return {key: [str(item).strip() for item in value]
+                for key, value in self.data.items()
+                if section_mapping(key) and isinstance(value, list)}
+
+def section_mapping(key):
+    """Return the name of the title mapping a section is annotated from, or None."""
+    if key in ANNOTATED_SECTIONS:
+        return ANNOTATED_SECTIONS[key]
+    if key.endswith('_references'):
+        return key
     return None
 
-def get_reference_titles():
-    """Create mappings of reference IDs to their titles from YAML files in docs/_data."""
+def read_front_matter(file_path):
+    """Read and parse the YAML front matter of a markdown file.
+
+    Returns a FrontMatter, or None if the file has no front matter. Raises OSError if
+    the file cannot be read and yaml.YAMLError if its front matter cannot be parsed.
+    """
+    with open(file_path, 'rb') as f:
+        raw = f.read()
+    # Decode with universal newlines, as reading in text mode would
+    content = raw.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+
+    # Check if the file starts with YAML front matter
+    if not content.startswith('---'):
+        return None
+
+    # Find the second '---' that closes the YAML block
+    parts = content.split('---', 2)
+    if len(parts) < 3:
+        return None
+
+    yaml_data = yaml.safe_load(parts[1])
+    if not isinstance(yaml_data, dict) or not yaml_data:
+        return None
+
+    return FrontMatter(file_path, yaml_data, content, len(content) - len(parts[2]),
+                       hashlib.sha256(raw).hexdigest())
+
+def file_record(front_matter, stat):
+    """Summarise a parsed file for the cache: what it defines and what it cites."""
+    return {
+        'mtime_ns': stat.st_mtime_ns,
+        'size': stat.st_size,
+        'sequence': front_matter.sequence,
+        'title': front_matter.title,
+        'citations': front_matter.citations
+    }
+
+def load_directory(directory_name, file_prefix, cached_files=None, workers=1):
+    """Parse the front matter of the matching markdown files in a docs directory once.
+
+    Files whose size and modification time match their cached record are not read.
+    Returns the files parsed, keyed by their path relative to docs/, the records of
+    every file with front matter, and the paths of files that could not be read or parsed.
+    """
+    cached_files = cached_files or {}
+    directory = DOCS_DIR / directory_name
+    index = {}
+    records = {}
+    failed = []
+    to_read = []
+    for file_path in sorted(directory.glob(f'{file_prefix}-*.md')):
+        key = f'{directory_name}/{file_path.name}'
+        try:
+            stat = file_path.stat()
+        except OSError as e:
+            print(f"Error parsing YAML in {file_path}: {e}")
+            failed.append(file_path)
+            continue
+        record = cached_files.get(key)
+        if record and record['mtime_ns'] == stat.st_mtime_ns and record['size'] == stat.st_size:
+            records[key] = record
+        else:
+            to_read.append((key, file_path, stat))
+
+    results = map_in_workers(_read_batch, [file_path for key, file_path, stat in to_read], workers)
+    for (key, file_path, stat), (front_matter, error) in zip(to_read, results):
+        if error:
+            print(error)
+            failed.append(file_path)
+        elif front_matter:
+            index[key] = front_matter
+            records[key] = file_record(front_matter, stat)
+    return index, records, failed
+
+def get_reference_titles(used_sections=None, cache=None):
+    """Create mappings of reference IDs to their titles from the catalogues in docs/_data/references.
+
+    Only catalogues whose '<type>_references' section is in used_sections are read (all
+    of them if it is None). A catalogue whose size and modification time match the cache
+    of the previous run is not parsed again; its titles are taken from the cache.
+    Returns the mappings and the (modification time, size) of each catalogue used.
+    """
+    cache = cache or {}
+    cached_titles = cache.get('titles', {})
+    cached_catalogues = cache.get('catalogues', {})
     reference_mappings = {}
-    data_dir = SCRIPT_DIR / '..' / 'docs' / '_data'
-    
-    for reference_type in REFERENCE_TYPES:
-        yaml_file = data_dir / f'{reference_type}.yml'
-        ref_type = f'{reference_type}_references'
-        
-        if yaml_file.exists():
-            reference_mappings[ref_type] = {}
-            try:
-                with open(yaml_file, 'r', encoding='utf-8') as f:
-                    data = yaml.safe_load(f)
-                    
-                if data:
-                    for ref_id, ref_info in data.items():
-                        if isinstance(ref_info, dict) and 'title' in ref_info:
-                            reference_mappings[ref_type][ref_id] = ref_info['title']
-            except Exception as e:
-                print(f"Error reading from {yaml_file.name}: {e}")
-    
-    return reference_mappings
+    catalogues = {}
+
+    for yaml_file in sorted(REFERENCES_DIR.glob('*.yml')):
+        ref_type = f'{yaml_file.stem}_references'
+        if used_sections is not None and ref_type not in used_sections:
+            continue
+
+        try:
+            stat = yaml_file.stat()
+            signature = [stat.st_mtime_ns, stat.st_size]
+            if cached_catalogues.get(ref_type) == signature and ref_type in cached_titles:
+                reference_mappings[ref_type] = cached_titles[ref_type]
+                catalogues[ref_type] = signature
+                continue
+
+            with open(yaml_file, 'r', encoding='utf-8') as f:
+                data = yaml.safe_load(f)
+        except Exception as e:
+            print(f"Error reading from {yaml_file.name}: {e}")
+            continue
+
+        reference_mappings[ref_type] = {}
+        entries = data.get('entries') if isinstance(data, dict) else None
+        if isinstance(entries, dict):
+            for ref_id, ref_info in entries.items():
+                if isinstance(ref_info, dict) and 'title' in ref_info:
+                    reference_mappings[ref_type][str(ref_id)] = ref_info['title']
+        catalogues[ref_type] = signature
+
+    return reference_mappings, catalogues
 
-def get_titles_from_directory(directory_name, file_prefix, id_prefix):
-    """Create a mapping of IDs to their titles from markdown files in a directory."""
+def get_titles(records, id_prefix):
+    """Create a mapping of IDs to their titles from file records."""
     titles = {}
-    directory = SCRIPT_DIR / '..' / 'docs' / directory_name
-    
-    for file_path in directory.glob(f'{file_prefix}-*.md'):
-        yaml_data = read_yaml_header(file_path)
-        if yaml_data and 'title' in yaml_data and 'sequence' in yaml_data:
-            item_id = f"{id_prefix}-{yaml_data['sequence']}"
-            titles[item_id] = yaml_data['title']
-    
+    for record in records.values():
+        if record['title'] is not None and record['sequence'] is not None:
+            titles[f"{id_prefix}-{record['sequence']}"] = record['title']
     return titles
 
+def read_cache(cache_file=CACHE_FILE):
+    """Return the cache of the previous run, or an empty one if it is missing or unusable."""
+    try:
+        data = json.loads(cache_file.read_text(encoding='utf-8'))
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        print(f"Ignoring unreadable cache {cache_file}: {e}")
+        return {}
+    if not isinstance(data, dict) or data.get('version') != CACHE_VERSION:
+        return {}
+    titles, files, catalogues = data.get('titles'), data.get('files'), data.get('catalogues')
+    if not (isinstance(titles, dict) and all(isinstance(mapping, dict) for mapping in titles.values())
+            and isinstance(files, dict) and isinstance(catalogues, dict)):
+        print(f"Ignoring malformed cache {cache_file}")
+        return {}
+    # A malformed file record only means that file is read again
+    data['files'] = {key: record for key, record in files.items() if is_file_record(record)}
+    return data
+
+def is_file_record(record):
+    """Check that a cached file record has the shape file_record gives it."""
+    return (isinstance(record, dict)
+            and all(type(record.get(name)) is int for name in ('mtime_ns', 'size'))
+            and isinstance(record.get('citations'), dict)
+            and all(isinstance(item_ids, list) and all(isinstance(item_id, str) for item_id in item_ids)
+                    for item_ids in record['citations'].values())
+            and {'sequence', 'title'} <= record.keys())
+
+def write_cache(titles, records, catalogues, cache_file=CACHE_FILE):
+    """Atomically write the title maps, file records and catalogue signatures for the next run."""
+    tmp_file = cache_file.with_name(f"{cache_file.name}.tmp")
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump({'version': CACHE_VERSION, 'titles': titles, 'files': records, 'catalogues': catalogues},
+                  f, default=str)
+    os.replace(tmp_file, cache_file)
+
+def build_dependents(records):
+    """Build the reverse-dependency graph: (title mapping, ID) -> files citing that ID."""
+    dependents = defaultdict(set)
+    for key, record in records.items():
+        for section, item_ids in record['citations'].items():
+            for item_id in item_ids:
+                dependents[(section_mapping(section), item_id)].add(key)
+    return dependents
+
+def changed_ids(old_titles, new_titles):
+    """Return the IDs whose title was added, removed or changed, by title mapping."""
+    changed = {}
+    for name in set(old_titles) | set(new_titles):
+        old = old_titles.get(name, {})
+        new = new_titles.get(name, {})
+        ids = {item_id for item_id in set(old) | set(new) if old.get(item_id) != new.get(item_id)}
+        if ids:
+            changed[name] = ids
+    return changed
+
 def process_annotated_section(section_key, items, title_mapping):
     """Process a YAML section by adding title comments to items."""
     if not items:
@@ -143,81 +360,181 @@ def format_regular_section(key, value):
     else:
         return [f'{key}: {value}']
 
-def update_file_yaml(file_path, title_mappings):
-    """Update relevant sections of a risk or mitigation file with titles as comments."""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+def annotate_front_matter(front_matter, title_mappings):
+    """Return the file content with title comments added to the annotated sections.
 
-    # Check if file has YAML front matter
-    if not content.startswith('---'):
-        return False
-        
-    parts = content.split('---', 2)
-    if len(parts) < 3:
-        return False
+    Returns None if the front matter has none of the sections to annotate.
+    """
+    # Define which sections to annotate and their corresponding title mappings
+    annotated_sections = {key: title_mappings[name] for key, name in ANNOTATED_SECTIONS.items()}
+
+    # Add all reference sections dynamically
+    for key in title_mappings:
+        if key.endswith('_references'):
+            annotated_sections[key] = title_mappings[key]
 
+    # Check if file has any sections we need to update
+    if not any(key in annotated_sections for key in front_matter.sections):
+        return None
+
+    # Build new YAML content
+    yaml_lines = []
+    for key, value in front_matter.data.items():
+        if key in annotated_sections:
+            yaml_lines.extend(process_annotated_section(key, value, annotated_sections[key]))
+        else:
+            yaml_lines.extend(format_regular_section(key, value))
+
+    # Reconstruct the file content
+    updated_yaml = '\n'.join(yaml_lines)
+    return f"---\n{updated_yaml}\n---{front_matter.body}"
+
+def write_file_atomically(file_path, content):
+    """Replace a file's content via a temporary file, so readers never see a partial write."""
+    tmp_file = file_path.with_name(f"{file_path.name}.tmp")
     try:
-        yaml_data = yaml.safe_load(parts[1])
-        if not yaml_data:
-            return False
-        
-        # Define which sections to annotate and their corresponding title mappings
-        annotated_sections = {
-            'mitigates': title_mappings['risks'],
-            'related_mitigations': title_mappings['mitigations'],
-            'related_risks': title_mappings['risks']
-        }
-        
-        # Add all reference sections dynamically
-        for key in title_mappings:
-            if key.endswith('_references'):
-                annotated_sections[key] = title_mappings[key]
-        
-        # Check if file has any sections we need to update
-        sections_to_update = [key for key in annotated_sections if key in yaml_data]
-        if not sections_to_update:
-            return False
-        
-        # Build new YAML content
-        yaml_lines = []
-        for key, value in yaml_data.items():
-            if key in annotated_sections:
-                yaml_lines.extend(process_annotated_section(key, value, annotated_sections[key]))
-            else:
-                yaml_lines.extend(format_regular_section(key, value))
-        
-        # Reconstruct the file content
-        updated_yaml = '\n'.join(yaml_lines)
-        updated_content = f"---\n{updated_yaml}\n---{parts[2]}"
-        
-        # Write back to the file
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(updated_content)
-            
-        return True
-            
+        with open(tmp_file, 'wb') as f:
+            f.write(content)
+        os.replace(tmp_file, file_path)
+    except OSError:
+        tmp_file.unlink(missing_ok=True)
+        raise
+
+def update_front_matter(front_matter, title_mappings, check=False):
+    """Update relevant sections of an already parsed risk or mitigation file with titles as comments.
+
+    The file is only written if its content changes, and never in check mode.
+    Returns CHANGED, UNCHANGED or FAILED.
+    """
+    try:
+        updated_content = annotate_front_matter(front_matter, title_mappings)
+        if updated_content is None:
+            return UNCHANGED
+
+        # Leave files whose content would not change untouched, keeping their mtimes
+        updated_bytes = updated_content.encode('utf-8')
+        if hashlib.sha256(updated_bytes).hexdigest() == front_matter.sha256:
+            return UNCHANGED
+
+        if not check:
+            write_file_atomically(front_matter.path, updated_bytes)
+        return CHANGED
+
     except Exception as e:
-        print(f"Error processing {file_path}: {e}")
+        print(f"Error processing {front_matter.path}: {e}")
+        return FAILED
+
+def update_file_yaml(file_path, title_mappings, check=False):
+    """Update relevant sections of a risk or mitigation file with titles as comments.
+
+    Returns True if the file was changed (in check mode: would be changed), and
+    False if it was already up to date or could not be processed, which is
+    printed. Use update_front_matter to tell those two apart.
+    """
+    try:
+        front_matter = read_front_matter(file_path)
+    except (OSError, UnicodeDecodeError, yaml.YAMLError) as e:
+        print(f"Error parsing YAML in {file_path}: {e}")
         return False
+    if not front_matter:
+        return False
+    return update_front_matter(front_matter, title_mappings, check) == CHANGED
 
-def process_files_in_directory(directory_name, file_prefix, title_mappings):
-    """Process all files in a directory that match the given prefix."""
-    directory = SCRIPT_DIR / '..' / 'docs' / directory_name
-    updated_count = 0
-    
-    for file_path in directory.glob(f'{file_prefix}-*.md'):
-        if update_file_yaml(file_path, title_mappings):
-            updated_count += 1
-            print(f"Updated {file_path.name}")
-    
-    return updated_count
+# Set in each worker process by _init_update_worker, so the title mappings are sent once per worker
+_worker_title_mappings = None
+_worker_check = False
+
+def _init_update_worker(title_mappings, check):
+    global _worker_title_mappings, _worker_check
+    _worker_title_mappings = title_mappings
+    _worker_check = check
+
+def _update_batch(batch):
+    """Update a batch of (key, parsed file) pairs, returning each outcome with the output it printed."""
+    results = []
+    for key, front_matter in batch:
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            outcome = update_front_matter(front_matter, _worker_title_mappings, _worker_check)
+        results.append((outcome, output.getvalue()))
+    return results
+
+def _read_batch(paths):
+    """Read a batch of files, returning each FrontMatter (or None) with an error message (or None)."""
+    results = []
+    for file_path in paths:
+        try:
+            results.append((read_front_matter(file_path), None))
+        except (OSError, UnicodeDecodeError, yaml.YAMLError) as e:
+            results.append((None, f"Error parsing YAML in {file_path}: {e}"))
+    return results
+
+def map_in_workers(batch_function, items, workers, initializer=None, initargs=()):
+    """Apply a batch function to items in a process pool, returning its results in item order.
+
+    Runs in this process when there is one worker or fewer than MIN_PARALLEL_FILES items.
+    """
+    if workers <= 1 or len(items) < MIN_PARALLEL_FILES:
+        if initializer:
+            initializer(*initargs)
+        return batch_function(items)
+
+    workers = min(workers, len(items))
+    # A few batches per worker keeps the pool balanced without per-file overhead
+    batch_size = max(1, len(items) // (workers * 4))
+    batches = [items[i:i + batch_size] for i in range(0, len(items), batch_size)]
+    results = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=initializer, initargs=initargs) as executor:
+        for batch_results in executor.map(batch_function, batches):
+            results.extend(batch_results)
+    return results
+
+def process_files(index, title_mappings, check=False, workers=1):
+    """Process parsed files in order and return the outcome for each, by key."""
+    outcomes = {}
+
+    items = list(index.items())
+    results = map_in_workers(_update_batch, items, workers, _init_update_worker, (title_mappings, check))
+    for (key, front_matter), (outcome, output) in zip(items, results):
+        print(output, end='')
+        outcomes[key] = outcome
+        if outcome == CHANGED:
+            print(f"{'Would update' if check else 'Updated'} {front_matter.path.name}")
+
+    return outcomes
+
+def print_counts(kind, counts, check=False):
+    """Print how many files of a kind were changed, unchanged or failed."""
+    changed = 'need updating' if check else 'updated'
+    print(f"{kind.capitalize()} files: {counts[CHANGED]} {changed}, "
+          f"{counts[UNCHANGED]} unchanged, {counts[FAILED]} failed")
+
+def annotate(check=False, full=False, cache_file=CACHE_FILE, workers=None):
+    """Run one annotation pass, re-annotating only what changed since the cached run.
+
+    Files are parsed and rewritten by `workers` processes (default: one per CPU).
+    Returns the outcome counts for each file kind.
+    """
+    workers = workers or os.cpu_count() or 1
+    cache = {} if full else read_cache(cache_file)
+    cached_files = cache.get('files', {})
+
+    # Parse each changed risk and mitigation file once; titles and rewrites both use this index
+    index = {}
+    records = {}
+    failed = {}
+    title_mappings = {}
+    for kind, directory_name, file_prefix, id_prefix in FILE_KINDS:
+        kind_index, kind_records, failed[kind] = load_directory(directory_name, file_prefix, cached_files, workers)
+        index.update(kind_index)
+        records.update(kind_records)
+        title_mappings[f'{kind}s'] = get_titles(kind_records, id_prefix)
+
+    # Only read the reference catalogues some file cites
+    used_sections = {section for record in records.values() for section in record['citations']
+                     if section.endswith('_references')}
+    reference_mappings, catalogues = get_reference_titles(used_sections, cache)
 
-def main():
-    # Get mappings of IDs to titles (references → risks → mitigations)
-    reference_mappings = get_reference_titles()
-    risk_titles = get_titles_from_directory('_risks', 'ri', 'ri')
-    mitigation_titles = get_titles_from_directory('_mitigations', 'mi', 'mi')
-    
     # Print counts for each reference type
     total_references = 0
     for ref_type, mapping in reference_mappings.items():
@@ -225,24 +542,129 @@ def main():
         total_references += count
         print(f"Found {count} {ref_type.replace('_', ' ')}")
     
-    print(f"Found {len(risk_titles)} risk titles")
-    print(f"Found {len(mitigation_titles)} mitigation titles")
-    
-    # Create consolidated title mappings
-    title_mappings = {
-        'risks': risk_titles,
-        'mitigations': mitigation_titles
-    }
+    print(f"Found {len(title_mappings['risks'])} risk titles")
+    print(f"Found {len(title_mappings['mitigations'])} mitigation titles")
     
     # Add reference mappings
     title_mappings.update(reference_mappings)
-    
-    # Process all files (risks → mitigations)
-    risk_updated_count = process_files_in_directory('_risks', 'ri', title_mappings)
-    mitigation_updated_count = process_files_in_directory('_mitigations', 'mi', title_mappings)
-    
-    print(f"\nUpdated {risk_updated_count} risk files")
-    print(f"Updated {mitigation_updated_count} mitigation files")
+
+    # Compare titles as the cache stores them, so JSON's string keys never look like changes
+    titles = json.loads(json.dumps(title_mappings, default=str))
+
+    # Re-annotate changed files and the files citing an ID whose title changed
+    if 'titles' in cache:
+        dependents = build_dependents(records)
+        stale = set(index)
+        for name, item_ids in changed_ids(cache['titles'], titles).items():
+            for item_id in item_ids:
+                stale.update(dependents.get((name, item_id), ()))
+        print(f"Re-annotating {len(stale)} of {len(records)} files")
+    else:
+        stale = set(records)
+
+    counts = {}
+    for kind, directory_name, file_prefix, id_prefix in FILE_KINDS:
+        kind_counts = Counter()
+        kind_stale = sorted(key for key in stale if key.startswith(f'{directory_name}/'))
+
+        # Unchanged files citing a changed title have not been read yet
+        to_read = [key for key in kind_stale if key not in index]
+        results = map_in_workers(_read_batch, [DOCS_DIR / key for key in to_read], workers)
+        for key, (front_matter, error) in zip(to_read, results):
+            if error:
+                print(error)
+            if front_matter:
+                index[key] = front_matter
+            else:
+                records.pop(key)
+                kind_counts[FAILED] += 1
+
+        kind_index = {key: index[key] for key in kind_stale if key in index}
+        outcomes = process_files(kind_index, title_mappings, check, workers)
+        for key, outcome in outcomes.items():
+            if outcome == FAILED:
+                records.pop(key)
+            elif outcome == CHANGED and not check:
+                stat = (DOCS_DIR / key).stat()
+                records[key].update(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+
+        kind_counts.update(outcomes.values())
+        kind_counts[UNCHANGED] += sum(1 for key in records if key.startswith(f'{directory_name}/')
+                                      and key not in kind_index)
+        kind_counts[FAILED] += len(failed[kind])
+        counts[kind] = kind_counts
+
+    print()
+    for kind, kind_counts in counts.items():
+        print_counts(kind, kind_counts, check)
+
+    if not check:
+        try:
+            write_cache(titles, records, catalogues, cache_file)
+        except OSError as e:
+            print(f"Could not write cache {cache_file}: {e}")
+
+    return counts
+
+def watched_files():
+    """Return the size and modification time of every file an annotation pass reads."""
+    paths = []
+    for kind, directory_name, file_prefix, id_prefix in FILE_KINDS:
+        paths.extend((DOCS_DIR / directory_name).glob(f'{file_prefix}-*.md'))
+    paths.extend(REFERENCES_DIR.glob('*.yml'))
+
+    signature = {}
+    for path in paths:
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        signature[path] = (stat.st_mtime_ns, stat.st_size)
+    return signature
+
+def watch(full=False, interval=WATCH_INTERVAL, workers=None):
+    """Poll the risk, mitigation and reference files, re-annotating whenever one changes."""
+    print(f"Watching {DOCS_DIR.resolve()} for changes (Ctrl+C to stop)")
+    signature = None
+    try:
+        while True:
+            current = watched_files()
+            if current != signature:
+                # Taken before the pass, so edits made during it trigger another one
+                signature = current
+                annotate(full=full, workers=workers)
+                full = False
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        print()
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Annotate risk and mitigation front matter with the titles of the IDs they reference"
+    )
+    parser.add_argument("--check", action="store_true",
+                        help="Report files whose annotations are out of date without writing them; "
+                             "exit non-zero if any are")
+    parser.add_argument("--full", action="store_true",
+                        help="Ignore the cache of the previous run and re-annotate every file")
+    parser.add_argument("--watch", action="store_true",
+                        help="Keep running, re-annotating files as they change")
+    parser.add_argument("--interval", type=float, default=WATCH_INTERVAL,
+                        help=f"Seconds between checks for changes with --watch (default: {WATCH_INTERVAL})")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Processes parsing and rewriting files (default: one per CPU)")
+    args = parser.parse_args()
+
+    if args.watch:
+        if args.check:
+            parser.error("--check cannot be combined with --watch")
+        watch(args.full, args.interval, args.workers)
+        return
+
+    counts = annotate(args.check, args.full, workers=args.workers)
+    total = sum(counts.values(), Counter())
+    if total[FAILED] or (args.check and total[CHANGED]):
+        sys.exit(1)
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
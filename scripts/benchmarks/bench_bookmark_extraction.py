@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark for BookmarkExtractor page resolution in dl_nist-pdfs.py.
+
+Generates a synthetic PDF with a large outline (10,000 entries over ~490 pages
+by default, roughly the shape of NIST SP 800-53r5) and times bookmark
+extraction with the legacy linear page scan against the page-index lookup.
+
+Dependencies:
+    pip install pypdf pyyaml requests
+
+Usage:
+    python scripts/benchmarks/bench_bookmark_extraction.py
+    python scripts/benchmarks/bench_bookmark_extraction.py --entries 2000 --pages 100
+"""
+
+import argparse
+import io
+import sys
+import time
+
+from pypdf import PdfReader
+
+from common import load_script
+from fixtures import build_synthetic_pdf
+
+
+def make_legacy_extractor(nist):
+    """Return a BookmarkExtractor subclass that resolves pages by scanning reader.pages."""
+
+    class LegacyBookmarkExtractor(nist.BookmarkExtractor):
+        def _extract_bookmark_info(self, outline_item, reader, level):
+            if not hasattr(outline_item, 'title'):
+                return None
+
+            bookmark = nist.BookmarkInfo(title=str(outline_item.title).strip(), level=level)
+            if '/Page' in outline_item:
+                page_ref = outline_item['/Page']
+                if hasattr(page_ref, 'indirect_reference'):
+                    ref = page_ref.indirect_reference
+                    bookmark.obj_num = ref.idnum
+                    bookmark.obj_gen = ref.generation
+                for page_idx, page in enumerate(reader.pages):
+                    if page == page_ref:
+                        bookmark.page = page_idx + 1
+                        break
+            self._extract_coordinates(outline_item, bookmark)
+            return bookmark
+
+    return LegacyBookmarkExtractor
+
+
+def time_extraction(extractor_cls, config, pdf_bytes):
+    """Time a single extract_bookmarks call on a fresh reader."""
+    reader = PdfReader(io.BytesIO(pdf_bytes))
+    extractor = extractor_cls(config)
+    start = time.perf_counter()
+    bookmarks = extractor.extract_bookmarks(reader)
+    return time.perf_counter() - start, bookmarks
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark NIST bookmark page resolution")
+    parser.add_argument('--entries', type=int, default=10000, help='Number of outline entries')
+    parser.add_argument('--pages', type=int, default=490, help='Number of pages')
+    args = parser.parse_args()
+
+    nist = load_script('dl_nist-pdfs.py')
+    config = nist.Config.for_sp_800_53r5()
+
+    print(f"Building synthetic PDF with {args.entries} outline entries over {args.pages} pages...")
+    pdf_bytes = build_synthetic_pdf(args.entries, args.pages)
+
+    legacy_time, legacy_bookmarks = time_extraction(make_legacy_extractor(nist), config, pdf_bytes)
+    indexed_time, indexed_bookmarks = time_extraction(nist.BookmarkExtractor, config, pdf_bytes)
+
+    legacy_pages = [bm.page for bm in legacy_bookmarks]
+    indexed_pages = [bm.page for bm in indexed_bookmarks]
+    if legacy_pages != indexed_pages:
+        print("Error: page numbers differ between legacy scan and page index", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"Linear page scan: {legacy_time:8.3f}s")
+    print(f"Page index:       {indexed_time:8.3f}s")
+    print(f"Speedup:          {legacy_time / indexed_time:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,18 @@
+"""
+Shared helpers for the benchmark scripts.
+
+The reference-ingestion scripts are loaded by path with load_script from
+scripts/_loader.py, which this module puts on the import path.
+"""
+
+import sys
+from pathlib import Path
+
+BENCHMARKS_DIR = Path(__file__).parent
+SCRIPTS_DIR = BENCHMARKS_DIR / ".."
+
+# Scripts import shared modules (e.g. http_client) from their own directory
+if str(SCRIPTS_DIR.resolve()) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR.resolve()))
+
+from _loader import load_script
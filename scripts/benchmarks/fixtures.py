@@ -0,0 +1,233 @@
+"""
+Synthetic fixtures for the reference-ingestion benchmarks.
+
+Every generator is deterministic so that results from different runs and
+machines can be compared. Sizes are chosen to be larger than the real inputs:
+outlines with thousands of bookmarks, FFIEC menus with thousands of links,
+EU AI Act explorer pages with thousands of recitals, and more than a thousand
+risk and mitigation files.
+"""
+
+import io
+from html import escape
+
+import roman
+import yaml
+from pypdf import PdfWriter
+from pypdf.generic import Fit
+
+FFIEC_ABBREVIATIONS = {
+    'architecture-infrastructure-and-operations': 'aio',
+    'audit': 'aud',
+    'business-continuity-management': 'bcm',
+    'development-acquisition-and-maintenance': 'dam',
+    'information-security': 'sec',
+    'management': 'mgt',
+    'outsourcing-technology-services': 'ots',
+    'retail-payment-systems': 'rps',
+    'supervision-of-technology-service-providers': 'tsp',
+    'wholesale-payment-systems': 'wps',
+}
+
+REFERENCE_TYPES = ['eu-ai-act', 'nist-sp-800-53r5', 'owasp-llm']
+
+
+def build_synthetic_pdf(entries, pages, children_per_family=50):
+    """Build an in-memory PDF with `entries` outline items spread over `pages` pages."""
+    writer = PdfWriter()
+    for page_num in range(pages):
+        # Distinct page sizes keep pages from comparing equal to each other
+        writer.add_blank_page(width=612, height=792 + page_num)
+
+    created = 0
+    family = 0
+    while created < entries:
+        family_page = (created * pages) // entries
+        parent = writer.add_outline_item(f"FAMILY {family}", family_page)
+        created += 1
+        for child in range(children_per_family):
+            if created >= entries:
+                break
+            child_page = (created * pages) // entries
+            writer.add_outline_item(
+                f"AC-{child + 1} Control {family}.{child}",
+                child_page,
+                parent=parent,
+                fit=Fit.xyz(88, 700 - child, 0),
+            )
+            created += 1
+        family += 1
+
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+def ffiec_abbreviations(booklets):
+    """Return a booklet name -> abbreviation mapping with `booklets` entries.
+
+    The real FFIEC booklets come first, padded with synthetic ones.
+    """
+    abbreviations = dict(list(FFIEC_ABBREVIATIONS.items())[:booklets])
+    for i in range(len(abbreviations), booklets):
+        abbreviations[f"synthetic-booklet-{i}"] = f"b{i:02d}"
+    return abbreviations
+
+
+def build_ffiec_menu_html(abbreviations, sections_per_booklet):
+    """Build an FFIEC IT booklets page whose menu links to every booklet section.
+
+    Sections are numbered with Roman numerals, which dl_ffiec-itbooklets.py only
+    recognises up to XXXIX, so `sections_per_booklet` must not exceed 39.
+    """
+    items = []
+    for booklet in abbreviations:
+        items.append(f'<li><a href="/it-booklets/{booklet}">{escape(booklet.title())}</a><ul>')
+        items.append(f'<li><a href="/it-booklets/{booklet}/introduction">Introduction</a></li>')
+        for section in range(1, sections_per_booklet + 1):
+            numeral = roman.toRoman(section)
+            items.append(f'<li><a href="/it-booklets/{booklet}/{numeral.lower()}-section-{section}">'
+                         f'{numeral} Section {section}</a></li>')
+        items.append('</ul></li>')
+    return _html_page(f'<ul class="menu-container">{"".join(items)}</ul>'
+                      f'<div class="content">{_paragraphs(200)}</div>')
+
+
+def build_ffiec_booklet_html(paragraphs, menu_links):
+    """Build a booklet section page with navigation menus around the content."""
+    menu = "".join(f'<li><a href="/it-booklets/audit/s{i}">Menu entry {i}</a></li>' for i in range(menu_links))
+    toc = "".join(f'<li><a href="#p{i}">Paragraph {i}</a></li>' for i in range(paragraphs))
+    return _html_page(f'<ul class="menu-container">{menu}</ul>'
+                      f'<ul class="nav-booklet-toc nav-pills text-smaller nobottommargin">{toc}</ul>'
+                      f'<div class="content"><h1>I Governance</h1>{_paragraphs(paragraphs)}</div>')
+
+
+def build_ffiec_content_html(sections, menu_links=200):
+    """Build a booklet page with the content markup the Markdown converters handle.
+
+    Each section has headings, paragraphs with inline markup, nested and ordered
+    lists, and a table.
+    """
+    menu = "".join(f'<li><a href="/it-booklets/audit/s{i}">Menu entry {i}</a></li>' for i in range(menu_links))
+    content = []
+    for i in range(sections):
+        content.append(f'<h2>{roman.toRoman(i + 1)} Section {i}</h2>{_paragraphs(3)}'
+                       f'<h3>{roman.toRoman(i + 1)}.A Examination Procedures</h3>'
+                       f'<ul><li>Objective {i}.1 with <strong>strong</strong> text</li>'
+                       f'<li>Objective {i}.2<ol><li>Step one</li><li>Step two with <code>code</code></li></ol></li></ul>'
+                       f'<table><thead><tr><th>Control</th><th>Reference</th></tr></thead><tbody>'
+                       + "".join(f'<tr><td>Control {i}.{row}</td>'
+                                 f'<td><a href="https://example.org/{i}/{row}">Reference {row}</a></td></tr>'
+                                 for row in range(5))
+                       + '</tbody></table>')
+    return _html_page(f'<ul class="menu-container">{menu}</ul>'
+                      f'<div class="content"><h1>Audit Booklet</h1>{"".join(content)}</div>')
+
+
+def build_eu_ai_act_html(chapters, sections_per_chapter, articles_per_section, annexes, recitals):
+    """Build an EU AI Act explorer page with the markup dl_eu-ai-act.py parses."""
+    base = "https://artificialintelligenceact.eu"
+    toc = []
+    article = 1
+    for chapter in range(1, chapters + 1):
+        numeral = roman.toRoman(chapter)
+        toc.append(f'<p class="parent-title"><a href="{base}/chapter/{chapter}/">'
+                   f'Chapter {numeral}: Chapter Title {chapter}</a></p>')
+        for section in range(1, sections_per_chapter + 1):
+            toc.append(f'<p class="child-chapter"><a href="{base}/section/{chapter}-{section}/">'
+                       f'Section {section}: Section Title {chapter}.{section}</a></p>')
+            for _ in range(articles_per_section):
+                toc.append(f'<p class="child-article"><a href="{base}/article/{article}/">'
+                           f'Article {article}: Article Title {article}</a></p>')
+                article += 1
+
+    annex_links = "".join(f'<p><a href="{base}/annex/{i}/">Annex {roman.toRoman(i)}: Annex Title {i}</a></p>'
+                          for i in range(1, annexes + 1))
+    recital_links = "".join(f'<a href="{base}/recital/{i}/">{i}</a> ' for i in range(1, recitals + 1))
+
+    return _html_page(
+        f'<div class="et_pb_text_inner">{"".join(toc)}</div>'
+        f'<div class="et_pb_text_inner"><p class="parent-title">Annexes</p>{annex_links}</div>'
+        f'<div class="et_pb_text_inner"><h2><a href="#recitals">Recitals</a></h2>{recital_links}</div>'
+        f'<footer><a href="{base}/about/">About</a> <a href="{base}/credits/">Credits</a></footer>'
+    )
+
+
+def write_framework_files(directory, risks, mitigations, references_per_type=200):
+    """Write ri-*.md and mi-*.md files with cross-references into docs-style directories.
+
+    Returns the (risks directory, mitigations directory) paths.
+    """
+    risks_dir = directory / "_risks"
+    mitigations_dir = directory / "_mitigations"
+    risks_dir.mkdir(parents=True, exist_ok=True)
+    mitigations_dir.mkdir(parents=True, exist_ok=True)
+
+    for i in range(1, risks + 1):
+        front_matter = {
+            'sequence': i,
+            'title': f"Risk Title {i}",
+            'layout': 'risk',
+            'doc-status': 'Draft',
+            'type': 'SEC',
+            'related_risks': [f"ri-{(i * 7 + k) % risks + 1}" for k in range(3)],
+        }
+        for ref_type in REFERENCE_TYPES:
+            front_matter[f"{ref_type}_references"] = [
+                f"{ref_type}-{(i * 13 + k) % references_per_type + 1}" for k in range(4)
+            ]
+        _write_markdown(risks_dir / f"ri-{i}_risk-title-{i}.md", front_matter)
+
+    for i in range(1, mitigations + 1):
+        front_matter = {
+            'sequence': i,
+            'title': f"Mitigation Title {i}",
+            'layout': 'mitigation',
+            'doc-status': 'Draft',
+            'type': 'PREV',
+            'mitigates': [f"ri-{(i * 3 + k) % risks + 1}" for k in range(4)],
+            'related_mitigations': [f"mi-{(i * 5 + k) % mitigations + 1}" for k in range(2)],
+            'nist-sp-800-53r5_references': [
+                f"nist-sp-800-53r5-{(i * 11 + k) % references_per_type + 1}" for k in range(5)
+            ],
+        }
+        _write_markdown(mitigations_dir / f"mi-{i}_mitigation-title-{i}.md", front_matter)
+
+    return risks_dir, mitigations_dir
+
+
+def build_reference_yaml(entries):
+    """Build a docs/_data/references-style YAML document with `entries` entries."""
+    data = {
+        'title': "Synthetic Reference",
+        'description': "Synthetic reference catalogue for benchmarks.",
+        'source_url': "https://example.org/reference",
+        'entries': {
+            f"ref-{i}": {
+                'title': f"REF-{i} Synthetic Entry {i}",
+                'url': f"https://example.org/reference#entry-{i}",
+                'description': f"Description of synthetic entry {i}.",
+            }
+            for i in range(1, entries + 1)
+        },
+    }
+    return yaml.dump(data, default_flow_style=False, sort_keys=False)
+
+
+def _write_markdown(path, front_matter):
+    """Write a Markdown file with YAML front matter and a short body."""
+    header = yaml.dump(front_matter, default_flow_style=False, sort_keys=False)
+    body = "## Summary\n\n" + "Lorem ipsum dolor sit amet. " * 40 + "\n"
+    path.write_text(f"---\n{header}---\n{body}", encoding='utf-8')
+
+
+def _paragraphs(count):
+    """Return `count` paragraphs of filler content with a little inline markup."""
+    return "".join(f'<p id="p{i}">Paragraph {i} with <em>emphasis</em> and '
+                   f'<a href="https://example.org/{i}">a link</a>. {"Filler text. " * 20}</p>'
+                   for i in range(count))
+
+
+def _html_page(body):
+    """Wrap body markup in a minimal HTML document."""
+    return f'<!DOCTYPE html><html><head><title>Fixture</title></head><body>{body}</body></html>'
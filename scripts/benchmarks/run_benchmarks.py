@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+Benchmark Suite for the Reference-Ingestion Scripts
+
+Times each processing stage of the dl_*.py scripts and annotate_yaml_front_matter.py
+on generated fixtures (see fixtures.py) and writes the results as JSON so that runs
+can be compared over time. No network access is needed. With --memory, each stage
+is also run once under tracemalloc to record its peak Python memory use.
+
+The eu_ai_act stages use the cached explorer page written by dl_eu-ai-act.py when
+it exists, and a generated page otherwise.
+
+Stages:
+    nist.extract_bookmarks            BookmarkExtractor on a PDF with a large outline
+    nist.filter_by_section            BookmarkFilter over the extracted bookmarks
+    ffiec.parse_booklets_page         FFIEC IT booklets menu parsing
+    ffiec.filter_booklet_html         Navigation removal from a booklet page
+    ffiec.convert_python              In-process Markdown conversion of filtered pages
+    ffiec.convert_pandoc              One pandoc process per page (skipped without pandoc)
+    eu_ai_act.parse_html              Full html.parser tree of the explorer page (baseline)
+    eu_ai_act.parse_explorer_page     Single streaming pass extracting chapters, annexes, recitals
+    annotate.update_file_yaml         Front matter annotation of ri/mi files
+    references.validate_file          Schema validation of a large reference file
+
+Dependencies:
+    pip install -r scripts/requirements.txt
+
+Usage:
+    python scripts/benchmarks/run_benchmarks.py
+    python scripts/benchmarks/run_benchmarks.py --stage nist --repeat 5
+    python scripts/benchmarks/run_benchmarks.py --output new.json --compare old.json
+    python scripts/benchmarks/run_benchmarks.py --stage eu_ai_act.parse_html --memory
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+from pypdf import PdfReader
+
+import fixtures
+from common import load_script
+
+# Registered stage builders, in execution order
+STAGES = {}
+
+
+class StageUnavailable(Exception):
+    """Raised by a stage builder when the stage cannot run here (e.g. a missing tool)."""
+
+
+def stage(name):
+    """Register a stage builder.
+
+    A builder receives the size scale and a scratch directory, prepares its
+    fixtures, and returns (run, items): a zero-argument callable to time and the
+    number of items it processes per run.
+    """
+    def register(builder):
+        STAGES[name] = builder
+        return builder
+    return register
+
+
+@stage('nist.extract_bookmarks')
+def bench_nist_extract(scale, workdir):
+    nist = load_script('dl_nist-pdfs.py')
+    entries = int(10000 * scale)
+    pdf_bytes = fixtures.build_synthetic_pdf(entries, max(1, int(490 * scale)))
+    config = nist.Config.for_sp_800_53r5()
+
+    def run():
+        reader = PdfReader(io.BytesIO(pdf_bytes))
+        nist.BookmarkExtractor(config).extract_bookmarks(reader)
+    return run, entries
+
+
+@stage('nist.filter_by_section')
+def bench_nist_filter(scale, workdir):
+    nist = load_script('dl_nist-pdfs.py')
+    entries = int(10000 * scale)
+    pdf_bytes = fixtures.build_synthetic_pdf(entries, max(1, int(490 * scale)))
+    config = nist.Config.for_sp_800_53r5()
+    bookmarks = nist.BookmarkExtractor(config).extract_bookmarks(PdfReader(io.BytesIO(pdf_bytes)))
+    config.section_filters = ["FAMILY 1"]
+    config.leaf_sections = ["ALL"]
+
+    def run():
+        nist.BookmarkFilter(config).filter_by_section(bookmarks)
+    return run, len(bookmarks)
+
+
+@stage('ffiec.parse_booklets_page')
+def bench_ffiec_menu(scale, workdir):
+    ffiec = load_script('dl_ffiec-itbooklets.py')
+    abbreviations = fixtures.ffiec_abbreviations(max(1, int(100 * scale)))
+    sections = 30
+    html = fixtures.build_ffiec_menu_html(abbreviations, sections).encode('utf-8')
+
+    def run():
+        if ffiec.parse_booklets_page(html, abbreviations) is None:
+            raise RuntimeError("Fixture produced duplicate booklet keys")
+    return run, len(abbreviations) * (sections + 2)
+
+
+@stage('ffiec.filter_booklet_html')
+def bench_ffiec_filter(scale, workdir):
+    ffiec = load_script('dl_ffiec-itbooklets.py')
+    pages = max(1, int(20 * scale))
+    html = fixtures.build_ffiec_booklet_html(paragraphs=300, menu_links=2000)
+
+    def run():
+        for _ in range(pages):
+            ffiec.filter_booklet_html(html)
+    return run, pages
+
+
+def _ffiec_content_pages(scale, workdir):
+    """Write filtered booklet pages for the converter stages; return their paths."""
+    ffiec = load_script('dl_ffiec-itbooklets.py')
+    html = ffiec.filter_booklet_html(fixtures.build_ffiec_content_html(sections=20))
+    html_dir = workdir / "html"
+    html_dir.mkdir()
+    paths = []
+    for i in range(max(1, int(50 * scale))):
+        path = html_dir / f"page-{i}.html"
+        path.write_text(html, encoding='utf-8')
+        paths.append(path)
+    return paths
+
+
+@stage('ffiec.convert_python')
+def bench_ffiec_convert_python(scale, workdir):
+    ffiec = load_script('dl_ffiec-itbooklets.py')
+    pages = _ffiec_content_pages(scale, workdir)
+    # download_html_files converts the tree it has just filtered, so time from parsed soup
+    soups = [BeautifulSoup(path.read_text(encoding='utf-8'), 'html.parser') for path in pages]
+
+    def run():
+        for soup in soups:
+            ffiec.soup_to_markdown(soup)
+    return run, len(soups)
+
+
+@stage('ffiec.convert_pandoc')
+def bench_ffiec_convert_pandoc(scale, workdir):
+    ffiec = load_script('dl_ffiec-itbooklets.py')
+    if shutil.which('pandoc') is None:
+        raise StageUnavailable("pandoc not found")
+    pages = _ffiec_content_pages(scale, workdir)
+
+    def run():
+        for path in pages:
+            success, report, _ = ffiec.convert_html_to_markdown(path, path.with_suffix('.md'))
+            if not success:
+                raise RuntimeError("\n".join(report))
+    return run, len(pages)
+
+
+def _eu_ai_act_html(scale):
+    """Explorer page with 13 chapters, ~1,000 articles, 13 annexes and thousands of recitals."""
+    return fixtures.build_eu_ai_act_html(
+        chapters=13,
+        sections_per_chapter=max(1, int(5 * scale)),
+        articles_per_section=max(1, int(15 * scale)),
+        annexes=13,
+        recitals=max(1, int(3000 * scale)),
+    )
+
+
+def _eu_ai_act_page(scale):
+    """The cached explorer page if dl_eu-ai-act.py has downloaded it, else a generated one."""
+    eu = load_script('dl_eu-ai-act.py')
+    if eu.HTML_FILE.exists():
+        return eu.HTML_FILE.read_text(encoding='utf-8')
+    return _eu_ai_act_html(scale)
+
+
+@stage('eu_ai_act.parse_html')
+def bench_eu_parse(scale, workdir):
+    html = _eu_ai_act_page(scale)
+
+    def run():
+        BeautifulSoup(html, 'html.parser')
+    return run, 1
+
+
+@stage('eu_ai_act.parse_explorer_page')
+def bench_eu_parse_page(scale, workdir):
+    eu = load_script('dl_eu-ai-act.py')
+    html = _eu_ai_act_page(scale)
+
+    def run():
+        eu.parse_explorer_page(html, eu.BASE_URL)
+    return run, 1
+
+
+@stage('annotate.update_file_yaml')
+def bench_annotate(scale, workdir):
+    annotate = load_script('annotate_yaml_front_matter.py')
+    risks = max(1, int(600 * scale))
+    mitigations = max(1, int(600 * scale))
+    risks_dir, mitigations_dir = fixtures.write_framework_files(workdir, risks, mitigations)
+    files = sorted(risks_dir.glob('ri-*.md')) + sorted(mitigations_dir.glob('mi-*.md'))
+
+    title_mappings = {
+        'risks': {f"ri-{i}": f"Risk Title {i}" for i in range(1, risks + 1)},
+        'mitigations': {f"mi-{i}": f"Mitigation Title {i}" for i in range(1, mitigations + 1)},
+    }
+    for ref_type in fixtures.REFERENCE_TYPES:
+        title_mappings[f"{ref_type}_references"] = {
+            f"{ref_type}-{i}": f"{ref_type.upper()} Entry {i}" for i in range(1, 201)
+        }
+
+    def run():
+        for file_path in files:
+            annotate.update_file_yaml(file_path, title_mappings)
+    return run, len(files)
+
+
+@stage('references.validate_file')
+def bench_validate(scale, workdir):
+    validate = load_script('validate-references.py')
+    entries = max(1, int(5000 * scale))
+    reference_file = workdir / "synthetic-reference.yml"
+    reference_file.write_text(fixtures.build_reference_yaml(entries), encoding='utf-8')
+
+    def run():
+        errors = validate.validate_file(str(reference_file))
+        if errors:
+            raise RuntimeError(f"Fixture failed validation: {errors[:3]}")
+    return run, entries
+
+
+def time_stage(builder, scale, repeat, memory=False):
+    """Build a stage's fixtures and time `repeat` runs of it.
+
+    With `memory`, one more run is traced to record peak allocated memory.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        # Scripts print progress per item; keep the benchmark report readable
+        with contextlib.redirect_stdout(io.StringIO()):
+            run, items = builder(scale, Path(tmp))
+            run()  # Warm-up: imports, first-run file rewrites, caches
+            timings = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                run()
+                timings.append(time.perf_counter() - start)
+
+            peak = None
+            if memory:
+                tracemalloc.start()
+                try:
+                    run()
+                    peak = tracemalloc.get_traced_memory()[1]
+                finally:
+                    tracemalloc.stop()
+
+    best = min(timings)
+    return {
+        'peak_kib': peak / 1024 if peak is not None else None,
+        'items': items,
+        'runs': timings,
+        'min_seconds': best,
+        'median_seconds': statistics.median(timings),
+        'items_per_second': items / best if best else None,
+    }
+
+
+def compare(results, baseline_path):
+    """Print the change of each stage's best time against a previous results file."""
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = json.load(f).get('stages', {})
+
+    print(f"\nComparison with {baseline_path}:")
+    for name, result in results.items():
+        if name not in baseline:
+            print(f"  {name:40s} (not in baseline)")
+            continue
+        before = baseline[name]['min_seconds']
+        after = result['min_seconds']
+        print(f"  {name:40s} {before:9.4f}s -> {after:9.4f}s  ({before / after:5.2f}x)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the reference-ingestion scripts")
+    parser.add_argument('--stage', action='append',
+                        help='Only run stages whose name starts with this prefix (repeatable)')
+    parser.add_argument('--scale', type=float, default=1.0,
+                        help='Multiply fixture sizes by this factor (default: 1.0)')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Timed runs per stage after one warm-up run (default: 3)')
+    parser.add_argument('--output', type=Path, default=Path('benchmark-results.json'),
+                        help='JSON results file (default: benchmark-results.json)')
+    parser.add_argument('--memory', action='store_true',
+                        help='Also record each stage\'s peak memory with tracemalloc (one extra run)')
+    parser.add_argument('--compare', type=Path,
+                        help='Previous JSON results file to compare against')
+    args = parser.parse_args()
+
+    selected = [name for name in STAGES
+                if not args.stage or any(name.startswith(prefix) for prefix in args.stage)]
+    if not selected:
+        parser.error(f"No stage matches {args.stage}; available: {', '.join(STAGES)}")
+
+    results = {}
+    for name in selected:
+        print(f"Running {name}...", flush=True)
+        try:
+            results[name] = time_stage(STAGES[name], args.scale, args.repeat, args.memory)
+        except StageUnavailable as e:
+            print(f"  skipped: {e}")
+            continue
+        result = results[name]
+        memory = f", peak {result['peak_kib']:,.0f} KiB" if result['peak_kib'] is not None else ""
+        print(f"  {result['min_seconds']:.4f}s best of {args.repeat}, {result['items']} items{memory}")
+
+    report = {
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'scale': args.scale,
+        'repeat': args.repeat,
+        'stages': results,
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
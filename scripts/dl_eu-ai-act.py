@@ -17,7 +17,7 @@ DESCRIPTION:
     for both human readers and automated systems.
 
 FEATURES:
-    - Downloads and caches HTML content locally
+    - Downloads and caches HTML content locally, and caches the parsed table of contents
     - Extracts hierarchical structure (Chapters → Sections → Articles)
     - Generates clean, navigable Markdown with working hyperlinks
     - Creates YAML data with prefixed, flattened keys (e.g., eu-ai_c3-s2-a9)
@@ -28,6 +28,12 @@ FEATURES:
 OUTPUT FILES:
     - _refs-markdown/eu-ai-act/eu-ai-act-toc.md: Markdown table of contents
     - _refs-markdown/eu-ai-act/eu-ai-act-toc.html: Cached HTML source
+    - _refs-markdown/eu-ai-act/eu-ai-act-toc.json: Parsed table of contents, keyed by the
+      sha256 of the cached HTML, so output-only changes render without reparsing
+    - _refs-markdown/eu-ai-act/eu-ai-act-bodies.md.gz: Article, annex and recital texts
+      (with --bodies), one gzip member per entry
+    - _refs-markdown/eu-ai-act/eu-ai-act-bodies.json: Offset index into the archive,
+      with the HTTP validators used to revalidate each entry
     - docs/_data/eu-ai-act.yml: YAML data for Jekyll integration
 
 YAML FORMAT:
@@ -38,15 +44,19 @@ YAML FORMAT:
     - Recitals: "Recital 1", "Recital 2", etc.
 
 DEPENDENCIES:
-    - requests: HTTP client for downloading content
-    - beautifulsoup4: HTML parsing and navigation
+    - requests: HTTP client for downloading content (via the shared http_client.py)
+    - html_parsing.py: single-pass streaming parse of the page with Python's html.parser
+      (shared helper in this directory)
+    - html_to_markdown.py: conversion of article bodies (shared helper in this directory)
+    - manifest.py: reading and writing the bodies archive index (shared helper in this directory)
     - pyyaml: YAML file generation
     - roman: Roman numeral conversion (install with: pip install roman)
 
 USAGE:
-    python dl_eu-ai-act.py [--download]
+    python dl_eu-ai-act.py [--download] [--bodies]
     
     --download: Force fresh download even if HTML file exists
+    --bodies: Also fetch the text of every article, annex and recital
 
 EXAMPLES:
     # Generate files using cached HTML (if available)
@@ -54,6 +64,9 @@ EXAMPLES:
     
     # Force fresh download from source
     python dl_eu-ai-act.py --download
+    
+    # Fetch (or revalidate) all article, annex and recital texts
+    python dl_eu-ai-act.py --bodies
 
 AUTHOR:
     Generated for FINOS AI Governance Framework
@@ -62,34 +75,74 @@ LAST UPDATED:
     2024
 """
 
-import requests
-from bs4 import BeautifulSoup
 import re
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 import sys
+import os
 import argparse
+import gzip
+import hashlib
+import json
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from itertools import islice
+import requests
 import yaml
 import roman
 
+from html_parsing import parse_events, parse_html
+from html_to_markdown import soup_to_markdown
+from http_client import HttpClient
+from manifest import read_manifest, write_manifest
+
 # Constants
 SCRIPT_DIR = Path(__file__).parent
 BASE_URL = "https://artificialintelligenceact.eu/ai-act-explorer/"
 OUTPUT_FILENAME = "eu-ai-act-toc.md"
 HTML_FILENAME = "eu-ai-act-toc.html"
+TOC_CACHE_FILENAME = "eu-ai-act-toc.json"
+TOC_CACHE_VERSION = 1  # Bump whenever parsing changes what is extracted from the page
 YAML_FILENAME = "eu-ai-act.yml"
 RECITALS_TABLE_WIDTH = 10
 YAML_KEY_PREFIX = ""  # Prefix for all YAML keys
+TOC_CLASSES = {'parent-title', 'child-chapter', 'child-article'}  # Table of contents paragraphs
+TEXT_MODULE_CLASS = 'et_pb_text_inner'  # Text modules holding the Annexes and Recitals links
+# Elements whose text BeautifulSoup's get_text leaves out
+NON_TEXT_ELEMENTS = {'script', 'style', 'template', 'rt', 'rp'}
+BODIES_FILENAME = "eu-ai-act-bodies.md.gz"
+BODIES_INDEX_FILENAME = "eu-ai-act-bodies.json"
+BODY_WORKERS = 4
+BODY_REQUESTS_PER_SECOND = 2
+# Where an article page keeps its text, most specific first; the whole body is the fallback
+BODY_CONTENT_SELECTORS = ['div.et_pb_post_content', 'div.entry-content', 'article', 'main']
 
 # Path constants
 EU_AI_ACT_DIR = SCRIPT_DIR / ".." / "_refs-markdown" / "eu-ai-act"
 DATA_DIR = SCRIPT_DIR / ".." / "docs" / "_data"
 OUTPUT_FILE = EU_AI_ACT_DIR / OUTPUT_FILENAME
 HTML_FILE = EU_AI_ACT_DIR / HTML_FILENAME
+TOC_CACHE_FILE = EU_AI_ACT_DIR / TOC_CACHE_FILENAME
 YAML_FILE = DATA_DIR / YAML_FILENAME
+BODIES_FILE = EU_AI_ACT_DIR / BODIES_FILENAME
+BODIES_INDEX_FILE = EU_AI_ACT_DIR / BODIES_INDEX_FILENAME
+
+
+@dataclass
+class PageElement:
+    """An element recorded while streaming the explorer page."""
+    classes: List[str]
+    href: str = ''
+    strings: List[str] = field(default_factory=list)
+    first_link: Optional[int] = None  # Index in ExplorerPageParser.links of the first link inside
+
+    def get_text(self, strip: bool = False) -> str:
+        """Return the element's text as BeautifulSoup's get_text would."""
+        if strip:
+            return ''.join(string.strip() for string in self.strings)
+        return ''.join(self.strings)
 
 
 @dataclass
@@ -99,13 +152,10 @@ class Link:
     url: str
 
     @classmethod
-    def from_element(cls, element, base_url: str) -> Optional['Link']:
-        """Create Link from BeautifulSoup element."""
-        if not (link := element.find('a')):
-            return None
-        href = link.get('href', '')
-        text = link.get_text(strip=True).replace('\n', ' ').strip()
-        return cls(text, urljoin(base_url, href)) if href and text else None
+    def from_element(cls, element: PageElement, base_url: str) -> Optional['Link']:
+        """Create Link from a recorded `a` element."""
+        text = element.get_text(strip=True).replace('\n', ' ').strip()
+        return cls(text, urljoin(base_url, element.href)) if element.href and text else None
 
 
 @dataclass
@@ -167,23 +217,159 @@ def extract_numbers(text: str) -> Dict[str, int]:
     return result
 
 
-def parse_hierarchical_content(soup: BeautifulSoup, base_url: str) -> List[Chapter]:
-    """Parse chapters, sections, and articles in hierarchical order."""
+class ExplorerPageParser:
+    """Single-pass state machine over the parse events of the explorer page.
+
+    In one pass it records, in document order, the table of contents paragraphs,
+    every link and every text module, together with the text of each. close()
+    then builds the chapters, annexes and recitals from those records exactly as
+    queries over a full BeautifulSoup tree would.
+    """
+
+    def __init__(self, base_url: str):
+        self.base_url = base_url
+        self.paragraphs: List[PageElement] = []  # Table of contents paragraphs
+        self.links: List[PageElement] = []  # Every `a` element
+        self.text_modules: List[PageElement] = []  # Every `div.et_pb_text_inner`
+        self._open: List[List[PageElement]] = []  # Recorded elements opened by each open tag
+        self._recording: List[PageElement] = []  # Recorded elements currently open
+        self._open_paragraphs: List[PageElement] = []
+        self._non_text_depth = 0
+
+    def start(self, tag: str, attrs: Dict[str, str]) -> None:
+        classes = attrs.get('class', '').split()
+        opened = []
+
+        if tag == 'p' and TOC_CLASSES.intersection(classes):
+            paragraph = PageElement(classes)
+            self.paragraphs.append(paragraph)
+            self._open_paragraphs.append(paragraph)
+            opened.append(paragraph)
+        if tag == 'div' and TEXT_MODULE_CLASS in classes:
+            # Links inside the module and after it are the ones that follow its start
+            module = PageElement(classes, first_link=len(self.links))
+            self.text_modules.append(module)
+            opened.append(module)
+        if tag == 'a':
+            link = PageElement(classes, href=attrs.get('href', ''))
+            for paragraph in self._open_paragraphs:
+                if paragraph.first_link is None:
+                    paragraph.first_link = len(self.links)
+            self.links.append(link)
+            opened.append(link)
+        if tag in NON_TEXT_ELEMENTS:
+            self._non_text_depth += 1
+
+        self._open.append(opened)
+        self._recording.extend(opened)
+
+    def end(self, tag: str) -> None:
+        opened = self._open.pop()
+        if opened:
+            del self._recording[-len(opened):]
+            for element in opened:
+                if self._open_paragraphs and element is self._open_paragraphs[-1]:
+                    self._open_paragraphs.pop()
+        if tag in NON_TEXT_ELEMENTS:
+            self._non_text_depth -= 1
+
+    def data(self, text: str) -> None:
+        """Add one string of the page to every open recorded element."""
+        if not self._non_text_depth:
+            for element in self._recording:
+                element.strings.append(text)
+
+    def close(self) -> Tuple[List['Chapter'], List[Link], List[Link]]:
+        chapters = build_chapters(self.paragraphs, self.links, self.base_url)
+        annexes = collect_section_links(self.text_modules, self.links, 'Annexes', self.base_url,
+                                        link_filter=lambda t: 'Annex' in t)
+        recitals = collect_section_links(self.text_modules, self.links, 'Recitals', self.base_url,
+                                         link_filter=str.isdigit)
+        return chapters, annexes, recitals
+
+
+def parse_explorer_page(html: str, base_url: str) -> Tuple[List['Chapter'], List[Link], List[Link]]:
+    """Parse chapters, annexes and recitals from the explorer page in a single pass."""
+    return parse_events(html, ExplorerPageParser(base_url))
+
+
+def load_toc_cache(html_sha256: str, cache_file: Path = TOC_CACHE_FILE
+                   ) -> Optional[Tuple[List[Chapter], List[Link], List[Link]]]:
+    """Return the cached parse of the page with the given hash, or None on a cache miss."""
+    try:
+        data = json.loads(cache_file.read_text(encoding='utf-8'))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        print(f"Ignoring unreadable table of contents cache {cache_file}: {e}")
+        return None
+    
+    if not isinstance(data, dict):
+        print(f"Ignoring malformed table of contents cache {cache_file}: not a JSON object")
+        return None
+    
+    if data.get('html_sha256') != html_sha256 or data.get('version') != TOC_CACHE_VERSION:
+        return None
+    
+    def links(pairs):
+        return [Link(text, url) for text, url in pairs]
+    
+    try:
+        chapters = [
+            Chapter(text, url, [Section(s_text, s_url, links(s_articles)) for s_text, s_url, s_articles in sections],
+                    links(articles))
+            for text, url, sections, articles in data['chapters']
+        ]
+        return chapters, links(data['annexes']), links(data['recitals'])
+    except (KeyError, TypeError, ValueError) as e:
+        print(f"Ignoring malformed table of contents cache {cache_file}: {e}")
+        return None
+
+
+def save_toc_cache(html_sha256: str, chapters: List[Chapter], annexes: List[Link], recitals: List[Link],
+                   cache_file: Path = TOC_CACHE_FILE) -> None:
+    """Write the parsed page to the cache as compact JSON, keyed by the page's hash."""
+    def pairs(items):
+        return [[link.text, link.url] for link in items]
+    
+    data = {
+        'html_sha256': html_sha256,
+        'version': TOC_CACHE_VERSION,
+        'chapters': [
+            [chapter.text, chapter.url,
+             [[section.text, section.url, pairs(section.articles)] for section in chapter.sections],
+             pairs(chapter.articles)]
+            for chapter in chapters
+        ],
+        'annexes': pairs(annexes),
+        'recitals': pairs(recitals),
+    }
+    tmp_file = cache_file.with_name(f"{cache_file.name}.tmp")
+    try:
+        # Write a temporary file and rename it, so an interrupted run never leaves a truncated cache
+        tmp_file.write_text(json.dumps(data, separators=(',', ':'), ensure_ascii=False), encoding='utf-8')
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        # The cache is an optimisation only; a failed write must not fail the run
+        print(f"Could not write table of contents cache {cache_file}: {e}")
+        tmp_file.unlink(missing_ok=True)
+
+
+def build_chapters(paragraphs: List[PageElement], links: List[PageElement], base_url: str) -> List[Chapter]:
+    """Build chapters, sections, and articles in hierarchical order from table of contents paragraphs."""
     chapters = []
     current_chapter = None
     current_section = None
     
-    # Find all elements before "Annexes" section
-    relevant_elements = soup.find_all('p', class_=['parent-title', 'child-chapter', 'child-article'])
-    
-    for element in relevant_elements:
+    # Only paragraphs before the "Annexes" entry belong to the hierarchy
+    for element in paragraphs:
         if 'Annexes' in element.get_text(strip=True):
             break
-            
-        if not (link := Link.from_element(element, base_url)):
+        
+        if element.first_link is None or not (link := Link.from_element(links[element.first_link], base_url)):
             continue
         
-        classes = element.get('class', [])
+        classes = element.classes
         
         if 'parent-title' in classes and 'Chapter' in link.text:
             current_chapter = Chapter(link.text, link.url, [], [])
@@ -201,22 +387,22 @@ def parse_hierarchical_content(soup: BeautifulSoup, base_url: str) -> List[Chapt
     return chapters
 
 
-def parse_section_links(soup: BeautifulSoup, section_name: str, base_url: str, *, link_filter=None) -> List[Link]:
-    """Parse links from a named section with optional filtering."""
+def collect_section_links(text_modules: List[PageElement], links: List[PageElement], section_name: str,
+                          base_url: str, *, link_filter=None) -> List[Link]:
+    """Collect links from a named section with optional filtering."""
     # Find section header
     section_div = next(
-        (div for div in soup.find_all('div', class_='et_pb_text_inner') 
-         if section_name in div.get_text()), 
+        (div for div in text_modules if section_name in div.get_text()),
         None
     )
     
     if not section_div:
         return []
     
-    links = []
-    for link_element in section_div.find_all_next('a'):
+    section_links = []
+    for link_element in links[section_div.first_link:]:
         text = link_element.get_text(strip=True)
-        href = link_element.get('href', '')
+        href = link_element.href
         
         if not (href and text):
             continue
@@ -233,13 +419,13 @@ def parse_section_links(soup: BeautifulSoup, section_name: str, base_url: str, *
         if section_name == 'Recitals' and text.isdigit():
             text = f"Recital {text}"
         
-        links.append(Link(text, urljoin(base_url, href)))
+        section_links.append(Link(text, urljoin(base_url, href)))
         
         # Stop condition for annexes
         if section_name == 'Annexes' and 'Recitals' in text:
             break
     
-    return links
+    return section_links
 
 
 def build_toc_section(chapters: List[Chapter]) -> List[str]:
@@ -422,11 +608,164 @@ def create_markdown_document(chapters: List[Chapter], annexes: List[Link], recit
     return "\n".join(all_lines)
 
 
+@dataclass
+class BodyResult:
+    """Outcome of fetching one entry's page for the bodies archive."""
+    status: str  # 'fetched', 'unchanged' or 'failed'
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    text: Optional[str] = None
+    error: Optional[str] = None
+
+
+def extract_body(html: str) -> str:
+    """Extract the text of an article, annex or recital page as Markdown."""
+    soup = parse_html(html)
+    for selector in BODY_CONTENT_SELECTORS:
+        if content := soup.select_one(selector):
+            return soup_to_markdown(content)
+    return soup_to_markdown(soup.body or soup)
+
+
+def fetch_body(url: str, client: HttpClient, cached: Optional[Dict[str, Any]]) -> BodyResult:
+    """Fetch an entry's page, revalidating it with the validators of the cached copy."""
+    headers = {}
+    if cached and cached.get('url') == url:
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+    
+    try:
+        response = client.get(url, headers=headers)
+        if response.status_code == 304:
+            return BodyResult('unchanged', response.headers.get('ETag', cached.get('etag')),
+                              response.headers.get('Last-Modified', cached.get('last_modified')))
+        response.raise_for_status()
+    except requests.RequestException as e:
+        return BodyResult('failed', error=str(e))
+    
+    return BodyResult('fetched', response.headers.get('ETag'), response.headers.get('Last-Modified'),
+                      extract_body(response.text))
+
+
+def read_bodies_index(index_file: Path = BODIES_INDEX_FILE) -> Dict[str, Dict[str, Any]]:
+    """Read the bodies archive index, dropping entries that cannot locate a member.
+    
+    An unreadable index, or one that is not a JSON object, reads as empty.
+    """
+    def is_valid(entry):
+        return (isinstance(entry, dict) and isinstance(entry.get('sha256'), str)
+                and all(type(entry.get(field)) is int and entry[field] >= 0 for field in ('offset', 'length')))
+    
+    index = read_manifest(index_file)
+    return {key: entry for key, entry in index.items() if is_valid(entry)}
+
+
+def verified_members(index: Dict[str, Dict[str, Any]], archive: bytes) -> Dict[str, bytes]:
+    """Return the archive's gzip member for each index entry whose text still matches its sha256.
+    
+    Entries whose member is truncated, corrupt or edited are left out, so they are
+    fetched again rather than carried forward.
+    """
+    members = {}
+    for key, entry in index.items():
+        member = archive[entry['offset']:entry['offset'] + entry['length']]
+        try:
+            text = gzip.decompress(member)
+        except (OSError, EOFError, zlib.error):
+            text = None
+        if text is None or hashlib.sha256(text).hexdigest() != entry['sha256']:
+            print(f"  ! {key}: archived text does not match the index, fetching it again", file=sys.stderr)
+            continue
+        members[key] = member
+    return members
+
+
+def read_body(key: str, archive_file: Path = BODIES_FILE, index_file: Path = BODIES_INDEX_FILE) -> Optional[str]:
+    """Return the archived Markdown text of one entry, reading only its own gzip member."""
+    entry = read_bodies_index(index_file).get(key)
+    if entry is None:
+        return None
+    with open(archive_file, 'rb') as f:
+        f.seek(entry['offset'])
+        return gzip.decompress(f.read(entry['length'])).decode('utf-8')
+
+
+def harvest_bodies(yaml_data: Dict[str, Any], archive_file: Path = BODIES_FILE,
+                   index_file: Path = BODIES_INDEX_FILE, max_workers: int = BODY_WORKERS) -> bool:
+    """Fetch the text of every YAML entry into a single compressed archive.
+    
+    Pages are fetched concurrently under a per-host rate limit. Each entry is
+    stored as its own gzip member, so the archive decompresses as one document
+    with `zcat` while the index gives every entry's offset and length for
+    random access. Entries already in the archive are checked against the
+    sha256 in the index, then revalidated with conditional requests and their
+    stored member is reused when unchanged.
+    """
+    index = read_bodies_index(index_file) if archive_file.exists() else {}
+    old_members = verified_members(index, archive_file.read_bytes()) if index else {}
+    index = {key: entry for key, entry in index.items() if key in old_members}
+    
+    print(f"Fetching {len(yaml_data)} article, annex and recital texts...")
+    with HttpClient(rate=BODY_REQUESTS_PER_SECOND, pool_size=max_workers) as client:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {key: executor.submit(fetch_body, entry['url'], client, index.get(key))
+                       for key, entry in yaml_data.items()}
+            results = {key: future.result() for key, future in futures.items()}
+        stats_summary = client.stats.summary()
+    
+    members = []
+    new_index = {}
+    offset = 0
+    counts = {'fetched': 0, 'unchanged': 0, 'failed': 0}
+    for key, entry in yaml_data.items():
+        result = results[key]
+        cached = index.get(key)
+        counts[result.status] += 1
+        
+        if result.status == 'fetched':
+            text = f"# {entry['title']}\n\nSource: <{entry['url']}>\n\n{result.text}"
+            member = gzip.compress(text.encode('utf-8'), mtime=0)
+            record = {'sha256': hashlib.sha256(text.encode('utf-8')).hexdigest()}
+        elif cached is not None:
+            # Unchanged, or failed with an older copy to keep
+            member = old_members[key]
+            record = {'sha256': cached['sha256']}
+            if result.status == 'failed':
+                print(f"  ✗ {key}: {result.error} (keeping previous text)", file=sys.stderr)
+                result = BodyResult('failed', cached.get('etag'), cached.get('last_modified'))
+        else:
+            print(f"  ✗ {key}: {result.error}", file=sys.stderr)
+            continue
+        
+        record.update({'title': entry['title'], 'url': entry['url'], 'etag': result.etag,
+                       'last_modified': result.last_modified, 'offset': offset, 'length': len(member)})
+        new_index[key] = record
+        members.append(member)
+        offset += len(member)
+    
+    # Write the archive before the index so the index never points past its end
+    archive_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_archive = archive_file.with_name(f"{archive_file.name}.tmp")
+    tmp_archive.write_bytes(b''.join(members))
+    os.replace(tmp_archive, archive_file)
+    write_manifest(index_file, new_index)
+    
+    print(stats_summary)
+    print(f"Archived {len(new_index)} texts to {archive_file} ({offset / 1024:.0f} KiB): "
+          f"{counts['fetched']} fetched, {counts['unchanged']} unchanged, {counts['failed']} failed")
+    return counts['failed'] == 0
+
+
 def main():
     """Main function with clean, readable flow."""
     # Parse arguments
     parser = argparse.ArgumentParser(description="Download EU AI Act Explorer content")
     parser.add_argument('--download', action='store_true', help='Force download even if HTML file exists')
+    parser.add_argument('--bodies', action='store_true',
+                        help='Also fetch article, annex and recital texts into a compressed archive, '
+                             'revalidating previously fetched ones')
     args = parser.parse_args()
     
     try:
@@ -437,22 +776,26 @@ def main():
         # Download or load HTML
         if args.download or not HTML_FILE.exists():
             print("Downloading EU AI Act Explorer page...")
-            response = requests.get(BASE_URL, timeout=30)
-            response.raise_for_status()
+            with HttpClient() as client:
+                response = client.get(BASE_URL)
+                response.raise_for_status()
             html_content = response.text
             HTML_FILE.write_text(html_content, encoding='utf-8')
             print(f"Saved raw HTML to {HTML_FILE}")
+            print(client.stats.summary())
         else:
             print(f"Using existing HTML file: {HTML_FILE}")
             html_content = HTML_FILE.read_text(encoding='utf-8')
         
-        # Parse content
-        print("Parsing table of contents, annexes, and recitals...")
-        soup = BeautifulSoup(html_content, 'html.parser')
-        
-        chapters = parse_hierarchical_content(soup, BASE_URL)
-        annexes = parse_section_links(soup, 'Annexes', BASE_URL, link_filter=lambda t: 'Annex' in t)
-        recitals = parse_section_links(soup, 'Recitals', BASE_URL, link_filter=str.isdigit)
+        # Parse content, unless this exact page has been parsed before
+        html_sha256 = hashlib.sha256(html_content.encode('utf-8')).hexdigest()
+        if parsed := load_toc_cache(html_sha256):
+            print(f"Using cached table of contents: {TOC_CACHE_FILE}")
+        else:
+            print("Parsing table of contents, annexes, and recitals...")
+            parsed = parse_explorer_page(html_content, BASE_URL)
+            save_toc_cache(html_sha256, *parsed)
+        chapters, annexes, recitals = parsed
         
         # Calculate and report statistics
         total_sections = sum(len(c.sections) for c in chapters)
@@ -481,6 +824,9 @@ def main():
         print(f"Total items processed: {total_items}")
         print(f"YAML entries created: {len(yaml_data)}")
         
+        if args.bodies and not harvest_bodies(yaml_data):
+            sys.exit(1)
+        
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
@@ -3,12 +3,13 @@
 FFIEC IT Booklets Manager
 
 This script manages FFIEC IT Handbook booklets by generating YAML mappings,
-downloading HTML files with navigation filtering, and converting them to Markdown using pandoc.
+downloading HTML files with navigation filtering, and converting them to Markdown using pandoc
+or the in-process converter in html_to_markdown.py.
 
 The script can perform three main operations:
 1. Generate YAML file with booklet structure and URLs
 2. Download all booklet URLs as HTML files (filtering out navigation elements)
-3. Convert HTML files to Markdown using pandoc
+3. Convert HTML files to Markdown using pandoc (or --converter python)
 
 Operations can be run individually or in combination using command line flags.
 
@@ -17,6 +18,7 @@ Output:
     - _data/ffiec-itbooklets.yml (YAML mappings)
     - _refs-markdown/ffiec-itbooklets/html/*.html (HTML files with navigation removed)
     - _refs-markdown/ffiec-itbooklets/markdown/*.md (Markdown files)
+    - _refs-markdown/ffiec-itbooklets/manifest.json (URL, HTTP validators and content hashes per key)
 
 Usage:
     python scripts/dl_ffiec-booklets.py --yml          # Generate YAML only
@@ -24,25 +26,39 @@ Usage:
     python scripts/dl_ffiec-booklets.py --md           # Convert to Markdown only
     python scripts/dl_ffiec-booklets.py --all          # Do all steps
     python scripts/dl_ffiec-booklets.py                # Do all steps (default)
+    python scripts/dl_ffiec-booklets.py --md --pandoc-server   # Convert via a running pandoc-server
+    python scripts/dl_ffiec-booklets.py --html --md --refresh  # Re-fetch changed pages, reconvert changed HTML
+    python scripts/dl_ffiec-booklets.py --converter python     # Convert in-process, no pandoc needed
 
 Dependencies: 
     - pip install requests beautifulsoup4 pyyaml
-    - conda install -c conda-forge pandoc (for Markdown conversion)
+    - http_client.py (shared HTTP client in this directory)
+    - manifest.py (shared download manifest helper in this directory)
+    - html_to_markdown.py (in-process converter in this directory)
+    - html_parsing.py (shared parsing helper in this directory; pip install lxml for faster parsing)
+    - conda install -c conda-forge pandoc (for Markdown conversion with the default converter)
 """
 
 import requests
-from bs4 import BeautifulSoup
 import yaml
 import sys
 import os
+import hashlib
 import time
 import subprocess
 import argparse
 import roman
 import re
+import statistics
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from urllib.parse import urljoin
 
+from html_parsing import class_strainer, parse_html
+from html_to_markdown import soup_to_markdown
+from http_client import HttpClient
+from manifest import read_manifest, write_manifest
+
 # Constants
 SCRIPT_DIR = Path(__file__).parent
 
@@ -51,9 +67,23 @@ BOOKLETS_URL = f"{BASE_URL}/it-booklets"
 YAML_FILENAME = "ffiec-itbooklets_v2.yml"
 REQUEST_TIMEOUT = 30
 DOWNLOAD_DELAY = 0.5
+DOWNLOAD_WORKERS = 4
 URL_COMPONENTS_MAIN_BOOKLET = 5
 URL_COMPONENTS_SECTION = 6
 
+# Pandoc conversion options, as command line flags and in pandoc-server's JSON form
+PANDOC_ARGS = [
+    '--from=html',
+    '--to=gfm-raw_html',     # GitHub markdown without raw HTML passthrough
+    '--wrap=auto',           # Auto-wrap long lines
+    '--strip-comments',      # Remove HTML comments
+]
+PANDOC_SERVER_OPTIONS = {'from': 'html', 'to': 'gfm-raw_html', 'wrap': 'auto', 'strip-comments': True}
+PANDOC_SERVER_URL = "http://localhost:3030"
+PANDOC_SERVER_TIMEOUT = 120
+PANDOC_BATCH_SIZE = 25
+CONVERTERS = ('pandoc', 'python')
+
 # Path constants
 DATA_DIR = SCRIPT_DIR / ".." / "docs" / "_data"
 CONFIG_DIR = SCRIPT_DIR / ".." / "docs"
@@ -62,6 +92,10 @@ YAML_FILE = DATA_DIR / YAML_FILENAME
 CONFIG_FILE = CONFIG_DIR / "_config.yml"
 HTML_OUTPUT_DIR = FFIEC_ITBOOKLETS_DIR / "html"
 MD_OUTPUT_DIR = FFIEC_ITBOOKLETS_DIR / "markdown"
+# Maps each booklet key to its URL, the ETag/Last-Modified validators of the last
+# download, the sha256 of the filtered HTML and the sha256 of the Markdown converted
+# from that HTML (None until converted)
+MANIFEST_FILE = FFIEC_ITBOOKLETS_DIR / "manifest.json"
 
 
 
@@ -104,6 +138,14 @@ def read_yaml_file(yaml_file):
         print(f"Error parsing YAML file: {e}", file=sys.stderr)
         return None
 
+def sha256_bytes(data):
+    """Return the hex sha256 of some bytes."""
+    return hashlib.sha256(data).hexdigest()
+
+def sha256_file(path):
+    """Return the hex sha256 of a file's contents."""
+    return sha256_bytes(Path(path).read_bytes())
+
 def parse_booklet_url(full_url, abbreviations):
     """Parse booklet URL to extract key and abbreviation.
     
@@ -223,51 +265,105 @@ def check_pandoc():
     except (subprocess.CalledProcessError, FileNotFoundError):
         return False
 
+def check_pandoc_server(server_url, client):
+    """Check if a pandoc-server is answering at the given URL."""
+    try:
+        response = client.get(f"{server_url.rstrip('/')}/version", timeout=5)
+        return response.ok
+    except requests.RequestException:
+        return False
+
 def convert_html_to_markdown(html_path, md_path):
-    """Convert HTML file to Markdown using pandoc."""
+    """Convert HTML file to Markdown using pandoc.
+    
+    Returns (success, report lines, seconds taken) so that conversions can run in
+    worker threads and be reported in order afterwards.
+    """
+    start = time.perf_counter()
     try:
         # Use cleaner pandoc options for better markdown output
-        pandoc_args = [
-            'pandoc', str(html_path), '-o', str(md_path),
-            '--from=html',
-            '--to=gfm-raw_html',     # GitHub markdown without raw HTML passthrough
-            '--wrap=auto',           # Auto-wrap long lines
-            '--strip-comments',      # Remove HTML comments
-        ]
+        pandoc_args = ['pandoc', str(html_path), '-o', str(md_path)] + PANDOC_ARGS
         subprocess.run(pandoc_args, check=True, capture_output=True)
-        return True
+        return True, ["  [OK] Converted successfully"], time.perf_counter() - start
     except subprocess.CalledProcessError as e:
-        print(f"  ✗ Pandoc conversion error: {e}")
-        return False
+        return False, [f"  ✗ Pandoc conversion error: {e}"], time.perf_counter() - start
 
-def generate_yaml_file(yaml_file):
-    """Generate the YAML file with FFIEC booklet structure and URLs."""
-    
-    print("=== Generating YAML file ===")
+def convert_html_to_markdown_python(html_path, md_path):
+    """Convert HTML file to Markdown in-process with html_to_markdown.py.
     
-    # Read abbreviations from config file
-    print(f"Reading abbreviations from config file: {CONFIG_FILE}")
-    abbreviations = read_config_file(CONFIG_FILE)
-    if not abbreviations:
-        print("Error: No abbreviations found in config file", file=sys.stderr)
-        return False
+    Returns the same (success, report lines, seconds taken) as convert_html_to_markdown;
+    a page that cannot be read, converted or written fails on its own, leaving
+    the other pages to be converted.
+    """
+    start = time.perf_counter()
+    try:
+        with open(html_path, 'r', encoding='utf-8') as f:
+            markdown = soup_to_markdown(parse_html(f.read()))
+        with open(md_path, 'w', encoding='utf-8') as f:
+            f.write(markdown)
+    except Exception as e:
+        return False, [f"  ✗ Conversion error: {type(e).__name__}: {e}"], time.perf_counter() - start
+    return True, ["  [OK] Converted successfully"], time.perf_counter() - start
+
+def convert_batch_with_server(pairs, server_url, client):
+    """Convert a batch of (html_path, md_path) pairs with one pandoc-server request.
     
-    print("Downloading FFIEC IT booklets page...")
+    Uses the server's /batch endpoint, so the whole batch costs one HTTP round trip
+    and no process startups. Returns a (success, report lines, seconds) tuple per
+    pair; the batch time is shared evenly between its files.
+    """
+    start = time.perf_counter()
+    payload = [dict(PANDOC_SERVER_OPTIONS, text=html_path.read_text(encoding='utf-8'))
+               for html_path, _ in pairs]
     try:
-        response = requests.get(BOOKLETS_URL)
+        response = client.post(f"{server_url.rstrip('/')}/batch", json=payload)
         response.raise_for_status()
-    except requests.RequestException as e:
-        print(f"Error downloading page: {e}", file=sys.stderr)
-        return False
+        results = response.json()
+    except (requests.RequestException, ValueError) as e:
+        seconds = (time.perf_counter() - start) / len(pairs)
+        return [(False, [f"  ✗ pandoc-server error: {e}"], seconds)] * len(pairs)
+    
+    seconds = (time.perf_counter() - start) / len(pairs)
+    outcomes = []
+    for (_, md_path), result in zip(pairs, results):
+        # Each result is the converted text, or an object carrying it (or an error)
+        output = result if isinstance(result, str) else result.get('output')
+        if output is None:
+            error = result.get('error', result) if isinstance(result, dict) else result
+            outcomes.append((False, [f"  ✗ pandoc-server conversion error: {error}"], seconds))
+            continue
+        with open(md_path, 'w', encoding='utf-8') as f:
+            f.write(output)
+        outcomes.append((True, ["  [OK] Converted successfully"], seconds))
+    return outcomes
+
+def print_conversion_timing(latencies, elapsed):
+    """Print total conversion time and per-file latency statistics."""
+    if not latencies:
+        return
+    print(f"Converted {len(latencies)} files in {elapsed:.2f}s "
+          f"(per file: mean {statistics.mean(latencies) * 1000:.0f} ms, "
+          f"median {statistics.median(latencies) * 1000:.0f} ms, "
+          f"max {max(latencies) * 1000:.0f} ms)")
+
+def parse_booklets_page(content, abbreviations):
+    """Parse the IT booklets page into booklet entries keyed by short key.
     
-    print("Parsing booklet information...")
-    soup = BeautifulSoup(response.content, 'html.parser')
+    Args:
+        content: HTML content of the IT booklets page
+        abbreviations: Dictionary mapping full booklet names to abbreviations
+    
+    Returns:
+        dict: Booklet entries keyed by short key, or None if duplicate keys are found
+    """
+    # Only the menu is read, so only the menu is parsed
+    soup = parse_html(content, parse_only=class_strainer('menu-container'))
     
     # Look for links in the menu-container class
     menu_container = soup.find(class_="menu-container")
     if not menu_container:
         print("Warning: menu-container not found, searching entire page")
-        menu_container = soup
+        menu_container = parse_html(content)
     
     booklets = {}
     booklet_sections = {}  # Track sections by booklet for sequential numbering
@@ -335,12 +431,55 @@ def generate_yaml_file(yaml_file):
                 print(f"ERROR: Duplicate key '{short_key}' found for '{title}'", file=sys.stderr)
                 print(f"       Existing: {booklets[short_key]['title']}", file=sys.stderr)
                 print(f"       New: {title}", file=sys.stderr)
-                return False
+                return None
             
             # Create booklet entry
             booklets[short_key] = create_booklet_entry(short_key, booklet_abbrev, title, full_url)
             print(f"  {old_key} -> {short_key}: {title}")
     
+    return booklets
+
+def filter_booklet_soup(html):
+    """Parse a booklet page and remove navigation elements that interfere with content."""
+    soup = parse_html(html)
+    
+    for nav_element in soup.find_all('ul', class_='menu-container'):
+        nav_element.decompose()
+    
+    for nav_element in soup.find_all('ul', class_='nav-booklet-toc nav-pills text-smaller nobottommargin'):
+        nav_element.decompose()
+    
+    return soup
+
+def filter_booklet_html(html):
+    """Remove navigation elements that interfere with content from a booklet page."""
+    return str(filter_booklet_soup(html))
+
+def generate_yaml_file(yaml_file, client):
+    """Generate the YAML file with FFIEC booklet structure and URLs."""
+    
+    print("=== Generating YAML file ===")
+    
+    # Read abbreviations from config file
+    print(f"Reading abbreviations from config file: {CONFIG_FILE}")
+    abbreviations = read_config_file(CONFIG_FILE)
+    if not abbreviations:
+        print("Error: No abbreviations found in config file", file=sys.stderr)
+        return False
+    
+    print("Downloading FFIEC IT booklets page...")
+    try:
+        response = client.get(BOOKLETS_URL, timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+    except requests.RequestException as e:
+        print(f"Error downloading page: {e}", file=sys.stderr)
+        return False
+    
+    print("Parsing booklet information...")
+    booklets = parse_booklets_page(response.content, abbreviations)
+    if booklets is None:
+        return False
+    
     # Write YAML file
     if not write_yaml_file(yaml_file, booklets):
         return False
@@ -349,10 +488,85 @@ def generate_yaml_file(yaml_file):
     print(f"[OK] Found {len(booklets)} booklets/sections")
     return True
 
-def download_html_files(yaml_file, html_output_dir):
-    """Download HTML files for all booklets listed in the YAML file."""
+def download_booklet_page(url, html_path, client, entry=None, md_path=None):
+    """Download a booklet page, strip navigation and save it.
+    
+    `entry` is the page's manifest entry from a previous download, if any. Its
+    validators make the request conditional, and the file is only rewritten when
+    the filtered HTML hash differs, so unchanged pages keep their Markdown.
+    
+    With `md_path`, a new or changed page is also converted with the in-process
+    converter straight from the filtered tree, without reparsing the saved HTML.
+    
+    Returns:
+        tuple: (success, list of report lines, updated manifest entry or None, changed)
+    """
+    entry = entry or {}
+    headers = {}
+    if html_path.exists() and entry.get('url') == url:
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+    
+    try:
+        response = client.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+        if response.status_code == 304:
+            return True, ["  [OK] Not modified"], entry, False
+        response.raise_for_status()
+    except requests.RequestException as e:
+        return False, [f"  ✗ Error downloading {url}: {e}"], None, False
+    
+    # Parse HTML and filter out navigation elements
+    soup = filter_booklet_soup(response.text)
+    # Hash exactly the bytes written, so the hash matches sha256_file on every platform
+    filtered_html = str(soup).encode('utf-8')
+    html_sha256 = sha256_bytes(filtered_html)
+    unchanged = html_path.exists() and html_sha256 == entry.get('html_sha256')
+    
+    updated_entry = {
+        'url': url,
+        'etag': response.headers.get('ETag'),
+        'last_modified': response.headers.get('Last-Modified'),
+        'html_sha256': html_sha256,
+        # Markdown converted from different HTML is stale
+        'md_sha256': entry.get('md_sha256') if unchanged else None,
+        'converter': entry.get('converter') if unchanged else None,
+    }
+    if unchanged:
+        return True, ["  [OK] HTML unchanged"], updated_entry, False
+    
+    # Write filtered HTML content to file
+    html_path.write_bytes(filtered_html)
+    report = [f"  [OK] HTML downloaded ({len(response.text)} characters)"]
+    
+    if md_path is not None:
+        markdown = soup_to_markdown(soup).encode('utf-8')
+        md_path.write_bytes(markdown)
+        updated_entry['md_sha256'] = sha256_bytes(markdown)
+        updated_entry['converter'] = 'python'
+        report.append(f"  [OK] Converted to {md_path.name}")
+    
+    return True, report, updated_entry, True
+
+def download_html_files(yaml_file, html_output_dir, client, max_workers=DOWNLOAD_WORKERS,
+                        manifest_file=MANIFEST_FILE, refresh=False, md_output_dir=None):
+    """Download HTML files for all booklets listed in the YAML file.
+    
+    Pages are fetched by a pool of `max_workers` threads sharing the client,
+    whose per-host rate limit keeps the server seeing no more requests than
+    with a fixed delay between sequential downloads while network waits overlap.
+    
+    Existing pages are skipped unless `refresh` is set, in which case they are
+    revalidated with conditional requests using the validators in the manifest.
+    
+    With `md_output_dir`, downloaded pages are converted to Markdown in-process
+    as they arrive (see download_booklet_page).
+    """
     # Create output directory
     html_output_dir.mkdir(parents=True, exist_ok=True)
+    if md_output_dir is not None:
+        md_output_dir.mkdir(parents=True, exist_ok=True)
     
     print("=== Downloading HTML files ===")
     print(f"Reading YAML file: {yaml_file}")
@@ -368,8 +582,11 @@ def download_html_files(yaml_file, html_output_dir):
     print(f"Found {len(data)} booklets/sections to download")
     print(f"HTML output directory: {html_output_dir}")
     
+    manifest = read_manifest(manifest_file)
     success_count = 0
     error_count = 0
+    unchanged_count = 0
+    pending = []
     
     for key, booklet_info in data.items():
         url = booklet_info.get('url')
@@ -383,69 +600,90 @@ def download_html_files(yaml_file, html_output_dir):
         html_filename = f"{key}.html"
         html_path = html_output_dir / html_filename
         
-        # Skip if file already exists
-        if html_path.exists():
+        # Skip if file already exists, unless revalidating
+        if html_path.exists() and not refresh:
             print(f"Skipping: {title}")
             print(f"  HTML: {html_filename} (already exists)")
             success_count += 1
             continue
         
-        print(f"Downloading: {title}")
-        print(f"  URL: {url}")
-        print(f"  HTML: {html_filename}")
-        
-        try:
-            response = requests.get(url, timeout=REQUEST_TIMEOUT)
-            response.raise_for_status()
-            
-            # Parse HTML and filter out navigation elements
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Remove navigation elements that interfere with content
-            for nav_element in soup.find_all('ul', class_='menu-container'):
-                nav_element.decompose()
-            
-            for nav_element in soup.find_all('ul', class_='nav-booklet-toc nav-pills text-smaller nobottommargin'):
-                nav_element.decompose()
-            
-            # Write filtered HTML content to file
-            with open(html_path, 'w', encoding='utf-8') as f:
-                f.write(str(soup))
-            
-            print(f"  [OK] HTML downloaded ({len(response.text)} characters)")
-            success_count += 1
-            
-        except requests.RequestException as e:
-            print(f"  ✗ Error downloading {url}: {e}")
-            error_count += 1
-            continue
+        pending.append((key, title, url, html_path))
+    
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        futures = [executor.submit(download_booklet_page, url, html_path, client, manifest.get(key),
+                                   md_output_dir / f"{key}.md" if md_output_dir is not None else None)
+                   for key, _, url, html_path in pending]
         
-        # Small delay to be respectful to the server
-        time.sleep(DOWNLOAD_DELAY)
+        # Report in YAML order, whatever order the downloads finish in
+        for (key, title, url, html_path), future in zip(pending, futures):
+            success, report, entry, changed = future.result()
+            print(f"Downloading: {title}")
+            print(f"  URL: {url}")
+            print(f"  HTML: {html_path.name}")
+            for line in report:
+                print(line)
+            if entry is not None:
+                manifest[key] = entry
+            if success:
+                success_count += 1
+                unchanged_count += not changed
+            else:
+                error_count += 1
     
-    print(f"[OK] HTML download complete: {success_count} success, {error_count} errors")
+    write_manifest(manifest_file, manifest)
+    print(f"[OK] HTML download complete: {success_count} success "
+          f"({unchanged_count} unchanged), {error_count} errors")
     return error_count == 0
 
-def convert_to_markdown(html_output_dir, md_output_dir):
-    """Convert HTML files to Markdown using pandoc."""
+def convert_to_markdown(html_output_dir, md_output_dir, max_workers=None,
+                        server_url=None, batch_size=PANDOC_BATCH_SIZE, manifest_file=MANIFEST_FILE,
+                        converter='pandoc'):
+    """Convert HTML files to Markdown using pandoc or the in-process converter.
+    
+    An existing Markdown file is kept while its HTML still hashes to the value
+    recorded in the manifest when it was converted with the same converter;
+    pages whose filtered HTML changed are converted again.
+    
+    Pandoc process startup dominates for small booklet pages, so conversions run
+    in a pool of `max_workers` threads (default: one per CPU), each driving its
+    own pandoc process. When `server_url` points at a running pandoc-server, files
+    are instead sent in batches of `batch_size` per request, avoiding process
+    startup altogether; if the server does not answer, local pandoc is used.
+    
+    With converter='python', pages are converted in-process with html_to_markdown.py
+    and pandoc is not needed.
+    """
     # Create output directory
     md_output_dir.mkdir(parents=True, exist_ok=True)
     
     print("=== Converting to Markdown ===")
     
-    # Check for pandoc
-    has_pandoc = check_pandoc()
-    if not has_pandoc:
-        print("✗ Pandoc not found - cannot convert to Markdown")
-        print("  Install with: conda install -c conda-forge pandoc")
-        return False
+    server_client = None
+    if server_url and converter == 'pandoc':
+        server_client = HttpClient(timeout=PANDOC_SERVER_TIMEOUT, retries=1)
+        if check_pandoc_server(server_url, server_client):
+            print(f"[OK] pandoc-server found at {server_url}")
+        else:
+            print(f"pandoc-server not answering at {server_url} - falling back to local pandoc")
+            server_client.close()
+            server_client = None
     
-    print("[OK] Pandoc found")
+    # Check for pandoc
+    if converter == 'python':
+        print("[OK] Using in-process converter")
+    elif server_client is None:
+        has_pandoc = check_pandoc()
+        if not has_pandoc:
+            print("✗ Pandoc not found - cannot convert to Markdown")
+            print("  Install with: conda install -c conda-forge pandoc")
+            return False
+        
+        print("[OK] Pandoc found")
     print(f"HTML input directory: {html_output_dir}")
     print(f"Markdown output directory: {md_output_dir}")
     
     # Find all HTML files
-    html_files = list(html_output_dir.glob("*.html"))
+    html_files = sorted(html_output_dir.glob("*.html"))
     if not html_files:
         print("No HTML files found to convert")
         print("Run with --html flag first to download HTML files.")
@@ -453,27 +691,63 @@ def convert_to_markdown(html_output_dir, md_output_dir):
     
     print(f"Found {len(html_files)} HTML files to convert")
     
+    manifest = read_manifest(manifest_file)
     success_count = 0
     error_count = 0
+    pending = []
     
     for html_path in html_files:
         md_filename = f"{html_path.stem}.md"
         md_path = md_output_dir / md_filename
+        entry = manifest.get(html_path.stem)
         
-        # Skip if markdown file already exists
+        # Skip if markdown file already exists and was converted from this HTML.
+        # Files predating the manifest have no entry and are kept as they are.
         if md_path.exists():
-            print(f"Skipping: {html_path.name} -> {md_filename} (already exists)")
-            success_count += 1
-            continue
-        
-        print(f"Converting: {html_path.name} -> {md_filename}")
+            if entry is None:
+                print(f"Skipping: {html_path.name} -> {md_filename} (already exists)")
+                success_count += 1
+                continue
+            if (entry.get('md_sha256') and entry.get('converter', 'pandoc') == converter
+                    and entry.get('html_sha256') == sha256_file(html_path)):
+                print(f"Skipping: {html_path.name} -> {md_filename} (HTML unchanged)")
+                success_count += 1
+                continue
         
-        if convert_html_to_markdown(html_path, md_path):
-            print("  [OK] Converted successfully")
+        pending.append((html_path, md_path))
+    
+    start = time.perf_counter()
+    if converter == 'python':
+        # CPU-bound and in-process, so threads would only contend for the GIL
+        outcomes = [convert_html_to_markdown_python(html_path, md_path) for html_path, md_path in pending]
+    elif server_client is not None:
+        with server_client:
+            batches = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+            outcomes = [outcome for batch in batches
+                        for outcome in convert_batch_with_server(batch, server_url, server_client)]
+    else:
+        with ThreadPoolExecutor(max_workers=max(1, max_workers or os.cpu_count() or 1)) as executor:
+            outcomes = list(executor.map(lambda pair: convert_html_to_markdown(*pair), pending))
+    elapsed = time.perf_counter() - start
+    
+    # Report in file order, whatever order the conversions finish in
+    latencies = []
+    for (html_path, md_path), (success, report, seconds) in zip(pending, outcomes):
+        print(f"Converting: {html_path.name} -> {md_path.name}")
+        for line in report:
+            print(line)
+        latencies.append(seconds)
+        if success:
             success_count += 1
+            entry = manifest.setdefault(html_path.stem, {})
+            entry['html_sha256'] = sha256_file(html_path)
+            entry['md_sha256'] = sha256_file(md_path)
+            entry['converter'] = converter
         else:
             error_count += 1
     
+    write_manifest(manifest_file, manifest)
+    print_conversion_timing(latencies, elapsed)
     print(f"[OK] Markdown conversion complete: {success_count} success, {error_count} errors")
     return error_count == 0
 
@@ -498,6 +772,21 @@ Examples:
                        help='Convert HTML files to Markdown')
     parser.add_argument('--all', action='store_true',
                        help='Perform all operations (yml + html + md)')
+    parser.add_argument('--workers', type=int, default=DOWNLOAD_WORKERS,
+                       help=f'Concurrent HTML downloads (default: {DOWNLOAD_WORKERS}); '
+                            f'each host is still limited to one request per {DOWNLOAD_DELAY}s')
+    parser.add_argument('--refresh', action='store_true',
+                       help='Revalidate existing HTML pages and reconvert those whose content changed')
+    parser.add_argument('--converter', choices=CONVERTERS, default='pandoc',
+                       help='Markdown converter: an external pandoc process per file, or the '
+                            'in-process Python converter (default: pandoc)')
+    parser.add_argument('--md-workers', type=int, default=None,
+                       help='Concurrent pandoc conversions (default: number of CPUs)')
+    parser.add_argument('--pandoc-server', nargs='?', const=PANDOC_SERVER_URL, default=None, metavar='URL',
+                       help=f'Convert through a running pandoc-server (start one with `pandoc-server`) '
+                            f'instead of one pandoc process per file (default URL: {PANDOC_SERVER_URL})')
+    parser.add_argument('--batch-size', type=int, default=PANDOC_BATCH_SIZE,
+                       help=f'Files per pandoc-server request (default: {PANDOC_BATCH_SIZE})')
     
     args = parser.parse_args()
     
@@ -510,21 +799,33 @@ Examples:
         args.yml = args.html = args.md = True
     
     success = True
+    # One request per DOWNLOAD_DELAY per host, with a connection for every worker
+    client = HttpClient(timeout=REQUEST_TIMEOUT, rate=1 / DOWNLOAD_DELAY, pool_size=max(1, args.workers))
     
     print("FFIEC IT Booklets Manager")
     print("=" * 50)
     
     if args.yml:
-        success &= generate_yaml_file(YAML_FILE)
+        success &= generate_yaml_file(YAML_FILE, client)
         print()
     
     if args.html and success:
-        success &= download_html_files(YAML_FILE, HTML_OUTPUT_DIR)
+        # The in-process converter works on each page as it is filtered, saving a reparse
+        md_output_dir = MD_OUTPUT_DIR if args.md and args.converter == 'python' else None
+        success &= download_html_files(YAML_FILE, HTML_OUTPUT_DIR, client, args.workers,
+                                       MANIFEST_FILE, args.refresh, md_output_dir)
         print()
     
     if args.md and success:
-        success &= convert_to_markdown(HTML_OUTPUT_DIR, MD_OUTPUT_DIR)
+        success &= convert_to_markdown(HTML_OUTPUT_DIR, MD_OUTPUT_DIR, args.md_workers,
+                                       args.pandoc_server, max(1, args.batch_size), MANIFEST_FILE,
+                                       args.converter)
+        print()
+    
+    if client.stats.requests:
+        print(client.stats.summary())
         print()
+    client.close()
     
     if success:
         print("[OK] All operations completed successfully!")
@@ -12,25 +12,39 @@ Features:
 - Object-based deep links using PDF internal references
 - Section filtering with hierarchical navigation
 - Coordinate-based positioning for pixel-perfect navigation
+- Conditional (ETag/If-Modified-Since) and resumable PDF downloads
+- Optional per-control Markdown text extraction in a process pool
+- Offline verification of published deep links against the cached PDF
 - Robust error handling and logging
 
 Dependencies:
     pip install requests pypdf
+    http_client.py (shared HTTP client in this directory)
+    manifest.py (shared download manifest helper in this directory)
 """
 
 import argparse
+import hashlib
 import json
 import logging
+import multiprocessing
+import os
 import re
+import sys
+import time
 import urllib.parse
 import yaml
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import astuple, dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import requests
 from pypdf import PdfReader
 
+from http_client import HttpClient
+from manifest import read_manifest, write_manifest
+
 # Constants
 SCRIPT_DIR = Path(__file__).parent
 
@@ -62,13 +76,17 @@ class BookmarkInfo:
 class Config:
     """Configuration for the PDF processor."""
     filename_prefix: str
-    section_filter: str = "ALL"
+    section_filters: List[str] = field(default_factory=lambda: ["ALL"])
     force_download: bool = False
+    refresh: bool = False
+    command: str = "extract"
+    extract_text: bool = False
     debug: bool = False
     title_case: bool = False
     ignore_anonymous_sections: bool = False
-    leafs: bool = False
+    leaf_sections: List[str] = field(default_factory=list)
     leafs_section: str = ""
+    pdf_base_url: str = "https://nvlpubs.nist.gov/nistpubs"
 
     @property
     def document_type(self) -> str:
@@ -80,8 +98,8 @@ class Config:
     @property
     def pdf_url(self) -> str:
         """Construct PDF URL from filename prefix."""
-        base_url = "https://nvlpubs.nist.gov/nistpubs"
-        
+        base_url = self.pdf_base_url.rstrip('/')
+
         if '.SP.' in self.filename_prefix:
             return f"{base_url}/SpecialPublications/{self.filename_prefix}.pdf"
         elif '.AI.' in self.filename_prefix:
@@ -99,6 +117,21 @@ class Config:
     def pdf_filename(self) -> str:
         """Generate PDF filename from prefix."""
         return f"{self.filename_prefix}.pdf"
+
+    @property
+    def download_manifest_path(self) -> Path:
+        """Path of the sidecar manifest holding HTTP validators for the cached PDF."""
+        return self.output_dir / f"{self.filename_prefix}.download.json"
+
+    @property
+    def text_output_dir(self) -> Path:
+        """Directory for per-bookmark Markdown text extracted with --text."""
+        return self.output_dir / "markdown"
+
+    @property
+    def bookmark_cache_path(self) -> Path:
+        """Path of the extracted-bookmark cache stored next to the PDF."""
+        return self.output_dir / f"{self.filename_prefix}.bookmarks.json"
     
 
     
@@ -106,10 +139,20 @@ class Config:
         """Generate YAML filename from document type."""
         return f"{self.document_type}.yml"
     
+    def section_requests(self) -> List[Tuple[str, bool]]:
+        """Return (section name, leafs only) pairs for every requested section."""
+        return ([(name, False) for name in self.section_filters] +
+                [(name, True) for name in self.leaf_sections])
+
     @property
     def yaml_output_dir(self) -> Path:
         """Get YAML output directory (docs/_data)."""
         return SCRIPT_DIR / ".." / "docs" / "_data"
+
+    @property
+    def references_path(self) -> Path:
+        """Get the published reference data file (docs/_data/references/<document>.yml)."""
+        return SCRIPT_DIR / ".." / "docs" / "_data" / "references" / self.yaml_filename()
     
     def format_title(self, title: str) -> str:
         """Apply title case formatting to bookmark titles if enabled."""
@@ -163,6 +206,22 @@ class Config:
             leafs_section="2. Overview of Risks Unique to or Exacerbated by GAI"
         )
 
+    @classmethod
+    def all_documents(cls) -> Dict[str, 'Config']:
+        """Create one configuration per ``for_*`` factory, keyed by short document name.
+
+        A NIST publication added as a new ``for_*`` classmethod is picked up here
+        automatically, so it becomes a ``--document`` choice and joins ``--document all``.
+        """
+        # Inherited factories in definition order; getattr resolves a subclass's overrides
+        names = dict.fromkeys(name for klass in reversed(cls.__mro__) for name in vars(klass))
+        configs = {}
+        for name in names:
+            if name.startswith('for_'):
+                config = getattr(cls, name)()
+                configs[config.document_type.removeprefix('nist-')] = config
+        return configs
+
 
 class PDFProcessor:
     """Handles PDF downloading and parsing operations."""
@@ -170,31 +229,118 @@ class PDFProcessor:
     def __init__(self, config: Config):
         self.config = config
         self.logger = logging.getLogger(__name__)
+        self.client = HttpClient()
 
     def download_pdf(self) -> Path:
-        """Download PDF if not cached locally."""
+        """Download PDF if not cached locally, revalidating or resuming when possible.
+
+        Downloads are written to a ``.part`` file and renamed into place once
+        complete, so an interrupted download never leaves a truncated PDF behind.
+        The ETag and Last-Modified validators of each download are kept in a
+        sidecar manifest: a later ``refresh`` sends them as a conditional request,
+        and an interrupted download is resumed with an HTTP Range request.
+        """
         pdf_path = self.config.output_dir / self.config.pdf_filename
+        part_path = pdf_path.with_name(f"{pdf_path.name}.part")
         self.config.output_dir.mkdir(parents=True, exist_ok=True)
 
-        if pdf_path.exists() and not self.config.force_download:
+        if pdf_path.exists() and not (self.config.force_download or self.config.refresh):
             self.logger.info(f"Using cached PDF: {pdf_path}")
             return pdf_path
 
-        self.logger.info(f"Downloading PDF from {self.config.pdf_url}")
+        manifest_path = self.config.download_manifest_path
+        manifest = read_manifest(manifest_path)
+        if self.config.force_download:
+            manifest.pop("partial", None)
+            part_path.unlink(missing_ok=True)
+
+        headers = {}
+        resume_from = 0
+        partial = self._validators(manifest.get("partial"))
+        cached = self._validators(manifest.get("pdf"))
+        part_size = part_path.stat().st_size if part_path.exists() else 0
+        if part_size and (partial.get("etag") or partial.get("last_modified")):
+            resume_from = part_size
+            headers["Range"] = f"bytes={resume_from}-"
+            headers["If-Range"] = partial.get("etag") or partial["last_modified"]
+            # Byte offsets only line up with the PDF itself, never with a compressed copy
+            headers["Accept-Encoding"] = "identity"
+            self.logger.info(f"Resuming download of {self.config.pdf_url} at byte {resume_from}")
+        elif pdf_path.exists() and not self.config.force_download:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+            self.logger.info(f"Revalidating cached PDF against {self.config.pdf_url}")
+        else:
+            self.logger.info(f"Downloading PDF from {self.config.pdf_url}")
+
         try:
-            response = requests.get(self.config.pdf_url, stream=True, timeout=30)
-            response.raise_for_status()
-            
-            with open(pdf_path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
-            
-            self.logger.info(f"PDF saved to {pdf_path}")
-            return pdf_path
-            
+            response = self.client.get(self.config.pdf_url, headers=headers, stream=True)
+            with response:
+                if response.status_code == 304:
+                    self.logger.info(f"PDF not modified, using cached PDF: {pdf_path}")
+                    return pdf_path
+
+                if response.status_code == 416 and resume_from:
+                    # The partial file no longer lines up with the remote PDF
+                    return self._restart_download(part_path, manifest, "Partial download cannot be resumed")
+
+                response.raise_for_status()
+
+                validators = {
+                    "url": self.config.pdf_url,
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                }
+                if response.status_code == 206 and resume_from:
+                    range_start = self._content_range_start(response.headers.get("Content-Range"))
+                    if range_start != resume_from:
+                        return self._restart_download(
+                            part_path, manifest, f"Server resumed at byte {range_start}, not {resume_from}")
+                    mode = "ab"
+                else:
+                    # Full response: the server ignored the range or the PDF changed
+                    mode = "wb"
+                    resume_from = 0
+                    manifest["partial"] = validators
+                    write_manifest(manifest_path, manifest)
+
+                with open(part_path, mode) as f:
+                    for chunk in response.iter_content(chunk_size=8192):
+                        f.write(chunk)
+
         except requests.RequestException as e:
             raise RuntimeError(f"Failed to download PDF: {e}")
 
+        os.replace(part_path, pdf_path)
+        manifest["pdf"] = self._validators(manifest.pop("partial", None)) or validators
+        write_manifest(manifest_path, manifest)
+
+        self.logger.info(f"PDF saved to {pdf_path}")
+        return pdf_path
+
+    def _restart_download(self, part_path: Path, manifest: Dict[str, Any], reason: str) -> Path:
+        """Discard a partial download and download the PDF again from the start."""
+        self.logger.info(f"{reason}, restarting")
+        part_path.unlink(missing_ok=True)
+        manifest.pop("partial", None)
+        write_manifest(self.config.download_manifest_path, manifest)
+        return self.download_pdf()
+
+    @staticmethod
+    def _validators(entry: Any) -> Dict[str, Optional[str]]:
+        """Return a manifest entry's validators, or none if the entry is malformed."""
+        if not isinstance(entry, dict):
+            return {}
+        return {key: value for key, value in entry.items() if value is None or isinstance(value, str)}
+
+    @staticmethod
+    def _content_range_start(content_range: Optional[str]) -> Optional[int]:
+        """Return the first byte position of a ``bytes start-end/size`` Content-Range."""
+        match = re.match(r'bytes\s+(\d+)-\d+/(?:\d+|\*)$', (content_range or "").strip())
+        return int(match.group(1)) if match else None
+
     def load_pdf(self, pdf_path: Path) -> PdfReader:
         """Load PDF and return reader object."""
         try:
@@ -205,21 +351,38 @@ class PDFProcessor:
             raise RuntimeError(f"Failed to load PDF: {e}")
 
 
+def build_page_index(reader: PdfReader) -> Dict[Tuple[int, int], int]:
+    """Map each page's (object number, generation) to its 1-based page number."""
+    page_index = {}
+    for page_idx, page in enumerate(reader.pages):
+        ref = page.indirect_reference
+        if ref is not None:
+            page_index[(ref.idnum, ref.generation)] = page_idx + 1
+    return page_index
+
+
 class BookmarkExtractor:
     """Extracts and processes PDF bookmarks with coordinates."""
 
+    # Bump whenever a change alters the extracted BookmarkInfo values,
+    # so that bookmark caches written by older versions are ignored
+    VERSION = 1
+
     def __init__(self, config: Config):
         self.config = config
         self.logger = logging.getLogger(__name__)
+        self._page_index: Dict[Tuple[int, int], int] = {}
+        self._page_index_reader: Optional[PdfReader] = None
 
     def extract_bookmarks(self, reader: PdfReader) -> List[BookmarkInfo]:
         """Extract all bookmarks from PDF with full navigation hierarchy."""
-        if not reader.outline:
+        # reader.outline rebuilds the whole outline on every access, so read it once
+        outline = reader.outline
+        if not outline:
             self.logger.warning("No outline found in PDF")
             return []
 
-        # Use the simpler approach from V2 that works better with pypdf
-        bookmarks = self._extract_v2_recursive(reader.outline, reader)
+        bookmarks = list(self.iter_bookmarks(outline, reader))
         
         self.logger.info(f"Extracted {len(bookmarks)} bookmarks")
         
@@ -229,48 +392,54 @@ class BookmarkExtractor:
         
         return bookmarks
 
-    def _extract_v2_recursive(self, outline_items: Union[List, object], reader: PdfReader, level: int = 0) -> List[BookmarkInfo]:
-        """V2-style recursive extraction that handles pypdf children properly."""
-        bookmarks = []
-        
+    def iter_bookmarks(self, outline_items: Union[List, object], reader: PdfReader) -> Iterator[BookmarkInfo]:
+        """Yield bookmarks in document order by walking the outline with an explicit stack.
+
+        pypdf represents an outline as a list in which an item's children follow it as
+        a nested list. The walk keeps one iterator per open level instead of recursing,
+        so deep outlines cannot hit the recursion limit and no intermediate lists are
+        built; callers may stop consuming as soon as they have what they need.
+        """
         # Handle both single items and lists
         if not isinstance(outline_items, list):
             outline_items = [outline_items]
-        
-        for outline_item in outline_items:
-            # Extract current item
-            bookmark = self._extract_bookmark_info(outline_item, reader, level)
-            if bookmark:
-                bookmarks.append(bookmark)
-                
-                if self.config.debug:
-                    coords = f"@({bookmark.x_coord:.1f},{bookmark.y_coord:.1f})" if bookmark.has_coordinates else ""
-                    obj_ref = f"obj({bookmark.obj_num},{bookmark.obj_gen})" if bookmark.has_object_reference else ""
-                    self.logger.debug(f"{'  ' * level}{bookmark.title} -> Page {bookmark.page} {coords} {obj_ref}")
-            
-            # Process children - handle different child container types
-            children = None
-            if hasattr(outline_item, 'children') and outline_item.children:
-                children = outline_item.children
-            elif isinstance(outline_item, list):
-                children = outline_item
-            
-            if children:
-                try:
-                    # Convert children to list if it's an iterator or other type
-                    if hasattr(children, '__iter__') and not isinstance(children, (str, bytes)):
-                        children_list = list(children)
-                        if children_list:
-                            bookmarks.extend(self._extract_v2_recursive(children_list, reader, level + 1))
-                    else:
-                        bookmarks.extend(self._extract_v2_recursive([children], reader, level + 1))
-                except Exception as e:
-                    if self.config.debug:
-                        self.logger.warning(f"Error processing children at level {level}: {e}")
-        
-        return bookmarks
-
 
+        stack = [(iter(outline_items), 0)]
+        while stack:
+            items, level = stack[-1]
+            for outline_item in items:
+                # Extract current item
+                bookmark = self._extract_bookmark_info(outline_item, reader, level)
+                if bookmark:
+                    if self.config.debug:
+                        coords = f"@({bookmark.x_coord:.1f},{bookmark.y_coord:.1f})" if bookmark.has_coordinates else ""
+                        obj_ref = f"obj({bookmark.obj_num},{bookmark.obj_gen})" if bookmark.has_object_reference else ""
+                        self.logger.debug(f"{'  ' * level}{bookmark.title} -> Page {bookmark.page} {coords} {obj_ref}")
+                    yield bookmark
+
+                # Process children - handle different child container types
+                children = None
+                if hasattr(outline_item, 'children') and outline_item.children:
+                    children = outline_item.children
+                elif isinstance(outline_item, list):
+                    children = outline_item
+
+                if children:
+                    try:
+                        if hasattr(children, '__iter__') and not isinstance(children, (str, bytes)):
+                            child_items = iter(children)
+                        else:
+                            child_items = iter([children])
+                    except Exception as e:
+                        if self.config.debug:
+                            self.logger.warning(f"Error processing children at level {level}: {e}")
+                        continue
+
+                    # Descend; this level's iterator resumes once the children are done
+                    stack.append((child_items, level + 1))
+                    break
+            else:
+                stack.pop()
 
     def _extract_bookmark_info(self, outline_item: object, reader: PdfReader, level: int) -> Optional[BookmarkInfo]:
         """Extract detailed information from a single bookmark."""
@@ -296,10 +465,9 @@ class BookmarkExtractor:
                         bookmark.obj_gen = ref.generation
 
                 # Find page number
-                for page_idx, page in enumerate(reader.pages):
-                    if page == page_ref:
-                        bookmark.page = page_idx + 1
-                        break
+                if bookmark.obj_num is not None:
+                    page_index = self._get_page_index(reader)
+                    bookmark.page = page_index.get((bookmark.obj_num, bookmark.obj_gen or 0))
 
             # Extract coordinates from destination
             self._extract_coordinates(outline_item, bookmark)
@@ -309,6 +477,18 @@ class BookmarkExtractor:
 
         return bookmark
 
+    def _get_page_index(self, reader: PdfReader) -> Dict[Tuple[int, int], int]:
+        """Return the (object number, generation) -> page number index for a reader.
+
+        The index is built once per PdfReader so that resolving a bookmark's page
+        is a dictionary lookup instead of a scan over every page.
+        """
+        if self._page_index_reader is not reader:
+            self._page_index = build_page_index(reader)
+            self._page_index_reader = reader
+            self.logger.debug(f"Built page index with {len(self._page_index)} entries")
+        return self._page_index
+
     def _extract_coordinates(self, outline_item: object, bookmark: BookmarkInfo) -> None:
         """Extract coordinate information from outline item."""
         try:
@@ -334,6 +514,119 @@ class BookmarkExtractor:
             self.logger.debug(f"Could not extract coordinates for '{bookmark.title}': {e}")
 
 
+class BookmarkCache:
+    """Caches extracted bookmarks on disk, keyed by PDF content hash and extractor version."""
+
+    def __init__(self, config: Config):
+        self.config = config
+        self.logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def hash_pdf(pdf_path: Path) -> str:
+        """Return the sha256 hex digest of a PDF file."""
+        digest = hashlib.sha256()
+        with open(pdf_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def load(self, pdf_sha256: str) -> Optional[List[BookmarkInfo]]:
+        """Return cached bookmarks for the given PDF hash, or None on a cache miss."""
+        cache_path = self.config.bookmark_cache_path
+        if not cache_path.exists():
+            return None
+
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable bookmark cache {cache_path}: {e}")
+            return None
+
+        if not isinstance(data, dict):
+            self.logger.warning(f"Ignoring malformed bookmark cache {cache_path}: not a JSON object")
+            return None
+
+        if data.get("pdf_sha256") != pdf_sha256 or data.get("extractor_version") != BookmarkExtractor.VERSION:
+            self.logger.info("Bookmark cache is stale, re-extracting bookmarks")
+            return None
+
+        try:
+            bookmarks = [BookmarkInfo(*fields) for fields in data["bookmarks"]]
+        except (KeyError, TypeError) as e:
+            self.logger.warning(f"Ignoring malformed bookmark cache {cache_path}: {e}")
+            return None
+
+        self.logger.info(f"Loaded {len(bookmarks)} bookmarks from cache {cache_path}")
+        return bookmarks
+
+    def save(self, pdf_sha256: str, bookmarks: List[BookmarkInfo]) -> None:
+        """Write bookmarks to the cache for the given PDF hash."""
+        cache_path = self.config.bookmark_cache_path
+        data = {
+            "pdf_sha256": pdf_sha256,
+            "extractor_version": BookmarkExtractor.VERSION,
+            "bookmarks": [astuple(bm) for bm in bookmarks],
+        }
+        tmp_path = cache_path.with_name(f"{cache_path.name}.tmp")
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write a temporary file and rename it, so an interrupted run never leaves a truncated cache
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(',', ':'))
+            os.replace(tmp_path, cache_path)
+            self.logger.debug(f"Bookmark cache written to {cache_path}")
+        except OSError as e:
+            # The cache is an optimisation only; a failed write must not fail the run
+            self.logger.warning(f"Could not write bookmark cache {cache_path}: {e}")
+            tmp_path.unlink(missing_ok=True)
+
+
+@dataclass
+class SectionNode:
+    """A bookmark's position in the section tree."""
+    bookmark: BookmarkInfo
+    index: int
+    end: Optional[int] = None  # Index one past the last bookmark of the subtree, once known
+    is_leaf: bool = True
+
+
+class SectionTree:
+    """Section tree index over bookmarks in document order, built from bookmark levels.
+
+    Bookmarks are added one at a time. A node's subtree ends at the next bookmark
+    at the same or a higher level, and a node is a leaf unless the bookmark right
+    after it is deeper, so both are known in a single pass.
+    """
+
+    def __init__(self):
+        self.nodes: List[SectionNode] = []
+        self._open_nodes: List[SectionNode] = []
+
+    def add(self, bookmark: BookmarkInfo) -> SectionNode:
+        """Append a bookmark, closing every open subtree it ends."""
+        node = SectionNode(bookmark, len(self.nodes))
+        while self._open_nodes and self._open_nodes[-1].bookmark.level >= bookmark.level:
+            self._open_nodes.pop().end = node.index
+        if self._open_nodes:
+            self._open_nodes[-1].is_leaf = False
+        self._open_nodes.append(node)
+        self.nodes.append(node)
+        return node
+
+    def close(self) -> None:
+        """Close all subtrees still open at the end of the bookmarks."""
+        for node in self._open_nodes:
+            node.end = len(self.nodes)
+        self._open_nodes = []
+
+    def subtree(self, node: Optional[SectionNode] = None) -> List[SectionNode]:
+        """Return a node and its descendants, or every node when no node is given."""
+        if node is None:
+            return self.nodes
+        return self.nodes[node.index:node.end]
+
+
 class BookmarkFilter:
     """Filters bookmarks by section and other criteria."""
 
@@ -341,63 +634,53 @@ class BookmarkFilter:
         self.config = config
         self.logger = logging.getLogger(__name__)
 
-    def filter_by_section(self, bookmarks: List[BookmarkInfo]) -> List[BookmarkInfo]:
-        """Filter bookmarks by section name."""
-        filtered = []
-        in_target_section = self.config.section_filter.upper() == "ALL"
-        target_level = None
+    def filter_by_section(self, bookmarks: Iterable[BookmarkInfo]) -> List[BookmarkInfo]:
+        """Filter bookmarks to the requested sections in a single pass.
+
+        Each requested section selects the first bookmark whose title contains its
+        name (or every bookmark for "ALL") together with its descendants, or only the
+        leaves among them for leaf sections. Bookmarks are consumed in order and
+        iteration stops once every named section has ended, so bookmarks after the
+        last requested section are never added to the section tree.
+        """
+        requests = self.config.section_requests()
+        roots: Dict[str, Optional[SectionNode]] = {
+            name.upper(): None for name, _ in requests if name.upper() != "ALL"
+        }
+        select_all = any(name.upper() == "ALL" for name, _ in requests)
+        tree = SectionTree()
 
         for bookmark in bookmarks:
             # Skip anonymous sections if configured
             if self.config.ignore_anonymous_sections and self._is_anonymous_section(bookmark.title):
                 continue
 
-            if in_target_section:
-                # For specific section: include children until we hit another section at same/higher level
-                if self.config.section_filter.upper() == "ALL" or bookmark.level > target_level:
-                    filtered.append(bookmark)
-                else:
-                    # Hit another section at same/higher level, stop
-                    break
-            else:
-                # For specific section: check if this is our target section
-                if self.config.section_filter.upper() in bookmark.title.upper():
-                    in_target_section = True
-                    target_level = bookmark.level
-                    filtered.append(bookmark)
-
-        # Apply leafs filtering if enabled
-        if self.config.leafs:
-            filtered = self._filter_to_leaf_nodes(filtered)
-
-        self.logger.info(f"Filtered to {len(filtered)} bookmarks for section '{self.config.section_filter}'")
-        if self.config.leafs:
-            self.logger.info("Applied leaf node filtering")
-        return filtered
-
-    def _filter_to_leaf_nodes(self, bookmarks: List[BookmarkInfo]) -> List[BookmarkInfo]:
-        """Filter bookmarks to only include leaf nodes (nodes with no children)."""
-        leaf_bookmarks = []
-        
-        for i, bookmark in enumerate(bookmarks):
-            # Check if this bookmark has any children (next bookmark at deeper level)
-            is_leaf = True
-            for j in range(i + 1, len(bookmarks)):
-                next_bookmark = bookmarks[j]
-                if next_bookmark.level > bookmark.level:
-                    # Found a child, this is not a leaf
-                    is_leaf = False
-                    break
-                elif next_bookmark.level <= bookmark.level:
-                    # Found a sibling or parent, stop checking
-                    break
-            
-            if is_leaf:
-                leaf_bookmarks.append(bookmark)
-        
-        return leaf_bookmarks
+            node = tree.add(bookmark)
+            title = bookmark.title.upper()
+            for name, root in roots.items():
+                if root is None and name in title:
+                    roots[name] = node
+
+            # Every named section has been found and has ended, nothing more to read
+            if not select_all and all(root is not None and root.end is not None for root in roots.values()):
+                break
+        tree.close()
+
+        selected = [False] * len(tree.nodes)
+        for name, leafs_only in requests:
+            key = name.upper()
+            if key != "ALL" and roots[key] is None:
+                self.logger.warning(f"Section '{name}' not found")
+                continue
+            for node in tree.subtree(None if key == "ALL" else roots[key]):
+                if node.is_leaf or not leafs_only:
+                    selected[node.index] = True
 
+        filtered = [node.bookmark for node in tree.nodes if selected[node.index]]
 
+        descriptions = [f"'{name}'" + (" (leafs)" if leafs_only else "") for name, leafs_only in requests]
+        self.logger.info(f"Filtered to {len(filtered)} bookmarks for sections {', '.join(descriptions)}")
+        return filtered
 
     def _is_anonymous_section(self, title: str) -> bool:
         """Check if a section title is anonymous (just numbers/punctuation)."""
@@ -482,7 +765,7 @@ class YamlGenerator:
         
         for bookmark in bookmarks:
             # Generate normalized key from title
-            key = self._normalize_key(bookmark.title)
+            key = self.normalize_key(bookmark.title)
             if key:
                 result[key] = {
                     'title': self.config.format_title(bookmark.title),
@@ -491,7 +774,7 @@ class YamlGenerator:
         
         return result
 
-    def _normalize_key(self, title: str) -> str:
+    def normalize_key(self, title: str) -> str:
         """Normalize bookmark title to create YAML key."""
         # Extract section number if present (e.g., "2.1.", "AC-1", etc.)
         # Handle different patterns: "2.1. Title", "AC-1 Title", "2.10. Title"
@@ -534,6 +817,227 @@ class YamlGenerator:
 
 
 
+# The parent's PdfReader, inherited by forked text extraction workers so the PDF is loaded once
+_worker_reader: Optional[PdfReader] = None
+
+
+def _extract_page_range(page_range: Tuple[int, int]) -> List[Tuple[int, str]]:
+    """Extract the text of an inclusive range of 1-based page numbers using the inherited reader."""
+    first, last = page_range
+    return [(page_num, _worker_reader.pages[page_num - 1].extract_text() or "")
+            for page_num in range(first, last + 1)]
+
+
+class TextExtractor:
+    """Extracts the body text of each selected bookmark (e.g. each control) as Markdown."""
+
+    def __init__(self, config: Config):
+        self.config = config
+        self.logger = logging.getLogger(__name__)
+
+    def write_texts(self, reader: PdfReader, all_bookmarks: List[BookmarkInfo],
+                    selected: List[BookmarkInfo], link_generator: DeepLinkGenerator,
+                    yaml_generator: 'YamlGenerator') -> Path:
+        """Write one Markdown file per selected bookmark and return the output directory.
+
+        A bookmark's text runs from its own page to the page of the next bookmark in
+        the document, trimmed to start at its title and end before the next title.
+        Each page is extracted once, even when it is shared by several bookmarks.
+        """
+        output_dir = self.config.text_output_dir
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        ranges = self._page_ranges(len(reader.pages), all_bookmarks, selected)
+        pages = sorted({page for start, end, _ in ranges for page in range(start, end + 1)})
+
+        start_time = time.perf_counter()
+        page_texts = self.extract_pages(reader, pages)
+        elapsed = time.perf_counter() - start_time
+        rate = len(pages) / elapsed if elapsed else float('inf')
+        self.logger.info(f"Extracted text from {len(pages)} pages in {elapsed:.2f}s ({rate:.1f} pages/second)")
+
+        written = 0
+        used_keys = set()
+        for start, end, (bookmark, next_bookmark) in ranges:
+            key = yaml_generator.normalize_key(bookmark.title)
+            if not key:
+                continue
+            if key in used_keys:
+                # Two titles normalizing to the same key must not overwrite each other's file
+                suffix = 2
+                while f"{key}-{suffix}" in used_keys:
+                    suffix += 1
+                self.logger.warning(f"Key '{key}' of '{bookmark.title}' is already used; "
+                                    f"writing {key}-{suffix}.md instead")
+                key = f"{key}-{suffix}"
+            used_keys.add(key)
+            text = "\n".join(page_texts[page] for page in range(start, end + 1))
+            body = self._trim(text, bookmark.title, next_bookmark.title if next_bookmark else None)
+            title = self.config.format_title(bookmark.title)
+            url = link_generator.create_link(bookmark)
+            content = f"# {title}\n\nSource: <{url}>\n\n{body}\n"
+            (output_dir / f"{key}.md").write_text(content, encoding="utf-8")
+            written += 1
+
+        self.logger.info(f"Wrote {written} Markdown files to {output_dir}")
+        return output_dir
+
+    def _page_ranges(self, page_count: int, all_bookmarks: List[BookmarkInfo], selected: List[BookmarkInfo]
+                     ) -> List[Tuple[int, int, Tuple[BookmarkInfo, Optional[BookmarkInfo]]]]:
+        """Return (first page, last page, (bookmark, next bookmark)) for each selected bookmark."""
+        position = {id(bookmark): i for i, bookmark in enumerate(all_bookmarks)}
+
+        ranges = []
+        for bookmark in selected:
+            if not bookmark.page:
+                continue
+            next_bookmark = None
+            for i in range(position[id(bookmark)] + 1, len(all_bookmarks)):
+                if all_bookmarks[i].page:
+                    next_bookmark = all_bookmarks[i]
+                    break
+            end = next_bookmark.page if next_bookmark else page_count
+            ranges.append((bookmark.page, max(bookmark.page, end), (bookmark, next_bookmark)))
+        return ranges
+
+    def extract_pages(self, reader: PdfReader, pages: List[int]) -> Dict[int, str]:
+        """Extract page texts from an already loaded PDF, in a process pool when possible.
+
+        Workers are forked and inherit the reader, so the PDF is never opened again;
+        they are sent page ranges. Without fork (or with one CPU) pages are extracted
+        in this process.
+        """
+        if not pages:
+            return {}
+        workers = min(os.cpu_count() or 1, len(pages))
+        if workers <= 1 or 'fork' not in multiprocessing.get_all_start_methods():
+            return {page: reader.pages[page - 1].extract_text() or "" for page in pages}
+
+        # A few batches per worker keeps the pool balanced without per-page overhead
+        batch_size = max(1, len(pages) // (workers * 4))
+        page_ranges = []
+        for page in pages:
+            first, last = page_ranges[-1] if page_ranges else (None, None)
+            if last is not None and page == last + 1 and last - first + 1 < batch_size:
+                page_ranges[-1] = (first, page)
+            else:
+                page_ranges.append((page, page))
+
+        global _worker_reader
+        _worker_reader = reader
+        page_texts = {}
+        try:
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('fork')) as executor:
+                for results in executor.map(_extract_page_range, page_ranges):
+                    page_texts.update(results)
+        finally:
+            _worker_reader = None
+        return page_texts
+
+    @staticmethod
+    def _trim(text: str, title: str, next_title: Optional[str]) -> str:
+        """Cut text to start at the bookmark title and end before the next bookmark title."""
+        start = text.find(title)
+        if start == -1:
+            start = 0
+        if next_title:
+            end = text.find(next_title, start + len(title))
+            if end != -1:
+                text = text[:end]
+        return text[start:].strip()
+
+
+@dataclass
+class LinkCheck:
+    """Result of verifying one deep link against the cached PDF."""
+    key: str
+    title: str
+    url: str
+    page: Optional[int] = None
+    problem: str = ""
+
+    @property
+    def ok(self) -> bool:
+        """Check if the link resolved to a page containing its title."""
+        return not self.problem
+
+
+class DeepLinkVerifier:
+    """Verifies published deep links against the cached PDF without network access.
+
+    Object-reference links are resolved through the page index, so a link whose
+    {"num": obj_num} no longer points at the intended page after NIST republishes
+    the PDF is reported, as is any link whose page does not contain the entry title.
+    """
+
+    def __init__(self, config: Config):
+        self.config = config
+        self.logger = logging.getLogger(__name__)
+
+    def verify(self, reader: PdfReader) -> List[LinkCheck]:
+        """Check every entry of the document's reference data file."""
+        checks = [LinkCheck(key, info.get('title', ''), info.get('url', ''))
+                  for key, info in self._load_entries().items()]
+
+        page_index = build_page_index(reader)
+        page_count = len(reader.pages)
+        for check in checks:
+            check.page, check.problem = self._resolve_page(check.url, page_index, page_count)
+
+        # Extract each linked page once, however many links point at it
+        pages = sorted({check.page for check in checks if check.page})
+        page_texts = TextExtractor(self.config).extract_pages(reader, pages)
+        normalized_pages = {page: self._normalize(text) for page, text in page_texts.items()}
+
+        for check in checks:
+            if check.ok and self._normalize(check.title) not in normalized_pages[check.page]:
+                check.problem = f"title not found on page {check.page}"
+
+        return checks
+
+    def _load_entries(self) -> Dict[str, Dict[str, str]]:
+        """Load the entries mapping from the reference data file."""
+        references_path = self.config.references_path
+        try:
+            with open(references_path, 'r', encoding='utf-8') as f:
+                data = yaml.safe_load(f) or {}
+        except (OSError, yaml.YAMLError) as e:
+            raise RuntimeError(f"Failed to read {references_path}: {e}")
+        return data.get('entries') or {}
+
+    def _resolve_page(self, url: str, page_index: Dict[Tuple[int, int], int],
+                      page_count: int) -> Tuple[Optional[int], str]:
+        """Resolve a deep link to a 1-based page number, or explain why it cannot be."""
+        base_url, _, fragment = url.partition('#')
+        if base_url != self.config.pdf_url:
+            return None, "link does not point at this PDF"
+        if not fragment:
+            return None, "link has no page destination"
+
+        if fragment.startswith('page='):
+            page_part = fragment[len('page='):].split('&', 1)[0]
+            if not page_part.isdigit() or not 1 <= int(page_part) <= page_count:
+                return None, f"page {page_part} is out of range"
+            return int(page_part), ""
+
+        try:
+            dest_array = json.loads(urllib.parse.unquote(fragment))
+            ref = dest_array[0]
+            key = (int(ref['num']), int(ref.get('gen', 0)))
+        except (ValueError, TypeError, KeyError, IndexError, AttributeError):
+            return None, "unrecognised destination"
+
+        page = page_index.get(key)
+        if page is None:
+            return None, f"object {key[0]} is not a page"
+        return page, ""
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        """Reduce text to lowercase alphanumerics so line breaks and title case do not matter."""
+        return re.sub(r'[^0-9a-z]+', '', text.casefold())
+
+
 class NISTProcessor:
     """Main orchestrator for NIST document processing workflow."""
 
@@ -544,31 +1048,83 @@ class NISTProcessor:
         # Initialize components
         self.pdf_processor = PDFProcessor(config)
         self.bookmark_extractor = BookmarkExtractor(config)
+        self.bookmark_cache = BookmarkCache(config)
         self.bookmark_filter = BookmarkFilter(config)
         self.link_generator = DeepLinkGenerator(config)
 
         self.yaml_generator = YamlGenerator(config)
+        self.text_extractor = TextExtractor(config)
 
     def process(self) -> Path:
         """Execute the complete processing workflow."""
-        doc_name = "NIST AI 600-1" if self.config.document_type == "ai-600-1" else "NIST SP 800-53r5"
-        self.logger.info(f"Starting {doc_name} processing for section: {self.config.section_filter}")
+        doc_name = self.config.filename_prefix.replace('.', ' ')
+        sections = ", ".join(name for name, _ in self.config.section_requests())
+        self.logger.info(f"Starting {doc_name} processing for sections: {sections}")
         
-        # Download and load PDF
+        # Download PDF
         pdf_path = self.pdf_processor.download_pdf()
-        reader = self.pdf_processor.load_pdf(pdf_path)
-        
-        # Extract and filter bookmarks
-        all_bookmarks = self.bookmark_extractor.extract_bookmarks(reader)
+
+        # Extract bookmarks, skipping pypdf entirely when the cache matches this PDF
+        # and no text is wanted; otherwise the PDF is loaded once for both
+        reader = self.pdf_processor.load_pdf(pdf_path) if self.config.extract_text else None
+        all_bookmarks = self._load_bookmarks(pdf_path, reader)
+
+        # Filter bookmarks. The filter gets the full list rather than the lazy walk:
+        # the bookmark cache and the text extraction both need every bookmark anyway
         filtered_bookmarks = self.bookmark_filter.filter_by_section(all_bookmarks)
         
         # Generate YAML output
         yaml_content = self.yaml_generator.generate_yaml(filtered_bookmarks, self.link_generator)
         output_path = self.yaml_generator.write_to_file(yaml_content)
-        
+
+        # Extract body text of the selected bookmarks
+        if self.config.extract_text:
+            self.text_extractor.write_texts(reader, all_bookmarks, filtered_bookmarks,
+                                            self.link_generator, self.yaml_generator)
+
+        if self.pdf_processor.client.stats.requests:
+            self.logger.info(self.pdf_processor.client.stats.summary())
         self.logger.info("Processing completed successfully")
         return output_path
 
+    def verify(self) -> Tuple[int, int]:
+        """Verify published deep links against the cached PDF; return (checked, failed)."""
+        doc_name = self.config.filename_prefix.replace('.', ' ')
+        self.logger.info(f"Verifying {doc_name} links in {self.config.references_path}")
+
+        # Verification is offline: it checks the local copy and never downloads
+        pdf_path = self.config.output_dir / self.config.pdf_filename
+        if not pdf_path.exists():
+            document = self.config.document_type.removeprefix('nist-')
+            raise FileNotFoundError(f"No cached PDF at {pdf_path}; run "
+                                    f"'extract --document {document}' first to download it")
+        reader = self.pdf_processor.load_pdf(pdf_path)
+
+        start_time = time.perf_counter()
+        checks = DeepLinkVerifier(self.config).verify(reader)
+        elapsed = time.perf_counter() - start_time
+
+        failures = [check for check in checks if not check.ok]
+        for check in failures:
+            self.logger.warning(f"{check.key} ({check.title}): {check.problem}")
+        self.logger.info(f"Verified {len(checks)} links in {elapsed:.2f}s, {len(failures)} failed")
+        return len(checks), len(failures)
+
+    def _load_bookmarks(self, pdf_path: Path, reader: Optional[PdfReader] = None) -> List[BookmarkInfo]:
+        """Return all bookmarks for the PDF, from the cache when possible.
+
+        The PDF is only loaded on a cache miss, unless an already loaded reader is passed.
+        """
+        pdf_sha256 = self.bookmark_cache.hash_pdf(pdf_path)
+        bookmarks = self.bookmark_cache.load(pdf_sha256)
+        if bookmarks is not None:
+            return bookmarks
+
+        reader = reader or self.pdf_processor.load_pdf(pdf_path)
+        bookmarks = self.bookmark_extractor.extract_bookmarks(reader)
+        self.bookmark_cache.save(pdf_sha256, bookmarks)
+        return bookmarks
+
 
 def setup_logging(debug: bool = False) -> None:
     """Configure logging with appropriate level and format."""
@@ -582,8 +1138,34 @@ def setup_logging(debug: bool = False) -> None:
     )
 
 
-def parse_arguments() -> Config:
-    """Parse command line arguments and return configuration."""
+def run_processor(config: Config) -> Path:
+    """Process a single document; module-level so it can run in a worker process."""
+    return NISTProcessor(config).process()
+
+
+def process_documents(configs: List[Config]) -> List[Path]:
+    """Process several documents in a process pool, returning output paths in input order."""
+    debug = any(config.debug for config in configs)
+    max_workers = min(len(configs), os.cpu_count() or 1)
+    output_paths = []
+    errors = []
+
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=setup_logging, initargs=(debug,)) as executor:
+        futures = [executor.submit(run_processor, config) for config in configs]
+        # Collect in submission order so reporting does not depend on completion order
+        for config, future in zip(configs, futures):
+            try:
+                output_paths.append(future.result())
+            except Exception as e:
+                errors.append(f"{config.filename_prefix}: {e}")
+
+    if errors:
+        raise RuntimeError("; ".join(errors))
+    return output_paths
+
+
+def parse_arguments() -> List[Config]:
+    """Parse command line arguments and return one configuration per selected document."""
     parser = argparse.ArgumentParser(
         description="Extract NIST document bookmarks as YAML data",
         formatter_class=argparse.ArgumentDefaultsHelpFormatter,
@@ -595,25 +1177,55 @@ Examples:
   %(prog)s --document sp-800-53r5 --leafs                  # Extract only leaf nodes from THE CONTROLS
   %(prog)s --document ai-600-1 --leafs                     # Extract leaf nodes from AI document
   %(prog)s --document sp-800-53r5 --force-download --debug # Force re-download with debug
+  %(prog)s --document sp-800-53r5 --refresh                # Re-download only if NIST changed the PDF
+  %(prog)s --document all --leafs                          # Process every NIST document in parallel
+  %(prog)s --document sp-800-53r5 --document ai-600-1      # Process selected documents in parallel
+  %(prog)s --document sp-800-53r5 --section "APPENDIX A" --leafs "THE CONTROLS"
+                                                           # Whole appendix plus control leafs in one pass
+  %(prog)s --document sp-800-53r5 --section "APPENDIX A" --leafs
+                                                           # Bare --leafs overrides --section: control leafs only
+  %(prog)s --document sp-800-53r5 --leafs --text           # Also write each control's text as Markdown
+  %(prog)s verify                                          # Check published links against the cached PDFs
         """
     )
     
+    documents = Config.all_documents()
+    parser.add_argument(
+        'command',
+        nargs='?',
+        choices=['extract', 'verify'],
+        default='extract',
+        help='"extract" generates YAML from the PDF; "verify" checks the URLs in '
+             'docs/_data/references/nist-*.yml against the cached PDF'
+    )
     parser.add_argument(
         '--document',
-        choices=['sp-800-53r5', 'ai-600-1'],
-        required=True,
-        help='NIST document to process'
+        choices=[*documents, 'all'],
+        action='append',
+        help='NIST document to process; repeat or use "all" to process several in parallel '
+             '(required for extract, defaults to all for verify)'
     )
     parser.add_argument(
-        '--section', 
-        default='ALL',
-        help='Section to extract. Use "ALL" for all sections'
+        '--section',
+        action='append',
+        help='Section to extract; repeat to extract several. Use "ALL" for all sections '
+             '(the default unless --leafs is given)'
     )
     parser.add_argument(
         '--force-download',
         action='store_true',
         help='Force re-download of PDF even if cached locally'
     )
+    parser.add_argument(
+        '--refresh',
+        action='store_true',
+        help='Revalidate the cached PDF with ETag/If-Modified-Since and resume partial downloads'
+    )
+    parser.add_argument(
+        '--text',
+        action='store_true',
+        help='Also extract the text of each selected bookmark as Markdown under _refs-markdown/<document>/markdown'
+    )
     parser.add_argument(
         '--debug',
         action='store_true', 
@@ -623,52 +1235,90 @@ Examples:
 
     parser.add_argument(
         '--leafs',
-        action='store_true',
-        help='Extract only leaf nodes from the document-specific leafs section'
+        action='append',
+        nargs='?',
+        const='',
+        metavar='SECTION',
+        help='Extract only leaf nodes of SECTION, or of the document-specific leafs section '
+             'when no SECTION is given; repeat to extract leafs of several sections. '
+             'A bare --leafs extracts leaf nodes only and overrides --section'
     )
 
     
     args = parser.parse_args()
-    
-    # Create appropriate config based on document type
-    if args.document == 'ai-600-1':
-        config = Config.for_ai_600_1()
+
+    if not args.document:
+        if args.command != 'verify':
+            parser.error("the following arguments are required: --document")
+        args.document = ['all']
+
+    # Create appropriate configs based on document type, keeping first-seen order
+    if 'all' in args.document:
+        selected = list(documents)
     else:
-        config = Config.for_sp_800_53r5()
-    
-    # Override with command line arguments
-    config.section_filter = args.section
-    config.force_download = args.force_download
-    config.debug = args.debug
+        selected = list(dict.fromkeys(args.document))
 
-    config.leafs = args.leafs
-    
-    # When leafs mode is enabled, override section filter to use leafs_section
-    if config.leafs:
-        config.section_filter = config.leafs_section
-    
+    configs = []
+    for document in selected:
+        config = documents[document]
 
-    
-    return config
+        # Override with command line arguments
+        config.command = args.command
+        config.force_download = args.force_download
+        config.refresh = args.refresh
+        config.extract_text = args.text
+        config.debug = args.debug
+
+        # A bare --leafs selects the leafs of the document-specific leafs section
+        config.leaf_sections = [name or config.leafs_section for name in args.leafs or []]
+
+        # Leafs mode replaces the default "ALL" section filter. A bare --leafs also
+        # replaces any --section, as it always has: the output is leaf nodes only
+        if args.section and '' not in (args.leafs or []):
+            config.section_filters = args.section
+        elif config.leaf_sections:
+            config.section_filters = []
+
+        configs.append(config)
+
+    return configs
 
 
 def main() -> None:
     """Main entry point."""
-    config = None
+    configs = []
     try:
-        config = parse_arguments()
-        setup_logging(config.debug)
-        
-        processor = NISTProcessor(config)
-        output_path = processor.process()
-        
-        print(f"Successfully generated: {output_path}")
-        
+        configs = parse_arguments()
+        setup_logging(any(config.debug for config in configs))
+
+        if configs[0].command == 'verify':
+            failed = 0
+            for config in configs:
+                try:
+                    checked, failures = NISTProcessor(config).verify()
+                except FileNotFoundError as e:
+                    print(f"Error: {e}")
+                    failed += 1
+                    continue
+                print(f"{config.references_path.name}: {checked - failures}/{checked} links verified")
+                failed += failures
+            if failed:
+                sys.exit(1)
+            return
+
+        if len(configs) == 1:
+            output_paths = [NISTProcessor(configs[0]).process()]
+        else:
+            output_paths = process_documents(configs)
+
+        for output_path in output_paths:
+            print(f"Successfully generated: {output_path}")
+
     except KeyboardInterrupt:
         print("\nProcessing interrupted by user")
     except Exception as e:
         print(f"Error: {e}")
-        if config and config.debug:
+        if any(config.debug for config in configs):
             raise
 
 
@@ -16,23 +16,30 @@ SUPPORTED PROJECTS:
 
 FEATURES:
     - Configuration-driven approach for easy extensibility
-    - Downloads and caches markdown content locally
+    - Downloads each project's files as one repository tarball, extracted in memory
+    - Caches markdown content locally, keyed by the branch head commit SHA and each
+      file's git blob SHA, so refreshes only rewrite files that changed upstream
     - Generates YAML data with normalized keys for Jekyll integration
     - Handles different metadata extraction methods (headings vs YAML frontmatter)
     - Supports different file filtering patterns and URL generation
 
 OUTPUT FILES:
     - _refs-markdown/owasp-{project}_{year}/: Downloaded markdown files
+    - _refs-markdown/owasp-{project}_{year}/manifest.json: Commit and blob SHAs of the cached files
     - docs/_data/owasp-{project}.yml: YAML data for Jekyll integration
 
 DEPENDENCIES:
-    - requests: HTTP client for downloading content
+    - requests: HTTP client for downloading content (via the shared http_client.py)
     - pyyaml: YAML file generation
+    - manifest.py: cache manifest reading and writing (shared helper in this directory)
 
 USAGE:
-    python dl_owasp.py [project]
+    python dl_owasp.py [project] [--force] [--github-api URL]
     
     project: llm, ml, or all (default: all)
+    --force: Download every file again, ignoring the cached commit and blob SHAs
+    --github-api: GitHub API base URL (default: https://api.github.com), e.g. a local
+                  server serving fixture tarballs for testing
 
 EXAMPLES:
     # Download all OWASP projects
@@ -53,16 +60,31 @@ LAST UPDATED:
 
 import os
 import sys
-import json
-import time
+import hashlib
+import posixpath
+import tarfile
 import requests
 import argparse
 from pathlib import Path
 import yaml
 import re
 
+from http_client import HttpClient
+from manifest import read_manifest, write_manifest
+
 # Constants
 SCRIPT_DIR = Path(__file__).parent
+REQUEST_TIMEOUT = 30
+REQUESTS_PER_SECOND = 2  # Per host, to avoid GitHub rate limiting
+GITHUB_API_URL = "https://api.github.com"
+# Redirects to a codeload.github.com tarball of the ref, with files under "<repo>-<sha>/"
+TARBALL_URL_TEMPLATE = "{api_url}/repos/OWASP/{repo}/tarball/{ref}"
+COMMIT_URL_TEMPLATE = "{api_url}/repos/OWASP/{repo}/commits/{ref}"
+CONTENTS_URL_TEMPLATE = "{api_url}/repos/OWASP/{repo}/contents/{subdir}"
+# Limits on a project tarball, so a wrong URL or a hostile server cannot exhaust memory or disk
+MAX_ARCHIVE_BYTES = 200 * 1024 * 1024  # Compressed bytes read from the response
+MAX_ARCHIVE_UNPACKED_BYTES = 1024 * 1024 * 1024  # Total size of the members
+MAX_ARCHIVE_MEMBERS = 50_000
 
 # Project configurations
 OWASP_PROJECTS = {
@@ -94,68 +116,184 @@ def get_paths(project_name, config):
     """Calculate all file and directory paths based on script directory and project config."""
     return {
         'output_dir': SCRIPT_DIR / ".." / f"_refs-markdown/owasp-{project_name}_{config['year']}",
+        'manifest_file': SCRIPT_DIR / ".." / f"_refs-markdown/owasp-{project_name}_{config['year']}" / "manifest.json",
         'data_file': SCRIPT_DIR / ".." / "docs" / "_data" / f"owasp-{project_name}.yml"
     }
 
 
-def download_project_files(project_name, config):
-    """Download OWASP project markdown files and generate data file."""
+def git_blob_sha(data):
+    """Return the git blob SHA of file contents, as the contents API reports it."""
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+def write_bytes_atomically(file_path, data):
+    """Replace a file's content via a temporary file, so readers never see a partial write."""
+    tmp_file = file_path.with_name(f"{file_path.name}.tmp")
+    try:
+        tmp_file.write_bytes(data)
+        os.replace(tmp_file, file_path)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
+
+
+def fetch_head_commit(config, client, api_url=GITHUB_API_URL):
+    """Return the SHA of the head commit of the project's configured branch."""
+    url = COMMIT_URL_TEMPLATE.format(api_url=api_url.rstrip('/'), repo=config['repo'], ref=config['branch'])
+    # This media type returns just the SHA rather than the full commit
+    response = client.get(url, headers={'Accept': 'application/vnd.github.sha'})
+    response.raise_for_status()
+    return response.text.strip()
+
+
+def fetch_file_list(config, client, api_url=GITHUB_API_URL, ref=None):
+    """Return the blob SHA of every matching markdown file in the project's subdirectory, keyed by filename."""
+    url = CONTENTS_URL_TEMPLATE.format(api_url=api_url.rstrip('/'), repo=config['repo'], subdir=config['subdir'])
+    response = client.get(url, params={"ref": ref or config['branch']})
+    response.raise_for_status()
+    
+    pattern = re.compile(config['filter_pattern'])
+    return {f["name"]: f["sha"] for f in response.json()
+            if f.get("type", "file") == "file" and f["name"].endswith(".md") and pattern.match(f["name"])}
+
+
+class LimitedReader:
+    """File-like wrapper raising ValueError once more than `limit` bytes have been read."""
+    
+    def __init__(self, fileobj, limit):
+        self.fileobj = fileobj
+        self.limit = limit
+        self.bytes_read = 0
+    
+    def read(self, size=-1):
+        # Never ask for more than one byte past the limit, so an oversized stream is not buffered whole
+        allowed = self.limit - self.bytes_read + 1
+        data = self.fileobj.read(allowed if size is None or size < 0 else min(size, allowed))
+        self.bytes_read += len(data)
+        if self.bytes_read > self.limit:
+            raise ValueError(f"archive is larger than {self.limit} bytes")
+        return data
+
+
+def fetch_project_archive(config, client, api_url=GITHUB_API_URL, ref=None, max_bytes=MAX_ARCHIVE_BYTES,
+                          max_unpacked_bytes=MAX_ARCHIVE_UNPACKED_BYTES, max_members=MAX_ARCHIVE_MEMBERS):
+    """Fetch the project's subdirectory as one tarball and return its matching files.
+    
+    The tarball of `ref` (default: the configured branch) is streamed and
+    extracted in memory; only markdown files directly in `subdir` whose name
+    matches `filter_pattern` are kept. Reading stops with an error once the
+    response exceeds `max_bytes`, the members' total size exceeds
+    `max_unpacked_bytes` or the archive has more than `max_members` members.
+    
+    Returns:
+        dict: File contents as bytes keyed by filename
+    
+    Raises:
+        requests.RequestException: If the tarball cannot be downloaded
+        tarfile.TarError: If the response is not a valid gzipped tarball
+        ValueError: If the tarball exceeds one of the limits
+    """
+    url = TARBALL_URL_TEMPLATE.format(api_url=api_url.rstrip('/'), repo=config['repo'], ref=ref or config['branch'])
+    pattern = re.compile(config['filter_pattern'])
+    files = {}
+    unpacked_bytes = 0
+    
+    with client.get(url, stream=True) as response:
+        response.raise_for_status()
+        response.raw.decode_content = True  # Undo any transfer compression; the tarball itself stays gzipped
+        content_length = response.headers.get('Content-Length', '')
+        if content_length.isdigit() and int(content_length) > max_bytes:
+            raise ValueError(f"archive is larger than {max_bytes} bytes ({content_length} bytes)")
+        
+        # Stream mode reads members in order without seeking back
+        with tarfile.open(fileobj=LimitedReader(response.raw, max_bytes), mode='r|gz') as archive:
+            for count, member in enumerate(archive, 1):
+                if count > max_members:
+                    raise ValueError(f"archive has more than {max_members} members")
+                unpacked_bytes += member.size
+                if unpacked_bytes > max_unpacked_bytes:
+                    raise ValueError(f"archive unpacks to more than {max_unpacked_bytes} bytes")
+                if not member.isfile():
+                    continue
+                # Member names start with a "<repo>-<sha>/" directory
+                path = member.name.split('/', 1)[-1]
+                filename = posixpath.basename(path)
+                if posixpath.dirname(path) != config['subdir'].strip('/'):
+                    continue
+                if not (filename.endswith('.md') and pattern.match(filename)):
+                    continue
+                files[filename] = archive.extractfile(member).read()
+    
+    return files
+
+
+def download_project_files(project_name, config, client, api_url=GITHUB_API_URL, force=False):
+    """Download OWASP project markdown files and generate data file.
+    
+    The manifest records the branch head commit and the blob SHA of every cached
+    file. A refresh first asks for the head commit; if it is unchanged nothing
+    else is fetched. Otherwise the subdirectory listing gives the current blob
+    SHAs, and only when a file changed is the tarball fetched. Once every changed
+    file in it matches its blob SHA, only the changed files are rewritten. The data file is regenerated only when a
+    file changed or it is missing.
+    """
     
     paths = get_paths(project_name, config)
     output_dir = paths['output_dir']
     output_dir.mkdir(parents=True, exist_ok=True)
+    manifest = {} if force else read_manifest(paths['manifest_file'])
+    cached_files = manifest.get('files', {})
     
-    # Get file list from GitHub API
-    print(f"Fetching {project_name.upper()} file list from GitHub API for year {config['year']}...")
-    api_url = f"https://api.github.com/repos/OWASP/{config['repo']}/contents/{config['subdir']}"
+    def is_cached(filename, blob_sha):
+        return cached_files.get(filename) == blob_sha and (output_dir / filename).exists()
     
+    changed = []
+    contents = {}
     try:
-        response = requests.get(api_url, params={"ref": config['branch']})
-        response.raise_for_status()
-        files = response.json()
-    except requests.RequestException as e:
-        print(f"Error fetching {project_name.upper()} file list: {e}")
+        print(f"Checking {project_name.upper()} {config['branch']} head commit for year {config['year']}...")
+        commit = fetch_head_commit(config, client, api_url)
+        
+        if commit == manifest.get('commit') and all(is_cached(name, sha) for name, sha in cached_files.items()):
+            print(f"Up to date at {commit[:12]}")
+            upstream_files = cached_files
+        else:
+            upstream_files = fetch_file_list(config, client, api_url, commit)
+            changed = sorted(name for name, sha in upstream_files.items() if not is_cached(name, sha))
+            if changed:
+                print(f"Downloading {project_name.upper()} tarball at {commit[:12]} for {len(changed)} changed files...")
+                contents = fetch_project_archive(config, client, api_url, commit)
+    except (requests.RequestException, tarfile.TarError, ValueError, KeyError) as e:
+        print(f"Error downloading {project_name.upper()} files: {e}")
         return []
     
-    # Filter for markdown files using project-specific pattern
-    pattern = re.compile(config['filter_pattern'])
-    md_files = [f for f in files if f["name"].endswith(".md") and pattern.match(f["name"])]
+    # Check the whole archive against the listing before writing any file
+    for filename in changed:
+        content = contents.get(filename)
+        if content is None or git_blob_sha(content) != upstream_files[filename]:
+            print(f"Error: {filename} in tarball does not match blob {upstream_files[filename]}")
+            return []
     
-    # Download each markdown file
-    print(f"Downloading {project_name.upper()} markdown files...")
-    downloaded_files = []
+    for filename in changed:
+        print(f"Writing {filename}...")
+        write_bytes_atomically(output_dir / filename, contents[filename])
     
-    for file_info in md_files:
-        filename = file_info["name"]
-        file_path = file_info["path"]
-        output_file = output_dir / filename
-        
-        # Skip download if file already exists
-        if output_file.exists():
-            print(f"Skipping {filename} (already exists)...")
-            downloaded_files.append(filename)
-            continue
-        
-        raw_url = f"https://raw.githubusercontent.com/OWASP/{config['repo']}/{config['branch']}/{file_path}"
-        
-        try:
-            print(f"Downloading {filename}...")
-            response = requests.get(raw_url)
-            response.raise_for_status()
-            
-            output_file.write_text(response.text, encoding='utf-8')
-            downloaded_files.append(filename)
-            
-            # Small delay to avoid rate limiting
-            time.sleep(0.5)
-            
-        except requests.RequestException as e:
-            print(f"Error downloading {filename}: {e}")
+    # Drop files removed upstream
+    removed = sorted(set(cached_files) - set(upstream_files))
+    for filename in removed:
+        print(f"Removing {filename} (no longer upstream)...")
+        (output_dir / filename).unlink(missing_ok=True)
     
-    print(f"Done! Downloaded {len(downloaded_files)} .md files for {project_name.upper()} {config['year']} to {output_dir}/")
+    write_manifest(paths['manifest_file'], {'branch': config['branch'], 'commit': commit, 'files': upstream_files})
     
-    # Generate data file
-    generate_data_file(project_name, config, downloaded_files)
+    downloaded_files = sorted(upstream_files)
+    print(f"Done! {len(downloaded_files)} .md files for {project_name.upper()} {config['year']} in {output_dir}/ "
+          f"({len(changed)} updated, {len(removed)} removed)")
+    
+    # Generate data file only when its inputs changed
+    if changed or removed or not paths['data_file'].exists():
+        generate_data_file(project_name, config, downloaded_files)
+    else:
+        print(f"{paths['data_file']} is up to date")
     return downloaded_files
 
 
@@ -301,6 +439,10 @@ def main():
     parser.add_argument('project', nargs='?', default='all', 
                         choices=['llm', 'ml', 'all'],
                         help='OWASP project to download (default: all)')
+    parser.add_argument('--force', action='store_true',
+                        help='Download every file again, ignoring the cached commit and blob SHAs')
+    parser.add_argument('--github-api', default=GITHUB_API_URL, metavar='URL',
+                        help=f'GitHub API base URL (default: {GITHUB_API_URL})')
     args = parser.parse_args()
     
     # Determine which projects to process
@@ -311,14 +453,16 @@ def main():
     
     # Process each selected project
     total_files = 0
-    for project_name in projects_to_process:
-        config = OWASP_PROJECTS[project_name]
-        print(f"\n=== Processing OWASP {project_name.upper()} ===")
-        files = download_project_files(project_name, config)
-        total_files += len(files)
+    with HttpClient(timeout=REQUEST_TIMEOUT, rate=REQUESTS_PER_SECOND) as client:
+        for project_name in projects_to_process:
+            config = OWASP_PROJECTS[project_name]
+            print(f"\n=== Processing OWASP {project_name.upper()} ===")
+            files = download_project_files(project_name, config, client, args.github_api, args.force)
+            total_files += len(files)
     
     print(f"\n=== Summary ===")
     print(f"Total files processed across all projects: {total_files}")
+    print(client.stats.summary())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Shared HTML Parsing Helper
+
+Builds BeautifulSoup trees for the dl_*.py scripts with the fastest parser available:
+lxml when it is installed, Python's built-in html.parser otherwise.
+
+Scripts that only read a few parts of a page (a menu, table of contents entries)
+pass a SoupStrainer so that only the matching elements and their content are
+turned into a tree; everything else is skipped while parsing. Scripts that
+rewrite whole pages parse without one.
+
+Scripts that can read a page in one pass use parse_events instead, which streams
+start/data/end events to a target object without building any tree. It always
+uses html.parser, nesting elements as BeautifulSoup's html.parser builder does, so
+its events do not depend on whether lxml is installed: lxml's HTML parser nests
+invalid markup differently (e.g. it closes a <p> on meeting a <div> inside it).
+
+Usage:
+    from html_parsing import class_strainer, parse_events, parse_html
+
+    soup = parse_html(html)
+    menu = parse_html(html, parse_only=class_strainer('menu-container'))
+    result = parse_events(html, target)  # target has start, data, end and close methods
+
+Dependencies:
+    pip install beautifulsoup4
+    pip install lxml (optional extra, faster parse_html trees)
+"""
+
+import html
+from html.parser import HTMLParser
+from importlib.util import find_spec
+from typing import Any, Optional, Union
+
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.dammit import EntitySubstitution
+
+PARSER = 'lxml' if find_spec('lxml') is not None else 'html.parser'
+
+# Elements html.parser never sees closed; BeautifulSoup closes them immediately
+VOID_ELEMENTS = {
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'keygen', 'link', 'menuitem',
+    'meta', 'param', 'source', 'track', 'wbr',
+}
+
+
+def parse_html(markup: Union[str, bytes], parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    """Parse HTML with the preferred parser, optionally keeping only strained elements."""
+    return BeautifulSoup(markup, PARSER, parse_only=parse_only)
+
+
+def class_strainer(*classes: str) -> SoupStrainer:
+    """Return a strainer keeping elements that carry any of the given CSS classes."""
+    return SoupStrainer(attrs={'class': list(classes)})
+
+
+def parse_events(markup: str, target: Any) -> Any:
+    """Stream a page's parse events to a target object, building no tree.
+
+    The target receives start(tag, attrs) with attrs as a dict, data(text) and
+    end(tag) calls, nested as BeautifulSoup's html.parser builder nests them
+    (whichever parser parse_html uses), and finally close(), whose return value
+    is returned. Each data call carries one whole string of that tree: text is
+    split where a tag, comment, declaration or processing instruction
+    interrupts it, and the comments, declarations and instructions themselves
+    are not passed on. CDATA sections arrive as strings of their own.
+    """
+    events = _TreeEvents(target)
+    events.feed(markup)
+    events.close()
+    return target.close()
+
+
+class _TreeEvents(HTMLParser):
+    """Balances html.parser callbacks the way BeautifulSoup's html.parser builder does.
+
+    Void elements are closed as soon as they open, an end tag closes every element
+    opened since the matching start tag, and stray end tags are ignored. Text is
+    gathered into strings where BeautifulSoup would make one, with character
+    references resolved as it resolves them.
+    """
+
+    def __init__(self, target: Any):
+        # Like BeautifulSoup, resolve references as they come rather than html.parser's way
+        super().__init__(convert_charrefs=False)
+        self.target = target
+        self.open_tags = []
+        self.text = []  # Pieces of the current string
+
+    def flush(self):
+        """End the current string, passing it to the target."""
+        if self.text:
+            self.target.data(''.join(self.text))
+            self.text.clear()
+
+    def handle_starttag(self, tag, attrs):
+        self.flush()
+        self.target.start(tag, {name: value or '' for name, value in attrs})
+        if tag in VOID_ELEMENTS:
+            self.target.end(tag)
+        else:
+            self.open_tags.append(tag)
+
+    def handle_startendtag(self, tag, attrs):
+        self.flush()
+        self.target.start(tag, {name: value or '' for name, value in attrs})
+        self.target.end(tag)
+
+    def handle_endtag(self, tag):
+        self.flush()
+        if tag not in self.open_tags:
+            return
+        while True:
+            closed = self.open_tags.pop()
+            self.target.end(closed)
+            if closed == tag:
+                return
+
+    def handle_data(self, data):
+        self.text.append(data)
+
+    def handle_charref(self, name):
+        self.text.append(html.unescape(f'&#{name};'))
+
+    def handle_entityref(self, name):
+        # An unknown name is kept as literal text, without its semicolon
+        self.text.append(EntitySubstitution.HTML_ENTITY_TO_CHARACTER.get(name, f'&{name}'))
+
+    # Comments, declarations and processing instructions end the current string
+
+    def handle_comment(self, data):
+        self.flush()
+
+    def handle_decl(self, decl):
+        self.flush()
+
+    def handle_pi(self, data):
+        self.flush()
+
+    def unknown_decl(self, data):
+        self.flush()
+        if data.upper().startswith('CDATA['):
+            self.target.data(data[len('CDATA['):])
+
+    def close(self):
+        super().close()
+        self.flush()
+        while self.open_tags:
+            self.target.end(self.open_tags.pop())
@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""
+In-Process HTML to Markdown Converter
+
+A pure-Python alternative to running pandoc for the reference pages the dl_*.py
+scripts download. It converts an already-parsed BeautifulSoup tree, so callers
+that have just filtered a page can convert it without serialising and reparsing.
+
+Output follows pandoc's `--to=gfm-raw_html --wrap=auto --strip-comments` style
+for the markup found in the FFIEC IT booklets:
+- ATX headings, paragraphs wrapped at 72 columns, hard line breaks
+- Bulleted and numbered lists, nested and tight or loose
+- Pipe tables
+- Links, images, emphasis, strong, strikethrough and inline code
+- Block quotes, code blocks and horizontal rules
+
+Text is escaped as pandoc escapes it, including list, heading and other block
+markers that would otherwise start a new block at the beginning of a line (also
+where a paragraph wraps or breaks). Scripts, styles, comments and form controls
+are dropped; other unknown elements contribute their content.
+
+Usage:
+    from html_to_markdown import html_to_markdown, soup_to_markdown
+
+    markdown = html_to_markdown("<h1>Title</h1><p>Text</p>")
+    markdown = soup_to_markdown(soup)
+
+Dependencies:
+    pip install beautifulsoup4
+"""
+
+import re
+import textwrap
+from typing import List
+
+from bs4 import BeautifulSoup
+from bs4.element import NavigableString, PreformattedString, Tag
+
+DEFAULT_WIDTH = 72
+
+HEADING_TAGS = {'h1', 'h2', 'h3', 'h4', 'h5', 'h6'}
+LIST_TAGS = {'ul', 'ol'}
+BLOCK_TAGS = HEADING_TAGS | LIST_TAGS | {
+    'address', 'article', 'aside', 'blockquote', 'body', 'center', 'dd', 'details', 'div', 'dl', 'dt',
+    'fieldset', 'figcaption', 'figure', 'footer', 'form', 'header', 'hr', 'html', 'li', 'main', 'nav',
+    'p', 'pre', 'section', 'summary', 'table',
+}
+SKIP_TAGS = {
+    'button', 'head', 'iframe', 'input', 'noscript', 'object', 'script', 'select', 'style', 'svg',
+    'template', 'textarea',
+}
+STRONG_TAGS = {'b', 'strong'}
+EMPHASIS_TAGS = {'cite', 'em', 'i', 'var'}
+STRIKE_TAGS = {'del', 's', 'strike'}
+CODE_TAGS = {'code', 'kbd', 'samp', 'tt'}
+
+# Stand in for <br> and for spaces wrapping must not break at, until paragraphs are
+# wrapped; never occur in parsed HTML text
+HARD_BREAK = '\x00'
+NO_BREAK = '\x01'
+# An underscore between two letters or digits cannot delimit emphasis and is left as is
+MARKDOWN_SPECIAL = re.compile(r'([\\`*\[\]<>]|_(?!(?<=[^\W_]_)[^\W_]))')
+# A '#' starting a word could open a heading or close one, wherever the text ends up
+WORD_START_HASH = re.compile(r'(?<!\S)#')
+WHITESPACE = re.compile(r'[ \t\n\r\f\v]+')
+# Markers that start a block even in the middle of a paragraph; the space before them
+# is kept unbroken so wrapping never moves them to the start of a line
+INTERRUPTING_MARKER = re.compile(r' (?=(?:[-+]|0*1[.)])(?: |$))')
+# Line starts escaped as pandoc does: list markers, thematic breaks and code fences,
+# ordered list markers (on continuation lines only those numbered 1, the only ones
+# that can interrupt a paragraph) and setext underlines (on continuation lines only)
+ORDERED_MARKER = re.compile(r'^(\d{1,9})([.)])(?=\s|$)')
+BLOCK_MARKER = re.compile(r'^(?:[-+](?=\s|$)|(?:- *){3,}$|~~~)')
+SETEXT_UNDERLINE = re.compile(r'^(?:-+|=+) *$')
+
+
+def html_to_markdown(html: str, width: int = DEFAULT_WIDTH) -> str:
+    """Parse an HTML string and convert it to Markdown."""
+    return soup_to_markdown(BeautifulSoup(html, 'html.parser'), width)
+
+
+def soup_to_markdown(element: Tag, width: int = DEFAULT_WIDTH) -> str:
+    """Convert a parsed BeautifulSoup document or element to Markdown."""
+    blocks = _blocks(element, width)
+    return "\n\n".join(blocks) + "\n" if blocks else ""
+
+
+def _is_text(node) -> bool:
+    """True for text nodes, excluding comments, doctypes and other declarations."""
+    return isinstance(node, NavigableString) and not isinstance(node, PreformattedString)
+
+
+def _escape(text: str) -> str:
+    return WORD_START_HASH.sub(r'\\#', MARKDOWN_SPECIAL.sub(r'\\\1', text))
+
+
+def _escape_line_start(line: str, first: bool = True) -> str:
+    """Escape a marker at the start of a line that would otherwise begin a new block.
+
+    `first` is True for the first line of a paragraph or table cell, where any
+    list marker counts, and False for the lines continuing a paragraph.
+    """
+    if (match := ORDERED_MARKER.match(line)) and (first or int(match.group(1)) == 1):
+        return f"{match.group(1)}\\{match.group(2)}{line[match.end():]}"
+    if BLOCK_MARKER.match(line) or (not first and SETEXT_UNDERLINE.match(line)):
+        return '\\' + line
+    return line
+
+
+def _collapse(text: str) -> str:
+    """Collapse HTML whitespace the way a browser would, keeping hard breaks."""
+    text = WHITESPACE.sub(' ', text)
+    text = re.sub(f' ?{HARD_BREAK} ?', HARD_BREAK, text)
+    return text.strip(' ' + HARD_BREAK)
+
+
+def _wrap(text: str, width: int) -> str:
+    """Wrap collapsed paragraph text, rendering hard breaks as backslash line ends.
+
+    Markers that would turn the start of a line into a new block are escaped
+    after wrapping, so the paragraph renders as one paragraph.
+    """
+    segments = []
+    for segment in text.split(HARD_BREAK):
+        wrapped = textwrap.wrap(INTERRUPTING_MARKER.sub(NO_BREAK, segment), width=max(width, 20),
+                                break_long_words=False, break_on_hyphens=False) or ['']
+        lines = [_escape_line_start(line.replace(NO_BREAK, ' '), first=not segments and not number)
+                 for number, line in enumerate(wrapped)]
+        segments.append("\n".join(lines))
+    return "\\\n".join(segments)
+
+
+def _around(marker: str, inner: str) -> str:
+    """Wrap inline content in a delimiter, keeping outer whitespace outside it."""
+    stripped = inner.strip()
+    if not stripped:
+        return inner
+    leading = inner[:len(inner) - len(inner.lstrip())]
+    trailing = inner[len(inner.rstrip()):]
+    return f"{leading}{marker}{stripped}{marker}{trailing}"
+
+
+def _inline(element: Tag) -> str:
+    """Render an element's content as inline Markdown (whitespace not yet collapsed)."""
+    parts = []
+    for child in element.children:
+        if _is_text(child):
+            parts.append(_escape(str(child)))
+        elif isinstance(child, Tag) and child.name not in SKIP_TAGS:
+            parts.append(_inline_tag(child))
+    return "".join(parts)
+
+
+def _inline_tag(tag: Tag) -> str:
+    name = tag.name
+    if name == 'br':
+        return HARD_BREAK
+    if name == 'img':
+        src = tag.get('src')
+        return f"![{_escape(tag.get('alt', ''))}]({src})" if src else ""
+    if name in CODE_TAGS:
+        code = WHITESPACE.sub(' ', tag.get_text())
+        fence = '``' if '`' in code else '`'
+        return f"{fence}{code}{fence}" if code.strip() else code
+    inner = _inline(tag)
+    if name in STRONG_TAGS:
+        return _around('**', inner)
+    if name in EMPHASIS_TAGS:
+        return _around('*', inner)
+    if name in STRIKE_TAGS:
+        return _around('~~', inner)
+    if name == 'a':
+        href = tag.get('href')
+        text = _collapse(inner).replace(HARD_BREAK, ' ')
+        if not href or not text:
+            return inner
+        leading = ' ' if inner[:1].isspace() else ''
+        trailing = ' ' if inner[-1:].isspace() else ''
+        if text == _escape(href):
+            return f"{leading}<{href}>{trailing}"
+        return f"{leading}[{text}]({href}){trailing}"
+    if name in BLOCK_TAGS:
+        # Block content inside inline markup still separates words
+        return f" {inner} "
+    return inner
+
+
+def _blocks(element: Tag, width: int) -> List[str]:
+    """Render an element's content as a list of Markdown blocks.
+
+    Runs of text and inline elements between block elements become paragraphs.
+    """
+    blocks = []
+    inline = []
+
+    def flush():
+        text = _collapse("".join(inline))
+        inline.clear()
+        if text:
+            blocks.append(_wrap(text, width))
+
+    for child in element.children:
+        if _is_text(child):
+            inline.append(_escape(str(child)))
+        elif not isinstance(child, Tag) or child.name in SKIP_TAGS:
+            continue
+        elif child.name in BLOCK_TAGS:
+            flush()
+            blocks.extend(_block(child, width))
+        else:
+            inline.append(_inline_tag(child))
+    flush()
+    return blocks
+
+
+def _block(tag: Tag, width: int) -> List[str]:
+    name = tag.name
+    if name in HEADING_TAGS:
+        text = _collapse(_inline(tag)).replace(HARD_BREAK, ' ')
+        return [f"{'#' * int(name[1])} {text}"] if text else []
+    if name in LIST_TAGS:
+        rendered = _list(tag, width)
+        return [rendered] if rendered else []
+    if name == 'table':
+        return _table(tag, width)
+    if name == 'blockquote':
+        inner = "\n\n".join(_blocks(tag, width - 2))
+        return ["\n".join(f"> {line}" if line else ">" for line in inner.split("\n"))] if inner else []
+    if name == 'pre':
+        code = tag.get_text().strip('\n')
+        fence = '````' if '```' in code else '```'
+        return [f"{fence}\n{code}\n{fence}"]
+    if name == 'hr':
+        return ['-' * DEFAULT_WIDTH]
+    return _blocks(tag, width)
+
+
+def _list(tag: Tag, width: int) -> str:
+    """Render a list; any item holding paragraphs makes it a loose list.
+
+    Ordered list markers are padded to four columns, as pandoc pads them.
+    """
+    ordered = tag.name == 'ol'
+    try:
+        start = int(tag.get('start', 1))
+    except ValueError:
+        start = 1
+
+    list_items = tag.find_all('li', recursive=False)
+    loose = any(item.find('p', recursive=False) is not None for item in list_items)
+    items = []
+    for number, item in enumerate(list_items, start):
+        marker = f"{number}.".ljust(3) if ordered else "-"
+        indent = ' ' * (len(marker) + 1)
+        body = ("\n\n" if loose else "\n").join(_blocks(item, width - len(indent)))
+        lines = body.split("\n")
+        first = f"{marker} {lines[0]}" if lines[0] else marker.rstrip()
+        items.append("\n".join([first] + [indent + line if line else "" for line in lines[1:]]))
+
+    return ("\n\n" if loose else "\n").join(items)
+
+
+def _table(table: Tag, width: int) -> List[str]:
+    """Render a table as a GFM pipe table followed by a caption paragraph (if any).
+
+    As in pandoc's output, a table without header cells gets an empty header row
+    (pipe tables cannot lack one), and columns are padded to a common width
+    unless the padded table would be wider than `width`.
+    """
+    rows = []
+    header = None
+    for row in table.find_all('tr'):
+        if row.find_parent('table') is not table:
+            continue  # Row of a nested table
+        cells = row.find_all(['th', 'td'], recursive=False)
+        texts = [_escape_line_start(_collapse(_inline(cell)).replace(HARD_BREAK, ' ').replace('|', '\\|'))
+                 for cell in cells]
+        if not texts:
+            continue
+        in_head = row.find_parent('thead') is not None
+        if header is None and not rows and (in_head or all(cell.name == 'th' for cell in cells)):
+            header = texts
+        else:
+            rows.append(texts)
+
+    columns = max([len(header or [])] + [len(row) for row in rows])
+    if not columns:
+        return []
+
+    def pad(cells):
+        return cells + [''] * (columns - len(cells))
+
+    widths = [max(3, *map(len, column)) for column in zip(*map(pad, [header or []] + rows))]
+    aligned = sum(widths) <= width
+
+    def line(cells):
+        cells = [cell.ljust(w) for cell, w in zip(pad(cells), widths)] if aligned else pad(cells)
+        return "| " + " | ".join(cells) + " |"
+
+    # Too wide to align: unpadded cells and four-dash borders
+    lines = [line(header or []), "|" + "|".join('-' * (w + 2 if aligned else 4) for w in widths) + "|"]
+    lines += [line(row) for row in rows]
+
+    blocks = ["\n".join(lines)]
+    caption = table.find('caption')
+    if caption is not None:
+        text = _collapse(_inline(caption)).replace(HARD_BREAK, ' ')
+        if text:
+            blocks.append(text)
+    return blocks
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP Client for the Reference Download Scripts
+
+A single fetch layer used by every dl_*.py script instead of bare requests.get calls.
+
+Features:
+- One pooled requests.Session per client, so connections and TLS sessions are reused
+- Retries with exponential backoff for connection errors, 429 and 5xx responses
+  (honouring Retry-After); every attempt waits for the rate limiter and is counted
+- gzip/deflate (and br/zstd when the decoders are installed) content negotiation
+- A default timeout on every request
+- Optional per-host token bucket rate limiting, safe to share between threads
+- Per-request timing counters, summarised per host
+
+Usage:
+    from http_client import HttpClient
+
+    client = HttpClient(rate=2.0)
+    response = client.get("https://example.org/page")
+    response.raise_for_status()
+    print(client.stats.summary())
+
+Dependencies:
+    pip install requests
+"""
+
+import email.utils
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+from urllib3.util import make_headers
+
+DEFAULT_TIMEOUT = 30
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.5
+DEFAULT_POOL_SIZE = 10
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+# Methods retried after the request may have reached the server; others only when it never did
+RETRY_METHODS = frozenset(['GET', 'HEAD'])
+MAX_BACKOFF = 120
+
+
+class HostRateLimiter:
+    """Token bucket rate limiter keyed by host, safe to share between threads.
+
+    Each host gets a bucket refilled at `rate` tokens per second holding at most
+    `burst` tokens; a request waits until its host's bucket has a token.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self._buckets: Dict[str, tuple] = {}  # host -> (tokens, time of last update)
+        self._lock = threading.Lock()
+
+    def acquire(self, url: str) -> None:
+        """Block until a request to the URL's host is allowed."""
+        host = urlparse(url).netloc
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                tokens, updated = self._buckets.get(host, (self.burst, now))
+                tokens = min(self.burst, tokens + (now - updated) * self.rate)
+                if tokens >= 1:
+                    self._buckets[host] = (tokens - 1, now)
+                    return
+                self._buckets[host] = (tokens, now)
+                wait = (1 - tokens) / self.rate
+            time.sleep(wait)
+
+
+@dataclass
+class HostStats:
+    """Request counters for a single host."""
+    requests: int = 0
+    errors: int = 0
+    retries: int = 0
+    seconds: float = 0.0
+    bytes: int = 0
+
+
+@dataclass
+class RequestStats:
+    """Per-host request counters, safe to update from several threads."""
+    hosts: Dict[str, HostStats] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(self, host: str, seconds: float, size: int = 0, error: bool = False, retry: bool = False) -> None:
+        """Record one request to a host; `retry` marks a repeated attempt."""
+        with self._lock:
+            stats = self.hosts.setdefault(host, HostStats())
+            stats.requests += 1
+            stats.seconds += seconds
+            stats.bytes += size
+            if error:
+                stats.errors += 1
+            if retry:
+                stats.retries += 1
+
+    @property
+    def requests(self) -> int:
+        """Total number of requests made."""
+        return sum(stats.requests for stats in self.hosts.values())
+
+    def summary(self) -> str:
+        """Return a human-readable summary with one line per host."""
+        if not self.hosts:
+            return "HTTP: no requests made"
+        lines = [f"HTTP: {self.requests} requests"]
+        for host, stats in sorted(self.hosts.items()):
+            average = stats.seconds / stats.requests
+            lines.append(f"  {host}: {stats.requests} requests, {stats.errors} errors, {stats.retries} retries, "
+                         f"{stats.bytes / 1024:.0f} KiB, {stats.seconds:.2f}s total, {average * 1000:.0f} ms average")
+        return "\n".join(lines)
+
+
+class HttpClient:
+    """Pooled HTTP client with retries, content negotiation, rate limiting and timing."""
+
+    def __init__(self, timeout: float = DEFAULT_TIMEOUT, retries: int = DEFAULT_RETRIES,
+                 backoff_factor: float = DEFAULT_BACKOFF_FACTOR, pool_size: int = DEFAULT_POOL_SIZE,
+                 rate: Optional[float] = None, burst: int = 1):
+        """Create a client.
+
+        Args:
+            timeout: Default timeout in seconds for requests that do not pass one
+            retries: Retries for connection errors and retryable statuses; each is rate limited and counted
+            backoff_factor: Exponential backoff factor between retries
+            pool_size: Connections kept open per host; at least the number of threads sharing the client
+            rate: Maximum requests per second per host, or None for no limit
+            burst: Requests a host may receive back to back before the rate applies
+        """
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.rate_limiter = HostRateLimiter(rate, burst) if rate else None
+        self.stats = RequestStats()
+
+        # Retries are made by request() so that each attempt is rate limited and counted
+        adapter = HTTPAdapter(max_retries=0, pool_connections=pool_size, pool_maxsize=pool_size)
+
+        self.session = requests.Session()
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        # Advertise every content encoding urllib3 can decode here (br/zstd need optional packages)
+        self.session.headers.update(make_headers(accept_encoding=True))
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """Send a GET request through the pooled session.
+
+        Accepts the keyword arguments of requests.get. Raises requests.RequestException
+        on failure once retries are exhausted; HTTP error statuses are returned for the
+        caller to check with raise_for_status().
+        """
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        """Send a POST request through the pooled session.
+
+        Only connection failures before the request is sent are retried, since POST
+        is not idempotent. Otherwise behaves like get().
+        """
+        return self.request('POST', url, **kwargs)
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request with the given method; see get().
+
+        Each attempt, including retries, waits for the rate limiter and is recorded
+        in the stats. The last response is returned once retries are exhausted.
+        """
+        kwargs.setdefault('timeout', self.timeout)
+        method = method.upper()
+        host = urlparse(url).netloc
+
+        attempt = 0
+        while True:
+            if self.rate_limiter:
+                self.rate_limiter.acquire(url)
+
+            start = time.perf_counter()
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except requests.RequestException as e:
+                self.stats.record(host, time.perf_counter() - start, error=True, retry=attempt > 0)
+                if attempt < self.retries and self._can_retry_error(method, e):
+                    time.sleep(self._backoff(attempt))
+                    attempt += 1
+                    continue
+                raise
+
+            # Streamed bodies are not read yet, so only headers are timed and sized for them
+            size = len(response.content) if not kwargs.get('stream') else int(response.headers.get('Content-Length') or 0)
+            self.stats.record(host, time.perf_counter() - start, size, error=response.status_code >= 400,
+                              retry=attempt > 0)
+            if attempt < self.retries and method in RETRY_METHODS and response.status_code in RETRY_STATUSES:
+                delay = self._retry_after(response)
+                response.close()
+                time.sleep(self._backoff(attempt) if delay is None else delay)
+                attempt += 1
+                continue
+            return response
+
+    @staticmethod
+    def _can_retry_error(method: str, error: requests.RequestException) -> bool:
+        """Whether a failed attempt may be repeated: always for GET/HEAD, otherwise only if nothing was sent."""
+        if not isinstance(error, (requests.ConnectionError, requests.Timeout)):
+            return False
+        if method in RETRY_METHODS or isinstance(error, requests.ConnectTimeout):
+            return True
+        reason = getattr(error.args[0], 'reason', None) if error.args else None
+        return isinstance(reason, NewConnectionError)
+
+    def _backoff(self, attempt: int) -> float:
+        """Exponential backoff before retry number attempt + 1."""
+        return min(MAX_BACKOFF, self.backoff_factor * 2 ** attempt)
+
+    @staticmethod
+    def _retry_after(response: requests.Response) -> Optional[float]:
+        """Seconds to wait from a Retry-After header (seconds or HTTP date), if any."""
+        value = response.headers.get('Retry-After')
+        if not value:
+            return None
+        if value.strip().isdigit():
+            return min(MAX_BACKOFF, float(value))
+        try:
+            retry_at = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at is None:
+            return None
+        return min(MAX_BACKOFF, max(0.0, retry_at.timestamp() - time.time()))
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        self.session.close()
+
+    def __enter__(self) -> 'HttpClient':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
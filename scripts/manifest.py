@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Shared Download Manifest Helper
+
+Reads and writes the JSON manifests in which the dl_*.py scripts record what
+they downloaded (validators, commit and content hashes), so a refresh only
+fetches or rewrites what changed.
+
+A manifest is always a JSON object. Reading one that is missing, unreadable or
+not an object gives an empty manifest, so the next run simply downloads
+everything again. Writing goes through a temporary file renamed into place, so
+an interrupted run never leaves a truncated manifest behind.
+
+Usage:
+    from manifest import read_manifest, write_manifest
+
+    manifest = read_manifest(manifest_file)
+    manifest['key'] = {'etag': '"abc"'}
+    write_manifest(manifest_file, manifest)
+
+Dependencies:
+    None (standard library only)
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict
+
+
+def read_manifest(manifest_file: Path) -> Dict[str, Any]:
+    """Read a manifest, returning an empty one if missing, unreadable or not a JSON object."""
+    try:
+        with open(manifest_file, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        print(f"Warning: Ignoring unreadable manifest {manifest_file}: {e}")
+        return {}
+    if not isinstance(manifest, dict):
+        print(f"Warning: Ignoring malformed manifest {manifest_file}: not a JSON object")
+        return {}
+    return manifest
+
+
+def write_manifest(manifest_file: Path, manifest: Dict[str, Any]) -> None:
+    """Atomically write a manifest as indented JSON with sorted keys, creating its directory."""
+    manifest_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = manifest_file.with_name(f"{manifest_file.name}.tmp")
+    try:
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+            f.write("\n")
+        os.replace(tmp_file, manifest_file)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
@@ -0,0 +1,93 @@
+"""
+Shared helpers for the script tests.
+
+The scripts have hyphenated file names (e.g. dl_ffiec-itbooklets.py) and cannot be
+imported with a plain import statement, so they are loaded by path with load_script
+from scripts/_loader.py. Downloaders are exercised against StandInServer, a local
+HTTP server on a free port serving canned responses and recording every request it
+receives.
+
+Run from the repository root:
+    python -m pytest scripts/tests
+"""
+
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlparse
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+
+# Scripts import shared modules (e.g. http_client) from their own directory
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+from _loader import load_script
+
+
+class StandInServer:
+    """Local HTTP server answering GET requests from registered route handlers.
+
+    A handler receives the request headers and returns (status, headers, body).
+    Unregistered paths get a 404. Each request is recorded as (arrival time, path,
+    headers) in `requests`.
+    """
+
+    def __init__(self):
+        self.routes = {}
+        self.requests = []
+        self._lock = threading.Lock()
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                path = urlparse(self.path).path
+                with stand_in._lock:
+                    stand_in.requests.append((time.monotonic(), path, dict(self.headers)))
+                handler = stand_in.routes.get(path)
+                status, headers, body = handler(self.headers) if handler else (404, {}, b"not found")
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        host, port = self.server.server_address
+        return f"http://{host}:{port}"
+
+    def route(self, path, handler):
+        """Serve `path` with handler(headers) -> (status, headers, body)."""
+        self.routes[path] = handler
+
+    def paths(self):
+        """Return the paths requested so far, in arrival order."""
+        with self._lock:
+            return [path for _, path, _ in self.requests]
+
+    def start(self):
+        self.thread.start()
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def stand_in():
+    server = StandInServer()
+    server.start()
+    yield server
+    server.stop()
@@ -0,0 +1,256 @@
+"""
+Tests for annotate_yaml_front_matter.py: the return contract of update_file_yaml,
+and incremental runs over a docs tree in a temporary directory, which re-read and
+re-annotate only what the cache of the previous run says has changed, reading only
+the reference catalogues some file cites.
+"""
+
+import json
+import os
+import sys
+
+import pytest
+
+from conftest import load_script
+
+annotate = load_script('annotate_yaml_front_matter.py')
+
+TITLE_MAPPINGS = {
+    'risks': {'ri-1': "Risk One"},
+    'mitigations': {'mi-1': "Mitigation One"},
+}
+
+
+def test_update_file_yaml_returns_whether_the_file_changed(tmp_path):
+    file_path = tmp_path / "mi-1_mitigation.md"
+    file_path.write_text("---\nsequence: 1\ntitle: Mitigation One\nmitigates:\n  - ri-1\n---\n\nBody\n",
+                         encoding='utf-8')
+
+    assert annotate.update_file_yaml(file_path, TITLE_MAPPINGS, check=True) is True
+    assert "# Risk One" not in file_path.read_text(encoding='utf-8')
+
+    assert annotate.update_file_yaml(file_path, TITLE_MAPPINGS) is True
+    assert "# Risk One" in file_path.read_text(encoding='utf-8')
+
+    assert annotate.update_file_yaml(file_path, TITLE_MAPPINGS) is False
+
+
+def test_update_file_yaml_returns_false_for_unprocessable_files(tmp_path, capsys):
+    no_front_matter = tmp_path / "mi-2_plain.md"
+    no_front_matter.write_text("Just text\n", encoding='utf-8')
+    invalid_yaml = tmp_path / "mi-3_invalid.md"
+    invalid_yaml.write_text("---\nmitigates: [unclosed\n---\n", encoding='utf-8')
+
+    assert annotate.update_file_yaml(no_front_matter, TITLE_MAPPINGS) is False
+    assert annotate.update_file_yaml(invalid_yaml, TITLE_MAPPINGS) is False
+    assert "Error parsing YAML" in capsys.readouterr().out
+
+
+FILES = {
+    "_risks/ri-1_one.md": "---\nsequence: 1\ntitle: Risk One\nrelated_risks:\n  - ri-2\n---\n\nBody\n",
+    "_risks/ri-2_two.md": "---\nsequence: 2\ntitle: Risk Two\n---\n\nBody\n",
+    "_mitigations/mi-1_one.md": "---\nsequence: 1\ntitle: Mitigation One\nmitigates:\n  - ri-1\n---\n\nBody\n",
+    "_mitigations/mi-2_two.md": "---\nsequence: 2\ntitle: Mitigation Two\nmitigates:\n  - ri-2\n---\n\nBody\n",
+}
+
+
+@pytest.fixture
+def docs(tmp_path, monkeypatch):
+    """A docs tree of two risks and two mitigations citing each other, and no catalogues."""
+    docs_dir = tmp_path / "docs"
+    monkeypatch.setattr(annotate, 'DOCS_DIR', docs_dir)
+    monkeypatch.setattr(annotate, 'REFERENCES_DIR', docs_dir / "_data" / "references")
+    (docs_dir / "_data" / "references").mkdir(parents=True)
+    for key, content in FILES.items():
+        (docs_dir / key).parent.mkdir(exist_ok=True)
+        (docs_dir / key).write_text(content, encoding='utf-8')
+    return docs_dir
+
+
+@pytest.fixture
+def reads(monkeypatch):
+    """Record the files whose front matter is read, as paths relative to docs/."""
+    read = []
+    read_front_matter = annotate.read_front_matter
+
+    def recording_read_front_matter(file_path):
+        read.append(file_path.relative_to(annotate.DOCS_DIR).as_posix())
+        return read_front_matter(file_path)
+    monkeypatch.setattr(annotate, 'read_front_matter', recording_read_front_matter)
+    return read
+
+
+def run(docs, reads=None, **options):
+    """Run one pass with the cache in the temporary tree; return the files read and the counts."""
+    if reads is not None:
+        reads.clear()
+    counts = annotate.annotate(cache_file=docs.parent / "cache.json", workers=1, **options)
+    return sorted(reads or []), counts
+
+
+def test_title_change_re_annotates_only_the_files_citing_it(docs, reads):
+    run(docs)
+    assert "- ri-2  # Risk Two" in (docs / "_mitigations/mi-2_two.md").read_text(encoding='utf-8')
+    ri_2 = docs / "_risks/ri-2_two.md"
+    ri_2.write_text(ri_2.read_text(encoding='utf-8').replace("Risk Two", "Risk Two Renamed"), encoding='utf-8')
+
+    read, counts = run(docs, reads)
+
+    assert read == ["_mitigations/mi-2_two.md", "_risks/ri-1_one.md", "_risks/ri-2_two.md"]
+    assert counts['risk'][annotate.CHANGED] == 1
+    assert counts['mitigation'][annotate.CHANGED] == 1
+    assert counts['mitigation'][annotate.UNCHANGED] == 1
+    for key in ["_risks/ri-1_one.md", "_mitigations/mi-2_two.md"]:
+        assert "- ri-2  # Risk Two Renamed" in (docs / key).read_text(encoding='utf-8')
+
+
+def test_dependents_and_changed_ids_follow_the_citations():
+    records = {key: {'citations': citations} for key, citations in {
+        "_risks/ri-1_one.md": {'related_risks': ["ri-2"], 'owasp-llm_references': ["LLM01"]},
+        "_mitigations/mi-2_two.md": {'mitigates': ["ri-2"]},
+    }.items()}
+
+    dependents = annotate.build_dependents(records)
+    changed = annotate.changed_ids({'risks': {'ri-1': "A", 'ri-2': "B"}, 'mitigations': {'mi-1': "C"}},
+                                   {'risks': {'ri-1': "A", 'ri-2': "B2", 'ri-3': "D"}, 'mitigations': {}})
+
+    assert dependents[('risks', "ri-2")] == {"_risks/ri-1_one.md", "_mitigations/mi-2_two.md"}
+    assert dependents[('owasp-llm_references', "LLM01")] == {"_risks/ri-1_one.md"}
+    assert changed == {'risks': {"ri-2", "ri-3"}, 'mitigations': {"mi-1"}}
+
+
+def test_unchanged_run_reads_nothing(docs, reads):
+    run(docs)
+
+    read, counts = run(docs, reads)
+
+    assert read == []
+    assert counts['risk'][annotate.UNCHANGED] == 2
+    assert counts['mitigation'][annotate.UNCHANGED] == 2
+
+
+def outdate_annotation(path):
+    """Make a file's title comment out of date, keeping its size and modification time."""
+    stat = path.stat()
+    path.write_bytes(path.read_bytes().replace(b"# Risk One", b"# Risk 111"))
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    return stat
+
+
+@pytest.mark.parametrize("edit", ["mtime", "size"])
+def test_cached_file_is_read_again_when_its_size_or_mtime_changes(docs, reads, edit):
+    run(docs)
+    mi_1 = docs / "_mitigations/mi-1_one.md"
+    stat = outdate_annotation(mi_1)
+
+    # Size and modification time match the cache, so the edit goes unseen
+    assert run(docs, reads)[0] == []
+
+    if edit == "mtime":
+        os.utime(mi_1, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    else:
+        with open(mi_1, 'ab') as f:
+            f.write(b"More body\n")
+    read, counts = run(docs, reads)
+
+    assert read == ["_mitigations/mi-1_one.md"]
+    assert counts['mitigation'][annotate.CHANGED] == 1
+    assert "- ri-1  # Risk One\n" in mi_1.read_text(encoding='utf-8')
+
+
+def test_cache_of_another_version_is_ignored(docs, reads, monkeypatch):
+    run(docs)
+    monkeypatch.setattr(annotate, 'CACHE_VERSION', annotate.CACHE_VERSION + 1)
+
+    read, counts = run(docs, reads)
+
+    assert read == sorted(FILES)
+    assert json.loads((docs.parent / "cache.json").read_text(encoding='utf-8'))['version'] == annotate.CACHE_VERSION
+
+
+@pytest.mark.parametrize("cache", [
+    "{truncated",
+    "[]",
+    '{"version": 2, "titles": "not a map", "files": [], "catalogues": null}',
+    '{"version": 2, "titles": {}, "files": {"_risks/ri-1_one.md": {"size": 1}}, "catalogues": {}}',
+])
+def test_corrupt_cache_is_ignored(docs, reads, capsys, cache):
+    run(docs)
+    (docs.parent / "cache.json").write_text(cache, encoding='utf-8')
+
+    read, counts = run(docs, reads)
+
+    assert read == sorted(FILES)
+    assert counts['risk'][annotate.FAILED] == counts['mitigation'][annotate.FAILED] == 0
+    assert json.loads((docs.parent / "cache.json").read_text(encoding='utf-8'))['version'] == annotate.CACHE_VERSION
+
+
+def check(monkeypatch, *args):
+    """Run the command line with --check, returning its exit code."""
+    monkeypatch.setattr(sys, 'argv', ["annotate_yaml_front_matter.py", "--check", "--workers", "1", *args])
+    try:
+        annotate.main()
+    except SystemExit as e:
+        return e.code
+    return 0
+
+
+def test_check_exits_non_zero_only_while_annotations_are_out_of_date(docs, monkeypatch):
+    before = {key: (docs / key).read_bytes() for key in FILES}
+
+    # --full keeps the repository's own cache out of the run
+    assert check(monkeypatch, "--full") == 1
+    assert {key: (docs / key).read_bytes() for key in FILES} == before
+
+    run(docs)
+    assert check(monkeypatch, "--full") == 0
+
+
+def test_check_exits_non_zero_when_a_file_fails(docs, monkeypatch):
+    run(docs)
+    (docs / "_risks/ri-3_broken.md").write_text("---\ntitle: [unclosed\n---\n", encoding='utf-8')
+
+    assert check(monkeypatch, "--full") == 1
+
+
+def cite_catalogue(docs, catalogues):
+    """Write reference catalogues and have ri-2 cite c-1 from cited.yml."""
+    for name, content in catalogues.items():
+        (annotate.REFERENCES_DIR / name).write_text(content, encoding='utf-8')
+    ri_2 = docs / "_risks/ri-2_two.md"
+    ri_2.write_text(ri_2.read_text(encoding='utf-8').replace("---\n\n", "cited_references:\n  - c-1\n---\n\n"),
+                    encoding='utf-8')
+    return ri_2
+
+
+def test_only_cited_catalogues_are_parsed(docs, capsys):
+    ri_2 = cite_catalogue(docs, {
+        "cited.yml": "title: Cited\nentries:\n  c-1:\n    title: Cited One\n",
+        # Parsing this one would report an error
+        "uncited.yml": "entries: [unclosed\n",
+    })
+
+    run(docs)
+
+    assert "uncited" not in capsys.readouterr().out
+    assert "- c-1  # Cited One\n" in ri_2.read_text(encoding='utf-8')
+    cache = json.loads((docs.parent / "cache.json").read_text(encoding='utf-8'))
+    assert sorted(cache['catalogues']) == ["cited_references"]
+
+
+@pytest.mark.parametrize("catalogue", [
+    "entries: [unclosed\n",
+    "",
+    "- a\n- list\n",
+    "entries:\n  - c-1\n",
+    "entries:\n  c-1: Not a mapping\n",
+    "entries:\n  c-1:\n    url: https://example.com\n",
+])
+def test_malformed_catalogue_is_skipped(docs, catalogue):
+    ri_2 = cite_catalogue(docs, {"cited.yml": catalogue})
+
+    counts = run(docs)[1]
+
+    assert counts['risk'][annotate.FAILED] == counts['mitigation'][annotate.FAILED] == 0
+    assert "- c-1\n" in ri_2.read_text(encoding='utf-8')
+    assert "- ri-2  # Risk Two\n" in (docs / "_mitigations/mi-2_two.md").read_text(encoding='utf-8')
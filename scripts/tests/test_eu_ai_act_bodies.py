@@ -0,0 +1,91 @@
+"""
+Tests for the bodies archive of dl_eu-ai-act.py, run against a local HTTP stand-in
+for the explorer site, with the index or archive corrupted between runs.
+"""
+
+import json
+
+import pytest
+
+from conftest import load_script
+
+eu_ai_act = load_script('dl_eu-ai-act.py')
+
+KEYS = ["article-1", "article-2"]
+
+
+@pytest.fixture
+def site(stand_in, monkeypatch):
+    """Serve one page per key with an ETag, answering a matching If-None-Match with 304."""
+    monkeypatch.setattr(eu_ai_act, 'BODY_REQUESTS_PER_SECOND', 100)
+    for key in KEYS:
+        etag = f'"{key}"'
+        body = f"<html><body><article><p>Text of {key}</p></article></body></html>".encode('utf-8')
+
+        def handler(headers, etag=etag, body=body):
+            if headers.get('If-None-Match') == etag:
+                return 304, {'ETag': etag}, b""
+            return 200, {'ETag': etag, 'Content-Type': 'text/html; charset=utf-8'}, body
+        stand_in.route(f"/{key}", handler)
+    return stand_in
+
+
+@pytest.fixture
+def paths(tmp_path):
+    return tmp_path / "bodies.md.gz", tmp_path / "bodies.json"
+
+
+def harvest(site, paths):
+    yaml_data = {key: {'title': key.title(), 'url': f"{site.url}/{key}"} for key in KEYS}
+    site.requests.clear()
+    assert eu_ai_act.harvest_bodies(yaml_data, *paths, max_workers=2)
+    return {path: headers.get('If-None-Match') for _, path, headers in site.requests}
+
+
+def test_refresh_revalidates_archived_texts(site, paths):
+    assert harvest(site, paths) == {"/article-1": None, "/article-2": None}
+    archive = paths[0].read_bytes()
+
+    assert harvest(site, paths) == {"/article-1": '"article-1"', "/article-2": '"article-2"'}
+    assert paths[0].read_bytes() == archive
+    assert "Text of article-2" in eu_ai_act.read_body("article-2", *paths)
+
+
+@pytest.mark.parametrize("index", ["[]", "null", "{truncated"])
+def test_unusable_index_fetches_everything(site, paths, index):
+    harvest(site, paths)
+    paths[1].write_text(index, encoding='utf-8')
+
+    assert harvest(site, paths) == {"/article-1": None, "/article-2": None}
+    assert sorted(json.loads(paths[1].read_text(encoding='utf-8'))) == KEYS
+
+
+def test_malformed_index_entry_is_fetched_again(site, paths):
+    harvest(site, paths)
+    index = json.loads(paths[1].read_text(encoding='utf-8'))
+    del index["article-1"]['offset']
+    index["article-2"]['length'] = "12"
+    paths[1].write_text(json.dumps(index), encoding='utf-8')
+
+    assert harvest(site, paths) == {"/article-1": None, "/article-2": None}
+    assert "Text of article-1" in eu_ai_act.read_body("article-1", *paths)
+
+
+def test_corrupt_archive_member_is_fetched_again(site, paths):
+    harvest(site, paths)
+    index = json.loads(paths[1].read_text(encoding='utf-8'))
+    archive = bytearray(paths[0].read_bytes())
+    # Edit the compressed data of the first member; the second is untouched
+    archive[index["article-1"]['offset'] + index["article-1"]['length'] // 2] ^= 0xFF
+    paths[0].write_bytes(bytes(archive))
+
+    assert harvest(site, paths) == {"/article-1": None, "/article-2": '"article-2"'}
+    assert "Text of article-1" in eu_ai_act.read_body("article-1", *paths)
+
+
+def test_truncated_archive_is_fetched_again(site, paths):
+    harvest(site, paths)
+    paths[0].write_bytes(paths[0].read_bytes()[:10])
+
+    assert harvest(site, paths) == {"/article-1": None, "/article-2": None}
+    assert "Text of article-2" in eu_ai_act.read_body("article-2", *paths)
@@ -0,0 +1,120 @@
+"""
+Tests for the single-pass explorer page parser in dl_eu-ai-act.py and its cache.
+"""
+
+from pathlib import Path
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup
+
+from conftest import load_script
+
+eu_ai_act = load_script('dl_eu-ai-act.py')
+
+BASE_URL = "https://example.test"
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def test_block_inside_paragraph_keeps_its_links():
+    # html.parser keeps the <div> inside the <p>; lxml would close the <p> first
+    html = """<html><body>
+        <p class="parent-title"><a href="/chapter-1">Chapter I: General Provisions</a></p>
+        <p class="child-article"><div><a href="/a1">Article 1: Subject Matter</a></div></p>
+        <p class="child-chapter"><div><a href="/s1">Section 1: Classification</a></div></p>
+        <p class="child-article"><a href="/a6">Article 6: Classification Rules</a></p>
+    </body></html>"""
+
+    chapters, annexes, recitals = eu_ai_act.parse_explorer_page(html, BASE_URL)
+
+    assert [chapter.text for chapter in chapters] == ["Chapter I: General Provisions"]
+    chapter = chapters[0]
+    assert [(link.text, link.url) for link in chapter.articles] == [
+        ("Article 1: Subject Matter", f"{BASE_URL}/a1"),
+    ]
+    assert [section.text for section in chapter.sections] == ["Section 1: Classification"]
+    assert [link.url for link in chapter.sections[0].articles] == [f"{BASE_URL}/a6"]
+    assert (annexes, recitals) == ([], [])
+
+
+def test_toc_cache_round_trip_and_malformed_cache(tmp_path):
+    cache_file = tmp_path / "toc.json"
+    chapter = eu_ai_act.Chapter("Chapter I", f"{BASE_URL}/c1", [], [eu_ai_act.Link("Article 1", f"{BASE_URL}/a1")])
+
+    eu_ai_act.save_toc_cache("abc", [chapter], [], [], cache_file=cache_file)
+
+    assert eu_ai_act.load_toc_cache("abc", cache_file) == ([chapter], [], [])
+    assert eu_ai_act.load_toc_cache("other", cache_file) is None
+    assert not cache_file.with_name("toc.json.tmp").exists()
+
+    for content in ("[]", "null", '"text"'):
+        cache_file.write_text(content, encoding='utf-8')
+        assert eu_ai_act.load_toc_cache("abc", cache_file) is None
+
+
+def baseline_parse(html, base_url):
+    """Parse the page with the full-tree BeautifulSoup queries the streaming parser replaced."""
+    soup = BeautifulSoup(html, 'html.parser')
+
+    def link_from(element):
+        if not (link := element.find('a')):
+            return None
+        href = link.get('href', '')
+        text = link.get_text(strip=True).replace('\n', ' ').strip()
+        return eu_ai_act.Link(text, urljoin(base_url, href)) if href and text else None
+
+    chapters, chapter, section = [], None, None
+    for element in soup.find_all('p', class_=['parent-title', 'child-chapter', 'child-article']):
+        if 'Annexes' in element.get_text(strip=True):
+            break
+        if not (link := link_from(element)):
+            continue
+        classes = element.get('class', [])
+        if 'parent-title' in classes and 'Chapter' in link.text:
+            chapter, section = eu_ai_act.Chapter(link.text, link.url, [], []), None
+            chapters.append(chapter)
+        elif 'child-chapter' in classes and 'Section' in link.text and chapter:
+            section = eu_ai_act.Section(link.text, link.url, [])
+            chapter.sections.append(section)
+        elif 'child-article' in classes and link.text.startswith('Article') and chapter:
+            (section or chapter).articles.append(link)
+
+    def section_links(section_name, link_filter):
+        section_div = next((div for div in soup.find_all('div', class_='et_pb_text_inner')
+                            if section_name in div.get_text()), None)
+        if not section_div:
+            return []
+        links = []
+        for link_element in section_div.find_all_next('a'):
+            text = link_element.get_text(strip=True)
+            href = link_element.get('href', '')
+            if not (href and text):
+                continue
+            if not link_filter(text):
+                if any(stop in text.lower() for stop in ['about', 'credits', 'feedback']):
+                    break
+                if section_name == 'Annexes' and 'Recitals' in text:
+                    break
+                continue
+            if section_name == 'Recitals' and text.isdigit():
+                text = f"Recital {text}"
+            links.append(eu_ai_act.Link(text, urljoin(base_url, href)))
+            if section_name == 'Annexes' and 'Recitals' in text:
+                break
+        return links
+
+    return chapters, section_links('Annexes', lambda t: 'Annex' in t), section_links('Recitals', str.isdigit)
+
+
+def test_streaming_parse_matches_the_tree_parse():
+    # Comments, entities, a doctype, a processing instruction and CDATA split or form strings
+    html = (FIXTURES_DIR / "eu-ai-act-explorer.html").read_text(encoding='utf-8')
+
+    parsed = eu_ai_act.parse_explorer_page(html, BASE_URL)
+
+    assert parsed == baseline_parse(html, BASE_URL)
+    chapters, annexes, recitals = parsed
+    # The comment ends a string, and get_text(strip=True) strips each string
+    assert chapters[0].articles[0].text == "Article 1:Subject\xa0Matter"
+    assert chapters[2].sections[0].text == "Section 1: Classification"
+    assert [len(chapter.articles) + len(chapter.sections) for chapter in chapters] == [3, 1, 2]
+    assert len(annexes) == 2 and len(recitals) == 4
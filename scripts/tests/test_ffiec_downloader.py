@@ -0,0 +1,125 @@
+"""
+Tests for the concurrent FFIEC booklet downloader in dl_ffiec-itbooklets.py,
+run against a local HTTP stand-in for the FFIEC site.
+"""
+
+import time
+
+import yaml
+
+from conftest import load_script
+from http_client import HttpClient
+
+ffiec = load_script('dl_ffiec-itbooklets.py')
+
+RATE = 10.0  # Requests per second allowed per host
+
+
+def page_handler(number, delay=0.0):
+    """Serve a booklet page with an ETag, answering a matching If-None-Match with 304."""
+    etag = f'"v{number}"'
+    body = (f"<html><body><ul class='menu-container'><li>Menu</li></ul>"
+            f"<h1>Page {number}</h1><p>Content {number}</p></body></html>").encode('utf-8')
+
+    def handler(headers):
+        time.sleep(delay)
+        if headers.get('If-None-Match') == etag:
+            return 304, {'ETag': etag}, b""
+        return 200, {'ETag': etag, 'Content-Type': 'text/html; charset=utf-8'}, body
+    return handler
+
+
+def write_booklets(tmp_path, stand_in, pages):
+    """Write a booklets YAML file listing the stand-in's pages, in order."""
+    booklets = {key: {'title': f"Title {key}", 'url': f"{stand_in.url}/{key}"} for key in pages}
+    yaml_file = tmp_path / "booklets.yml"
+    yaml_file.write_text(yaml.dump(booklets, sort_keys=False), encoding='utf-8')
+    return yaml_file
+
+
+def download(tmp_path, yaml_file, refresh=False):
+    with HttpClient(rate=RATE, retries=0) as client:
+        return ffiec.download_html_files(yaml_file, tmp_path / "html", client, max_workers=4,
+                                         manifest_file=tmp_path / "manifest.json", refresh=refresh)
+
+
+def test_requests_to_a_host_are_spaced_by_the_rate_limit(tmp_path, stand_in):
+    pages = [f"page-{i}" for i in range(8)]
+    for i, key in enumerate(pages):
+        stand_in.route(f"/{key}", page_handler(i))
+
+    assert download(tmp_path, write_booklets(tmp_path, stand_in, pages))
+
+    arrivals = sorted(arrival for arrival, _, _ in stand_in.requests)
+    assert len(arrivals) == len(pages)
+    gaps = [later - earlier for earlier, later in zip(arrivals, arrivals[1:])]
+    # Allow for scheduling jitter between the limiter and the server
+    assert min(gaps) >= 0.8 / RATE
+
+
+def test_reports_follow_yaml_order_whatever_order_downloads_finish(tmp_path, stand_in, capsys):
+    pages = ["slow", "fast-1", "fast-2", "fast-3"]
+    stand_in.route("/slow", page_handler(0, delay=0.5))
+    for i, key in enumerate(pages[1:], 1):
+        stand_in.route(f"/{key}", page_handler(i))
+
+    assert download(tmp_path, write_booklets(tmp_path, stand_in, pages))
+
+    titles = [line.removeprefix("Downloading: ") for line in capsys.readouterr().out.splitlines()
+              if line.startswith("Downloading: ")]
+    assert titles == [f"Title {key}" for key in pages]
+    assert (tmp_path / "html" / "slow.html").read_text(encoding='utf-8').count("Page 0") == 1
+    assert "menu-container" not in (tmp_path / "html" / "fast-1.html").read_text(encoding='utf-8')
+
+
+def test_refresh_revalidates_with_etags_and_keeps_pages_on_304(tmp_path, stand_in, capsys):
+    pages = ["page-a", "page-b"]
+    for i, key in enumerate(pages):
+        stand_in.route(f"/{key}", page_handler(i))
+    yaml_file = write_booklets(tmp_path, stand_in, pages)
+
+    assert download(tmp_path, yaml_file)
+    html_before = {key: (tmp_path / "html" / f"{key}.html").stat().st_mtime_ns for key in pages}
+    capsys.readouterr()
+
+    assert download(tmp_path, yaml_file, refresh=True)
+
+    output = capsys.readouterr().out
+    assert output.count("[OK] Not modified") == 2
+    assert "2 success (2 unchanged), 0 errors" in output
+    conditional = [headers for _, _, headers in stand_in.requests[len(pages):]]
+    assert sorted(headers.get('If-None-Match') for headers in conditional) == ['"v0"', '"v1"']
+    for key in pages:
+        assert (tmp_path / "html" / f"{key}.html").stat().st_mtime_ns == html_before[key]
+
+
+def test_a_failing_page_is_reported_under_its_title_without_stopping_others(tmp_path, stand_in, capsys):
+    pages = ["page-a", "missing", "page-c"]
+    stand_in.route("/page-a", page_handler(0))
+    stand_in.route("/page-c", page_handler(2))
+
+    assert not download(tmp_path, write_booklets(tmp_path, stand_in, pages))
+
+    lines = capsys.readouterr().out.splitlines()
+    missing = lines.index("Downloading: Title missing")
+    assert lines[missing + 3].startswith("  ✗ Error downloading")
+    assert "404" in lines[missing + 3]
+    assert "2 success (0 unchanged), 1 errors" in lines[-1]
+    assert (tmp_path / "html" / "page-a.html").exists()
+    assert (tmp_path / "html" / "page-c.html").exists()
+    assert not (tmp_path / "html" / "missing.html").exists()
+
+
+def test_manifest_hashes_match_the_saved_files(tmp_path, stand_in):
+    # Line breaks and non-ASCII text, whose saved bytes differ from the text on some platforms if written as text
+    body = "<html><body><h1>Café</h1>\n<p>Line one\nline two</p>\n</body></html>".encode('utf-8')
+    stand_in.route("/page-a", lambda headers: (200, {'Content-Type': 'text/html; charset=utf-8'}, body))
+    yaml_file = write_booklets(tmp_path, stand_in, ["page-a"])
+
+    with HttpClient(rate=RATE, retries=0) as client:
+        assert ffiec.download_html_files(yaml_file, tmp_path / "html", client, manifest_file=tmp_path / "manifest.json",
+                                         md_output_dir=tmp_path / "markdown")
+
+    entry = ffiec.read_manifest(tmp_path / "manifest.json")["page-a"]
+    assert entry['html_sha256'] == ffiec.sha256_file(tmp_path / "html" / "page-a.html")
+    assert entry['md_sha256'] == ffiec.sha256_file(tmp_path / "markdown" / "page-a.md")
@@ -0,0 +1,74 @@
+"""
+Tests for the in-process converter in html_to_markdown.py.
+
+Each fixtures/html_to_markdown/<case>.html has a golden <case>.md holding pandoc's
+output for it, as dl_ffiec-itbooklets.py runs pandoc (pandoc 3.9 generated the
+goldens). The converter must reproduce them exactly. When pandoc is installed
+the goldens are also checked against it.
+"""
+
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from conftest import load_script
+from html_to_markdown import html_to_markdown
+
+ffiec = load_script('dl_ffiec-itbooklets.py')
+
+GOLDEN_DIR = Path(__file__).parent / "fixtures" / "html_to_markdown"
+CASES = sorted(path.stem for path in GOLDEN_DIR.glob("*.html"))
+
+
+def golden(case):
+    """Return a case's HTML input and pandoc's Markdown output for it."""
+    return tuple((GOLDEN_DIR / f"{case}{suffix}").read_text(encoding='utf-8') for suffix in (".html", ".md"))
+
+
+@pytest.mark.parametrize("case", CASES)
+def test_output_matches_pandoc_golden(case):
+    html, expected = golden(case)
+
+    assert html_to_markdown(html) == expected
+
+
+@pytest.mark.skipif(shutil.which('pandoc') is None, reason="pandoc is not installed")
+@pytest.mark.parametrize("case", CASES)
+def test_golden_matches_installed_pandoc(case):
+    html, expected = golden(case)
+
+    result = subprocess.run(['pandoc'] + ffiec.PANDOC_ARGS, input=html, capture_output=True, text=True, check=True)
+
+    assert result.stdout == expected
+
+
+@pytest.mark.parametrize("html, expected", [
+    ("<p># not heading</p>", "\\# not heading\n"),
+    ("<p>1. Not a list<br>- also not</p>", "1\\. Not a list\\\n\\- also not\n"),
+    # Markers that can interrupt a paragraph after a hard break; pandoc leaves these unescaped
+    ("<p>a<br>1. one<br>+ plus<br>2. two</p>", "a\\\n1\\. one\\\n\\+ plus\\\n2. two\n"),
+    # A thematic break, a setext underline and a code fence; pandoc leaves the first two as they are
+    ("<p>---</p>", "\\---\n"),
+    ("<p>Title<br>--</p>", "Title\\\n\\--\n"),
+    ("<p>~~~ tilde</p>", "\\~~~ tilde\n"),
+])
+def test_line_start_markers_never_start_a_block(html, expected):
+    assert html_to_markdown(html) == expected
+
+
+def test_python_converter_reports_a_failed_page_and_converts_the_rest(tmp_path):
+    html_dir, md_dir = tmp_path / "html", tmp_path / "markdown"
+    html_dir.mkdir()
+    (html_dir / "a-good.html").write_text("<h1>Good</h1><p>Text</p>", encoding='utf-8')
+    (html_dir / "b-bad.html").write_bytes(b"<h1>Bad</h1><p>\xff\xfe not UTF-8</p>")
+    (html_dir / "c-good.html").write_text("<p>More text</p>", encoding='utf-8')
+
+    assert not ffiec.convert_to_markdown(html_dir, md_dir, manifest_file=tmp_path / "manifest.json",
+                                         converter='python')
+
+    assert sorted(path.name for path in md_dir.iterdir()) == ["a-good.md", "c-good.md"]
+    assert (md_dir / "a-good.md").read_text(encoding='utf-8') == "# Good\n\nText\n"
+    manifest = ffiec.read_manifest(tmp_path / "manifest.json")
+    assert sorted(manifest) == ["a-good", "c-good"]
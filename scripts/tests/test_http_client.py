@@ -0,0 +1,64 @@
+"""
+Tests for the retry, rate limiting and accounting behaviour of http_client.HttpClient.
+"""
+
+import socket
+
+import pytest
+import requests
+
+from http_client import HttpClient
+
+RATE = 10.0
+
+
+def test_retries_are_rate_limited_and_counted(stand_in):
+    stand_in.route("/failing", lambda headers: (503, {}, b"unavailable"))
+
+    with HttpClient(rate=RATE, retries=3, backoff_factor=0) as client:
+        response = client.get(f"{stand_in.url}/failing")
+
+    assert response.status_code == 503
+    arrivals = [arrival for arrival, _, _ in stand_in.requests]
+    assert len(arrivals) == 4
+    assert min(later - earlier for earlier, later in zip(arrivals, arrivals[1:])) >= 0.8 / RATE
+
+    stats = next(iter(client.stats.hosts.values()))
+    assert (stats.requests, stats.errors, stats.retries) == (4, 4, 3)
+
+
+def test_retry_stops_at_the_first_success(stand_in):
+    statuses = iter([503, 429, 200])
+    stand_in.route("/flaky", lambda headers: (next(statuses), {'Retry-After': '0'}, b"body"))
+
+    with HttpClient(retries=5, backoff_factor=0) as client:
+        response = client.get(f"{stand_in.url}/flaky")
+
+    assert response.status_code == 200 and response.text == "body"
+    assert stand_in.paths() == ["/flaky"] * 3
+    assert client.stats.requests == 3
+
+
+def test_post_is_not_retried_after_reaching_the_server(stand_in):
+    stand_in.route("/failing", lambda headers: (503, {}, b""))
+
+    with HttpClient(retries=3, backoff_factor=0) as client:
+        # The stand-in only answers GET, so POST gets its 501 response once
+        response = client.post(f"{stand_in.url}/failing")
+
+    assert response.status_code == 501
+    assert client.stats.requests == 1
+
+
+def test_connection_failures_are_retried_and_counted():
+    # A port nothing listens on
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+
+    with HttpClient(retries=2, backoff_factor=0) as client:
+        with pytest.raises(requests.ConnectionError):
+            client.post(f"http://127.0.0.1:{port}/")
+
+    stats = next(iter(client.stats.hosts.values()))
+    assert (stats.requests, stats.errors, stats.retries) == (3, 3, 2)
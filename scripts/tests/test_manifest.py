@@ -0,0 +1,40 @@
+"""
+Tests for the shared download manifest helper in manifest.py.
+"""
+
+import pytest
+
+from manifest import read_manifest, write_manifest
+
+
+def test_write_then_read_round_trip(tmp_path):
+    manifest_file = tmp_path / "nested" / "manifest.json"
+
+    write_manifest(manifest_file, {'b': {'etag': '"v1"'}, 'a': None})
+
+    assert read_manifest(manifest_file) == {'a': None, 'b': {'etag': '"v1"'}}
+    assert manifest_file.read_text(encoding='utf-8').endswith("}\n")
+    assert list(manifest_file.parent.iterdir()) == [manifest_file]
+
+
+@pytest.mark.parametrize("content", ["", "{truncated", "[]", "null", '"text"', "42"])
+def test_unusable_manifest_reads_as_empty(tmp_path, content):
+    manifest_file = tmp_path / "manifest.json"
+    manifest_file.write_text(content, encoding='utf-8')
+
+    assert read_manifest(manifest_file) == {}
+
+
+def test_missing_manifest_reads_as_empty(tmp_path):
+    assert read_manifest(tmp_path / "manifest.json") == {}
+
+
+def test_failed_write_keeps_the_previous_manifest(tmp_path):
+    manifest_file = tmp_path / "manifest.json"
+    write_manifest(manifest_file, {'key': 'old'})
+
+    with pytest.raises(TypeError):
+        write_manifest(manifest_file, {'key': object()})
+
+    assert read_manifest(manifest_file) == {'key': 'old'}
+    assert list(tmp_path.iterdir()) == [manifest_file]
@@ -0,0 +1,116 @@
+"""
+Tests for the conditional and resumable PDF download of dl_nist-pdfs.py, run
+against a local HTTP stand-in for nvlpubs.nist.gov.
+"""
+
+import json
+
+import pytest
+
+from conftest import load_script
+
+nist = load_script('dl_nist-pdfs.py')
+
+PDF = b"%PDF-1.7\n" + bytes(range(256)) * 40 + b"\n%%EOF\n"
+ETAG = '"sp-800-53r5"'
+
+
+@pytest.fixture
+def config(stand_in, tmp_path, monkeypatch):
+    """A config downloading from the stand-in into a temporary tree."""
+    monkeypatch.setattr(nist, 'SCRIPT_DIR', tmp_path / "scripts")
+    config = nist.Config.for_sp_800_53r5()
+    config.pdf_base_url = stand_in.url
+    return config
+
+
+def serve_pdf(stand_in, config, honour_range=True, content_range_start=None):
+    """Serve PDF with an ETag, answering If-None-Match with 304 and If-Range'd ranges with 206."""
+    def handler(headers):
+        if headers.get('If-None-Match') == ETAG:
+            return 304, {'ETag': ETAG}, b""
+        ranged = headers.get('Range', '').startswith('bytes=') and headers.get('If-Range') == ETAG
+        if ranged and honour_range:
+            start = int(headers['Range'][len('bytes='):].rstrip('-'))
+            served_from = start if content_range_start is None else content_range_start
+            content_range = f"bytes {served_from}-{len(PDF) - 1}/{len(PDF)}"
+            return 206, {'ETag': ETAG, 'Content-Range': content_range}, PDF[served_from:]
+        return 200, {'ETag': ETAG}, PDF
+    stand_in.route(f"/SpecialPublications/{config.pdf_filename}", handler)
+
+
+def paths(config):
+    pdf_path = config.output_dir / config.pdf_filename
+    return pdf_path, pdf_path.with_name(f"{pdf_path.name}.part")
+
+
+def interrupted_download(config, received=1000, partial=None):
+    """Leave a .part file and manifest as a download cut off after `received` bytes would."""
+    pdf_path, part_path = paths(config)
+    config.output_dir.mkdir(parents=True)
+    part_path.write_bytes(PDF[:received])
+    if partial is None:
+        partial = {'url': config.pdf_url, 'etag': ETAG, 'last_modified': None}
+    config.download_manifest_path.write_text(json.dumps({'partial': partial}), encoding='utf-8')
+
+
+def download(stand_in, config):
+    stand_in.requests.clear()
+    pdf_path = nist.PDFProcessor(config).download_pdf()
+    assert pdf_path.read_bytes() == PDF
+    assert not paths(config)[1].exists()
+    manifest = json.loads(config.download_manifest_path.read_text(encoding='utf-8'))
+    assert manifest == {'pdf': {'url': config.pdf_url, 'etag': ETAG, 'last_modified': None}}
+    return [headers for _, _, headers in stand_in.requests]
+
+
+def test_refresh_of_an_unchanged_pdf_is_not_modified(stand_in, config):
+    serve_pdf(stand_in, config)
+    download(stand_in, config)
+    config.refresh = True
+
+    [request] = download(stand_in, config)
+
+    assert request['If-None-Match'] == ETAG
+
+
+def test_interrupted_download_resumes_with_a_range_request(stand_in, config):
+    serve_pdf(stand_in, config)
+    interrupted_download(config)
+
+    [request] = download(stand_in, config)
+
+    assert request['Range'] == "bytes=1000-"
+    assert request['If-Range'] == ETAG
+    assert request['Accept-Encoding'] == "identity"
+
+
+def test_full_response_to_a_range_request_replaces_the_partial_file(stand_in, config):
+    serve_pdf(stand_in, config, honour_range=False)
+    interrupted_download(config)
+
+    [request] = download(stand_in, config)
+
+    assert request['Range'] == "bytes=1000-"
+
+
+def test_range_starting_elsewhere_restarts_the_download(stand_in, config):
+    serve_pdf(stand_in, config, content_range_start=500)
+    interrupted_download(config)
+
+    first, restart = download(stand_in, config)
+
+    assert first['Range'] == "bytes=1000-"
+    assert 'Range' not in restart
+
+
+@pytest.mark.parametrize("partial", ["stale", {'url': "x", 'etag': 42, 'last_modified': ["Mon"]}])
+def test_part_file_without_usable_validators_is_downloaded_again(stand_in, config, partial):
+    serve_pdf(stand_in, config)
+    # Bytes that do not belong to the PDF, left by some earlier download
+    interrupted_download(config, partial=partial)
+    paths(config)[1].write_bytes(b"stale bytes")
+
+    [request] = download(stand_in, config)
+
+    assert 'Range' not in request
@@ -0,0 +1,146 @@
+"""
+Tests for the tarball download of dl_owasp.py, run against a local HTTP stand-in
+for the GitHub API serving the committed fixture fixtures/owasp-ml-project.tar.gz.
+
+The fixture holds a "<repo>-<sha>/" tree with two ML risk pages directly in docs/,
+plus files the filter must skip: a README, a non-markdown file, a page in a
+subdirectory of docs/ and a page outside docs/.
+"""
+
+import io
+import json
+import tarfile
+from pathlib import Path
+
+import pytest
+import yaml
+
+from conftest import load_script
+from http_client import HttpClient
+
+owasp = load_script('dl_owasp.py')
+
+ARCHIVE = (Path(__file__).parent / "fixtures" / "owasp-ml-project.tar.gz").read_bytes()
+CONFIG = owasp.OWASP_PROJECTS['ml']
+REPO_PATH = f"/repos/OWASP/{CONFIG['repo']}"
+COMMIT = "abc1234" * 5 + "00000"
+# Blob SHAs of the fixture's pages, as `git hash-object` reports them
+BLOB_SHAS = {
+    "ML01_2023-Input_Manipulation_Attack.md": "60149bfe589bb295bdfac7042a0de6b0d79356da",
+    "ML02_2023-Data_Poisoning_Attack.md": "83fd8d6fa8b7006407ab4d135e879d6b50685f1c",
+}
+
+
+def serve_project(stand_in, blob_shas=BLOB_SHAS, commit=COMMIT, archive=ARCHIVE):
+    """Serve the head commit, the docs/ listing with the given blob SHAs and the tarball."""
+    listing = [{"name": name, "type": "file", "sha": sha} for name, sha in blob_shas.items()]
+    listing.append({"name": "README.md", "type": "file", "sha": "0" * 40})
+    listing.append({"name": "archive", "type": "dir", "sha": "1" * 40})
+    stand_in.route(f"{REPO_PATH}/commits/{CONFIG['branch']}", lambda headers: (200, {}, commit.encode()))
+    stand_in.route(f"{REPO_PATH}/contents/{CONFIG['subdir']}", lambda headers: (200, {}, json.dumps(listing).encode()))
+    stand_in.route(f"{REPO_PATH}/tarball/{commit}", lambda headers: (200, {}, archive))
+
+
+def rewrite_archive(replacements):
+    """Return the fixture tarball with the named pages' contents replaced."""
+    output = io.BytesIO()
+    with tarfile.open(fileobj=io.BytesIO(ARCHIVE), mode='r:gz') as source, \
+            tarfile.open(fileobj=output, mode='w:gz') as target:
+        for member in source.getmembers():
+            data = source.extractfile(member).read() if member.isfile() else None
+            name = member.name.rsplit('/', 1)[-1]
+            if name in replacements:
+                data = replacements[name]
+                member.size = len(data)
+            target.addfile(member, io.BytesIO(data) if data is not None else None)
+    return output.getvalue()
+
+
+def test_archive_keeps_only_matching_files_directly_in_subdir(stand_in):
+    serve_project(stand_in)
+
+    with HttpClient() as client:
+        files = owasp.fetch_project_archive(CONFIG, client, stand_in.url, COMMIT)
+
+    assert sorted(files) == sorted(BLOB_SHAS)
+    assert {name: owasp.git_blob_sha(data) for name, data in files.items()} == BLOB_SHAS
+    assert files["ML02_2023-Data_Poisoning_Attack.md"].startswith(b"---\ntitle: ML02:2023 Data Poisoning Attack\n")
+
+
+@pytest.mark.parametrize("limit", [
+    {'max_bytes': 200},
+    {'max_unpacked_bytes': 100},
+    {'max_members': 3},
+])
+def test_archive_over_a_limit_is_rejected(stand_in, limit):
+    serve_project(stand_in)
+
+    with HttpClient() as client, pytest.raises(ValueError):
+        owasp.fetch_project_archive(CONFIG, client, stand_in.url, COMMIT, **limit)
+
+
+def test_limited_reader_stops_past_the_limit():
+    reader = owasp.LimitedReader(io.BytesIO(ARCHIVE), len(ARCHIVE) - 1)
+
+    assert reader.read(100) == ARCHIVE[:100]
+    with pytest.raises(ValueError):
+        reader.read()
+    assert reader.bytes_read == len(ARCHIVE)
+
+
+@pytest.fixture
+def project_dirs(tmp_path, monkeypatch):
+    """Point the script's output paths into a temporary tree."""
+    monkeypatch.setattr(owasp, 'SCRIPT_DIR', tmp_path / "scripts")
+    return owasp.get_paths('ml', CONFIG)
+
+
+def test_download_writes_pages_matching_their_blob_shas(stand_in, project_dirs):
+    serve_project(stand_in)
+
+    with HttpClient() as client:
+        downloaded = owasp.download_project_files('ml', CONFIG, client, stand_in.url)
+
+    assert downloaded == sorted(BLOB_SHAS)
+    for name, sha in BLOB_SHAS.items():
+        assert owasp.git_blob_sha((project_dirs['output_dir'] / name).read_bytes()) == sha
+    manifest = json.loads(project_dirs['manifest_file'].read_text(encoding='utf-8'))
+    assert manifest == {'branch': CONFIG['branch'], 'commit': COMMIT, 'files': BLOB_SHAS}
+    data = yaml.safe_load(project_dirs['data_file'].read_text(encoding='utf-8'))
+    assert data['ml01-2023']['title'] == "ML01:2023 Input Manipulation Attack"
+
+    # An unchanged head commit is the only request of a refresh
+    stand_in.requests.clear()
+    with HttpClient() as client:
+        assert owasp.download_project_files('ml', CONFIG, client, stand_in.url) == sorted(BLOB_SHAS)
+    assert stand_in.paths() == [f"{REPO_PATH}/commits/{CONFIG['branch']}"]
+
+
+def test_download_rejects_a_page_not_matching_its_blob_sha(stand_in, project_dirs):
+    blob_shas = dict(BLOB_SHAS, **{"ML02_2023-Data_Poisoning_Attack.md": "f" * 40})
+    serve_project(stand_in, blob_shas)
+
+    with HttpClient() as client:
+        assert owasp.download_project_files('ml', CONFIG, client, stand_in.url) == []
+
+    assert not project_dirs['manifest_file'].exists()
+    assert not (project_dirs['output_dir'] / "ML02_2023-Data_Poisoning_Attack.md").exists()
+
+
+def test_download_writes_nothing_when_any_page_is_tampered_with(stand_in, project_dirs):
+    serve_project(stand_in)
+    with HttpClient() as client:
+        owasp.download_project_files('ml', CONFIG, client, stand_in.url)
+    output_dir = project_dirs['output_dir']
+    before = {path.name: path.read_bytes() for path in output_dir.iterdir()}
+
+    # Upstream updates both pages, but the tarball's copy of the second is not what the listing says
+    updated = {name: b"# Updated\n" for name in BLOB_SHAS}
+    blob_shas = {name: owasp.git_blob_sha(data) for name, data in updated.items()}
+    archive = rewrite_archive(dict(updated, **{"ML02_2023-Data_Poisoning_Attack.md": b"# Tampered\n"}))
+    serve_project(stand_in, blob_shas, commit="def5678" * 5 + "00000", archive=archive)
+
+    with HttpClient() as client:
+        assert owasp.download_project_files('ml', CONFIG, client, stand_in.url) == []
+
+    assert {path.name: path.read_bytes() for path in output_dir.iterdir()} == before